@@ -0,0 +1,215 @@
+import pandas as pd
+import os
+import parameters
+
+# columnar output formats require pyarrow, which is only needed if results are not written as csv
+try:
+    import pyarrow as pa
+    import pyarrow.dataset as ds
+    import pyarrow.fs
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = None
+
+
+# define compact column types of results in columnar formats, columns not listed keep their type
+columnarTypes = {'simulation': 'int32', 'season': 'int32', 'validSimulation': 'bool', 'validSeason': 'bool',
+                 'team': pd.CategoricalDtype(parameters.teams),  # fixed categories, so every chunk has the same dictionary
+                 'domestics': 'int32', 'imports': 'int32', 'wins': 'int32', 'games': 'int32', 'rank': 'int32',
+                 'salaryCap': 'int64',  # False without salary cap is stored as 0
+                 'eliminatedRS': 'bool', 'eliminatedPP': 'bool', 'eliminatedPR1': 'bool', 'eliminatedPR2': 'bool',
+                 'eliminatedPR3': 'bool', 'champion': 'bool', 'wentBankrupt': 'bool', 'count': 'int32'}
+
+# define file extensions of columnar formats
+columnarExtensions = {'parquet': 'parquet', 'feather': 'feather'}
+
+
+# define sink writing results to a csv file as class
+class CsvSink(object):
+    def __init__(self, fileName):
+        """
+        Description:
+        Initializes a sink which appends results to a csv file, the header is written with the first results
+
+        Input:
+        fileName (str): Path of the csv file, the directory is created if necessary
+
+        A csv sink object has the following attributes:
+        self.fileName (str): path of the csv file
+        self.headerWritten (bool): indicator if the header was already written, initialised with False
+        """
+        self.fileName = fileName
+        self.headerWritten = False
+
+    def write(self, results):
+        """
+        Description:
+        Append results to the csv file, an existing file is replaced by the first results
+
+        Input:
+        results (data frame): Results with the same columns as all other results of the sink
+        """
+        # create directory of file with first results
+        if not self.headerWritten and os.path.dirname(self.fileName):
+            os.makedirs(os.path.dirname(self.fileName), exist_ok=True)
+
+        # append results to file
+        results.to_csv(self.fileName, mode='a' if self.headerWritten else 'w', header=not self.headerWritten, index=False)
+        self.headerWritten = True
+
+    def close(self):
+        """
+        Description:
+        Finish the csv file, nothing is to be done as every write is complete
+        """
+        pass
+
+
+# define sink writing results to a partition of a columnar dataset as class
+class ColumnarSink(object):
+    def __init__(self, directory, partition, resultFormat="parquet"):
+        """
+        Description:
+        Initializes a sink which writes results chunk-wise to one file of a hive partitioned dataset, as row groups of
+        a parquet file or record batches of an uncompressed feather (Arrow IPC) file which can be memory mapped
+
+        Input:
+        directory (str): Path of the dataset directory
+        partition (dict): Partition keys with their values in order of the directory levels, e.g. the scenario parameters
+        resultFormat (str): Format of the file, 'parquet' or 'feather', default is 'parquet'
+
+        A columnar sink object has the following attributes:
+        self.fileName (str): path of the file of the partition
+        self.resultFormat (str): format of the file, 'parquet' or 'feather'
+        self.writer (ParquetWriter, RecordBatchFileWriter): writer of the file, None until the first results are written
+        """
+        # columnar formats require pyarrow
+        if pa is None:
+            raise ImportError("Result format '{}' requires pyarrow, install it or use result format 'csv'".format(resultFormat))
+
+        self.fileName = os.path.join(directory, *["{}={}".format(key, value) for key, value in partition.items()],
+                                     "part-0.{}".format(columnarExtensions[resultFormat]))
+        self.resultFormat = resultFormat
+        self.writer = None
+
+    def write(self, results):
+        """
+        Description:
+        Write results with compact column types as next chunk of the file, an existing file is replaced by the first results
+
+        Input:
+        results (data frame): Results with the same columns as all other results of the sink
+        """
+        # convert results to table with compact column types
+        table = pa.Table.from_pandas(results.astype({column: columnType for column, columnType in columnarTypes.items() if column in results}),
+                                     preserve_index=False)
+
+        # open file with first results
+        if self.writer is None:
+            os.makedirs(os.path.dirname(self.fileName), exist_ok=True)
+            if self.resultFormat == "parquet":
+                self.writer = pq.ParquetWriter(self.fileName, table.schema)
+            else:
+                self.writer = pa.ipc.new_file(self.fileName, table.schema)
+
+        # append chunk to file
+        self.writer.write_table(table)
+
+    def close(self):
+        """
+        Description:
+        Finish the file, the file is only complete once the sink is closed
+        """
+        if self.writer is not None:
+            self.writer.close()
+
+
+def read_columnar_results(directory, resultFormat="parquet"):
+    """
+    Description:
+    Function to load all partitions of a columnar result dataset, files are memory mapped. The partition keys are
+    added as columns
+
+    Input:
+    directory (str): Path of the dataset directory
+    resultFormat (str): Format of the dataset, 'parquet' or 'feather', default is 'parquet'
+
+    Returns:
+    results (data frame): Data frame containing the results of all partitions
+    """
+    # columnar formats require pyarrow
+    if pa is None:
+        raise ImportError("Result format '{}' requires pyarrow, install it or use result format 'csv'".format(resultFormat))
+
+    dataset = ds.dataset(directory, format=resultFormat, partitioning="hive", filesystem=pyarrow.fs.LocalFileSystem(use_mmap=True))
+    return dataset.to_table().to_pandas()
+
+
+# define accumulator of result data frames as class
+class ResultAccumulator(object):
+    def __init__(self, sink=None, flushRows=100000):
+        """
+        Description:
+        Initializes an accumulator which collects result data frames in a list and combines them only once, so that
+        the cost of accumulation grows linearly with the number of results. If a sink is given, collected results are
+        passed on to the sink whenever enough rows are collected instead of being kept in memory
+
+        Input:
+        sink (CsvSink, ColumnarSink): Sink the results are streamed to, default is None in which case results are kept in memory
+        flushRows (int): Number of collected rows after which results are passed to the sink, default is 100000
+
+        An accumulator object has the following attributes:
+        self.chunks (list): collected data frames not yet combined or passed to the sink, initialised empty
+        self.rows (int): number of rows of the collected data frames
+        self.sink (CsvSink, ColumnarSink): sink the results are streamed to, None if results are kept in memory
+        self.flushRows (int): number of collected rows after which results are passed to the sink
+        """
+        self.chunks = []
+        self.rows = 0
+        self.sink = sink
+        self.flushRows = flushRows
+
+    def append(self, results):
+        """
+        Description:
+        Add results to the accumulator
+
+        Input:
+        results (data frame): Results with the same columns as all other results of the accumulator
+        """
+        self.chunks.append(results)
+        self.rows += len(results)
+
+        # pass results to sink if enough rows are collected
+        if self.sink is not None and self.rows >= self.flushRows:
+            self.flush()
+
+    def flush(self):
+        """
+        Description:
+        Pass collected results to the sink in one piece
+        """
+        if self.chunks:
+            self.sink.write(pd.concat(self.chunks, ignore_index=True))
+            self.chunks = []
+            self.rows = 0
+
+    def get_results(self):
+        """
+        Description:
+        Combine all collected results into one data frame, or pass remaining results to the sink and close it
+
+        Returns:
+        results (data frame): Data frame containing all results in the order they were added, None if results were
+        streamed to a sink
+        """
+        # finish sink
+        if self.sink is not None:
+            self.flush()
+            self.sink.close()
+            return None
+
+        # combine results once
+        if not self.chunks:
+            return pd.DataFrame()
+        return pd.concat(self.chunks, ignore_index=True)
@@ -0,0 +1,49 @@
+import argparse
+import sys
+import benchmarkCases
+import monitoring
+
+# benchmark parameters
+baselineFile = "results/benchmarkBaseline.json"  # JSON file of the baseline, timings are only comparable on the machine and versions they were recorded with
+seed = 20230601  # seed of the inputs of all cases, every run times the same work
+allowedImports = 10  # the number of allowed import players per team in the cases on a league, references 'rho' in thesis
+salaryCap = True  # boolean indicator if the cases on a league have a salary cap, references 'R_cap' in thesis
+solver = "exact"  # the solver used by teams in the cases on a league, 'exact' = in-process exact engine, 'cbc' = PuLP with CBC
+skillSolvers = ["exact", "cbc"]  # the solvers whose skill maximization is timed, "exact" = in-process exact engine, "cbc" = PuLP with CBC, the solver of the baseline
+domesticSeasons = [1, 10, 30]  # the seasons whose domestic player pools are maximized, later seasons have larger pools
+allowedImportsGrid = [4, 6, 10]  # the numbers of allowed imports whose foreign player pools are maximized
+repeats = 20  # the number of timed repetitions of every case
+seasonRepeats = 3  # the number of timed repetitions of the cases simulating whole seasons
+tolerance = 0.2  # relative change of the median time of a case which is tolerated as noise
+caseFilter = None  # only cases whose name contains the filter are run, e.g. 'skill_maximization', None = all cases
+
+# run role given on the command line only when executed as script
+if __name__ == "__main__":
+
+    # configure output
+    monitoring.configure_logging("quiet")
+
+    # read role of this run
+    parser = argparse.ArgumentParser(description="Time the hot paths of the simulation with fixed inputs")
+    parser.add_argument("role", choices=["record", "compare"],
+                        help="record = save timings as baseline, compare = compare timings to baseline and exit with status 1 on regressions")
+    role = parser.parse_args().role
+
+    # load baseline before timing, so that a missing baseline is reported at once
+    if role == "compare":
+        baseline = benchmarkCases.load_baseline(baselineFile)
+
+    # time all cases
+    cases = benchmarkCases.get_cases(allowedImports, salaryCap, solver, skillSolvers, domesticSeasons, allowedImportsGrid, repeats, seasonRepeats)
+    benchmark = benchmarkCases.run_benchmarks(cases, seed, caseFilter)
+
+    # save timings as baseline
+    if role == "record":
+        benchmarkCases.save_baseline(benchmark, baselineFile)
+
+    # compare timings to baseline
+    else:
+        comparison = benchmarkCases.compare_benchmarks(benchmark, baseline, tolerance)
+        benchmarkCases.log_comparison(comparison)
+        if (comparison['status'] == "regression").any():
+            sys.exit(1)
@@ -0,0 +1,557 @@
+import numpy as np
+import pandas as pd
+import functools
+import gc
+import hashlib
+import json
+import os
+import platform
+import sys
+import time
+import classes
+import functions
+import monitoring
+import parameters
+import simulationModules
+import solvers
+
+
+def get_check(value):
+    """
+    Description:
+    Function to get a short digest of the result of a benchmark case, so that a comparison also reveals changed results
+
+    Input:
+    value (object): result of the case, a data frame, array or any object with a reproducible representation
+
+    Returns:
+    check (str): digest of the result
+    """
+    # digest data frames and arrays by their content
+    if isinstance(value, pd.DataFrame):
+        value = pd.util.hash_pandas_object(value, index=False).to_numpy()
+    if isinstance(value, np.ndarray):
+        return hashlib.sha1(np.ascontiguousarray(value).tobytes()).hexdigest()[:12]
+
+    return hashlib.sha1(repr(value).encode()).hexdigest()[:12]
+
+
+def prepare_league(rng, allowedImports, salaryCap, season, solver, stage):
+    """
+    Description:
+    Function to create a league and its player pools and to play the season up to a stage, the inputs of the cases
+
+    Input:
+    rng (np.random.Generator): random number generator of the league
+    allowedImports (int): the number of allowed import players per team
+    salaryCap (bool): boolean parameter indicating presence of salary cap
+    season (int): the season of the player pools, determines the size of the domestic player pool
+    solver (str): the solver used by teams for skill maximization, 'cbc' or 'exact'
+    stage (str): the last stage played, 'pools', 'domesticSelection', 'conflictResolution', 'importSelection' or
+    'regularSeason'
+
+    Returns:
+    league (League): the league after the stage
+    domesticPlayerPool (DomesticPlayerPool): the domestic player pool after the stage
+    foreignPlayerPool (ForeignPlayerPool): the foreign player pool after the stage
+    """
+    stages = ['pools', 'domesticSelection', 'conflictResolution', 'importSelection', 'regularSeason']
+
+    # initialise league and player pools
+    league = classes.League(rng)
+    maximalBudget = functions.calculate_maximal_budget(league, salaryCap)
+    domesticPlayerPool = classes.DomesticPlayerPool(season, maximalBudget, allowedImports, league.rng)
+    foreignPlayerPool = classes.ForeignPlayerPool(season, maximalBudget, allowedImports)
+
+    # select domestic players
+    if stages.index(stage) >= stages.index('domesticSelection'):
+        league.select_optimal_domestic_players(domesticPlayerPool, solver)
+        domesticPlayerPool.update_player_pool_after_maximization(league.optimalDomesticPlayersSet)
+
+    # resolve conflicting selections
+    if stages.index(stage) >= stages.index('conflictResolution'):
+        league.resolve_player_conflicts(domesticPlayerPool)
+
+    # select import players
+    if stages.index(stage) >= stages.index('importSelection'):
+        league.select_optimal_import_players(foreignPlayerPool, domesticPlayerPool, allowedImports, solver)
+
+    # play regular season
+    if stages.index(stage) >= stages.index('regularSeason'):
+        league.regularSeasonRanking = functions.simulate_regular_season(league)
+        league.update_team_data_post_regular_season()
+
+    return league, domesticPlayerPool, foreignPlayerPool
+
+
+def setup_skill_maximization(rng, pool, season, allowedImports, salaryCap, solver):
+    """
+    Description:
+    Function to prepare the skill maximization of all teams on a domestic or foreign player pool
+
+    Input:
+    rng (np.random.Generator): random number generator of the inputs
+    pool (str): the player pool, 'domestic' or 'foreign'
+    season (int): the season of the player pools, determines the size of the domestic player pool
+    allowedImports (int): the number of allowed import players per team, determines the size of the foreign player pool
+    salaryCap (bool): boolean parameter indicating presence of salary cap
+    solver (str): the solver used for skill maximization, 'cbc' or 'exact'
+
+    Returns:
+    run (function): function running the case, returns the skill sums of all teams
+    """
+    # domestic players are selected with the full budgets of the teams
+    if pool == "domestic":
+        league, playerPool, _ = prepare_league(rng, allowedImports, salaryCap, season, solver, 'pools')
+        budgets = league.get_effective_team_budgets()
+        selectionSize = playerPool.get_domestic_team_size()
+
+    # import players are selected with the budgets remaining after the domestic players
+    else:
+        league, _, playerPool = prepare_league(rng, allowedImports, salaryCap, season, solver, 'conflictResolution')
+        budgets = np.array(league.get_effective_team_budgets()) - np.array(league.get_team_payrolls())
+        selectionSize = allowedImports
+
+    def run():
+        return [round(functions.skill_maximization(playerPool, budget, selectionSize, solver)['skill'].sum(), 2) for budget in budgets]
+
+    return run
+
+
+def setup_resolve_player_conflicts(rng, allowedImports, salaryCap, solver):
+    """
+    Description:
+    Function to prepare the resolution of the conflicting domestic player selections of a season
+
+    Input:
+    rng (np.random.Generator): random number generator of the inputs
+    allowedImports (int): the number of allowed import players per team
+    salaryCap (bool): boolean parameter indicating presence of salary cap
+    solver (str): the solver used by teams for skill maximization, 'cbc' or 'exact'
+
+    Returns:
+    run (function): function running the case, returns the final player selection
+    """
+    league, domesticPlayerPool, _ = prepare_league(rng, allowedImports, salaryCap, 1, solver, 'domesticSelection')
+
+    def run():
+        league.resolve_player_conflicts(domesticPlayerPool)
+        return league.finalPlayerSelection
+
+    return run
+
+
+def setup_teams_choose_replacement(rng, allowedImports, salaryCap, solver):
+    """
+    Description:
+    Function to prepare the replacement decisions of all teams which lose a conflicting player, in the state after all
+    players without conflict are assigned
+
+    Input:
+    rng (np.random.Generator): random number generator of the inputs
+    allowedImports (int): the number of allowed import players per team
+    salaryCap (bool): boolean parameter indicating presence of salary cap
+    solver (str): the solver used by teams for skill maximization, 'cbc' or 'exact'
+
+    Returns:
+    run (function): function running the case, returns the replacement players
+    """
+    league, domesticPlayerPool, _ = prepare_league(rng, allowedImports, salaryCap, 1, solver, 'domesticSelection')
+
+    # assign players without conflict
+    conflicts, noConflicts = functions.identify_conflicts(league)
+    league.finalPlayerSelection = {team: [] for team in league.get_teams()}
+    for player, interestedTeams in noConflicts.items():
+        functions.assign_player(league, player, interestedTeams[0])
+    functions.update_team_info(league, domesticPlayerPool.allPlayersData)
+
+    def run():
+        return [functions.teams_choose_replacement(player, team, domesticPlayerPool, league)
+                for player, interestedTeams in conflicts.items() for team in interestedTeams[1:]]
+
+    return run
+
+
+def setup_simulate_regular_season(rng, allowedImports, salaryCap, solver):
+    """
+    Description:
+    Function to prepare the regular season of a league with fully stacked teams
+
+    Input:
+    rng (np.random.Generator): random number generator of the inputs
+    allowedImports (int): the number of allowed import players per team
+    salaryCap (bool): boolean parameter indicating presence of salary cap
+    solver (str): the solver used by teams for skill maximization, 'cbc' or 'exact'
+
+    Returns:
+    run (function): function running the case, returns the regular season ranking
+    """
+    league, _, _ = prepare_league(rng, allowedImports, salaryCap, 1, solver, 'importSelection')
+
+    def run():
+        return functions.simulate_regular_season(league)
+
+    return run
+
+
+def setup_solve_ranking_conflicts(rng, ties, allowedImports, salaryCap, solver):
+    """
+    Description:
+    Function to prepare a regular season ranking with forced ties
+
+    Input:
+    rng (np.random.Generator): random number generator of the inputs
+    ties (str): the forced ties, 'all' = all teams have the same wins, direct wins and skill so that placement games
+    decide, 'pairs' = pairs of teams have the same wins and are ranked by their direct wins
+    allowedImports (int): the number of allowed import players per team
+    salaryCap (bool): boolean parameter indicating presence of salary cap
+    solver (str): the solver used by teams for skill maximization, 'cbc' or 'exact'
+
+    Returns:
+    run (function): function running the case, returns the resolved ranking
+    """
+    league, _, _ = prepare_league(rng, allowedImports, salaryCap, 1, solver, 'regularSeason')
+    gamesPerPairing = league.headToHead[0, 1] + league.headToHead[1, 0]
+
+    # force ties of all teams in wins, direct wins and skill
+    if ties == "all":
+        headToHead = np.full((parameters.leagueSize, parameters.leagueSize), gamesPerPairing // 2)
+        np.fill_diagonal(headToHead, 0)
+        wins = headToHead.sum(axis=1)
+        league.totalSkill[:] = league.totalSkill.mean()
+
+    # force ties of pairs of teams in wins which are decided by direct wins
+    else:
+        # teams of a pair win all games against teams of lower pairs
+        pairs = np.arange(parameters.leagueSize) // 2
+        headToHead = np.where(pairs[:, None] < pairs[None, :], gamesPerPairing, 0)
+
+        # second team of a pair wins the direct games
+        for firstTeam in range(0, parameters.leagueSize - 1, 2):
+            headToHead[firstTeam, firstTeam + 1] = gamesPerPairing // 2 - 1
+            headToHead[firstTeam + 1, firstTeam] = gamesPerPairing // 2 + 1
+
+            # balance wins of the pair with one game against each team of a neighbouring pair, whose wins stay equal
+            if firstTeam + 3 < parameters.leagueSize:
+                headToHead[firstTeam + 1, [firstTeam + 2, firstTeam + 3]] -= 1
+                headToHead[[firstTeam + 2, firstTeam + 3], firstTeam + 1] += 1
+            else:
+                headToHead[[firstTeam - 2, firstTeam - 1], firstTeam] -= 1
+                headToHead[firstTeam, [firstTeam - 2, firstTeam - 1]] += 1
+        wins = headToHead.sum(axis=1)
+
+    # create ranking as in a regular season
+    teams = np.array(league.get_teams())
+    ranking = pd.DataFrame({'rank': [0] * len(teams), 'team': teams, 'skill': league.totalSkill,
+                            'wins': wins, 'games': [gamesPerPairing * (len(teams) - 1)] * len(teams)})
+    ranking['winningPercentage'] = ranking['wins'] / ranking['games']
+
+    def run():
+        return functions.solve_ranking_conflicts(ranking, headToHead, league)
+
+    return run
+
+
+def setup_simulate_playoffs(rng, allowedImports, salaryCap, solver):
+    """
+    Description:
+    Function to prepare the playoffs of a league after its regular season
+
+    Input:
+    rng (np.random.Generator): random number generator of the inputs
+    allowedImports (int): the number of allowed import players per team
+    salaryCap (bool): boolean parameter indicating presence of salary cap
+    solver (str): the solver used by teams for skill maximization, 'cbc' or 'exact'
+
+    Returns:
+    run (function): function running the case, returns the champion
+    """
+    league, _, _ = prepare_league(rng, allowedImports, salaryCap, 1, solver, 'regularSeason')
+
+    def run():
+        return functions.simulate_playoffs(league)
+
+    return run
+
+
+def setup_simulate_one_season(rng, allowedImports, salaryCap, solver):
+    """
+    Description:
+    Function to prepare the simulation of the first season of a league
+
+    Input:
+    rng (np.random.Generator): random number generator of the inputs
+    allowedImports (int): the number of allowed import players per team
+    salaryCap (bool): boolean parameter indicating presence of salary cap
+    solver (str): the solver used by teams for skill maximization, 'cbc' or 'exact'
+
+    Returns:
+    run (function): function running the case, returns the team results of the season
+    """
+    league = classes.League(rng)
+
+    def run():
+        return simulationModules.simulate_one_season(league, allowedImports, salaryCap, 1, 1, solver)[0]
+
+    return run
+
+
+def setup_simulation(rng, seasons, allowedImports, salaryCap, solver):
+    """
+    Description:
+    Function to prepare one simulation of consecutive seasons, the master seed is drawn from the generator of the inputs
+
+    Input:
+    rng (np.random.Generator): random number generator of the inputs
+    seasons (int): the number of consecutive seasons to simulate
+    allowedImports (int): the number of allowed import players per team
+    salaryCap (bool): boolean parameter indicating presence of salary cap
+    solver (str): the solver used by teams for skill maximization, 'cbc' or 'exact'
+
+    Returns:
+    run (function): function running the case, returns the team results of the simulation
+    """
+    masterSeed = int(rng.integers(2 ** 32))
+
+    def run():
+        return simulationModules.simulate_iterations([1], allowedImports, salaryCap, seasons, 1, solver, 1, masterSeed)[0]
+
+    return run
+
+
+def get_cases(allowedImports=10, salaryCap=True, solver="exact", skillSolvers=("exact", "cbc"), domesticSeasons=(1, 10, 30),
+              allowedImportsGrid=(4, 6, 10), repeats=20, seasonRepeats=3):
+    """
+    Description:
+    Function to define the benchmark cases covering the hot paths of a season
+
+    Input:
+    allowedImports (int): the number of allowed import players per team of all cases on a league, default is 10
+    salaryCap (bool): boolean parameter indicating presence of salary cap in all cases, default is True
+    solver (str): the solver used by teams in all cases on a league, default is 'exact'
+    skillSolvers (tuple): the solvers whose skill maximization is timed, default is ('exact', 'cbc')
+    domesticSeasons (tuple): the seasons whose domestic player pools are maximized, later seasons have larger pools,
+    default is (1, 10, 30)
+    allowedImportsGrid (tuple): the numbers of allowed imports whose foreign player pools are maximized, default is (4, 6, 10)
+    repeats (int): the number of timed repetitions of every case, default is 20
+    seasonRepeats (int): the number of timed repetitions of the cases simulating whole seasons, default is 3
+
+    Returns:
+    cases (dict): dictionary with the name of the case as key and a tuple of the setup function and the number of
+    repetitions as value, the setup function takes the random number generator of the inputs
+    """
+    scenario = {'allowedImports': allowedImports, 'salaryCap': salaryCap, 'solver': solver}
+    cases = {}
+
+    # skill maximization on domestic and foreign player pools of several sizes
+    for skillSolver in skillSolvers:
+        for season in domesticSeasons:
+            cases["skill_maximization[domestic,season={},{}]".format(season, skillSolver)] = (
+                functools.partial(setup_skill_maximization, pool="domestic", season=season, allowedImports=allowedImports, salaryCap=salaryCap, solver=skillSolver), repeats)
+        for imports in allowedImportsGrid:
+            cases["skill_maximization[foreign,imports={},{}]".format(imports, skillSolver)] = (
+                functools.partial(setup_skill_maximization, pool="foreign", season=1, allowedImports=imports, salaryCap=salaryCap, solver=skillSolver), repeats)
+
+    # stages of a season
+    cases["resolve_player_conflicts"] = (functools.partial(setup_resolve_player_conflicts, **scenario), repeats)
+    cases["teams_choose_replacement"] = (functools.partial(setup_teams_choose_replacement, **scenario), repeats)
+    cases["simulate_regular_season"] = (functools.partial(setup_simulate_regular_season, **scenario), repeats)
+    cases["solve_ranking_conflicts[ties=all]"] = (functools.partial(setup_solve_ranking_conflicts, ties="all", **scenario), repeats)
+    cases["solve_ranking_conflicts[ties=pairs]"] = (functools.partial(setup_solve_ranking_conflicts, ties="pairs", **scenario), repeats)
+    cases["simulate_playoffs"] = (functools.partial(setup_simulate_playoffs, **scenario), repeats)
+
+    # whole seasons
+    cases["simulate_one_season"] = (functools.partial(setup_simulate_one_season, **scenario), seasonRepeats)
+    cases["simulation[seasons=10]"] = (functools.partial(setup_simulation, seasons=10, **scenario), seasonRepeats)
+
+    return cases
+
+
+def time_case(setup, repeats, seed):
+    """
+    Description:
+    Function to time the repetitions of a case. Every repetition starts from the same inputs drawn with the seed and
+    with empty solver caches, the setup is not timed and an untimed repetition comes first
+
+    Input:
+    setup (function): setup function of the case, takes the random number generator of the inputs
+    repeats (int): the number of timed repetitions
+    seed (int): the seed of the inputs
+
+    Returns:
+    times (list): the wall time of every timed repetition in seconds
+    check (str): digest of the result of the case
+    """
+    times = []
+
+    # for the untimed and every timed repetition
+    for repetition in range(repeats + 1):
+        # prepare inputs without cached solver results
+        solvers.resultCache.clear()
+        solvers.tableCache.clear()
+        run = setup(np.random.default_rng(seed))
+
+        # time case without garbage collection
+        gc.collect()
+        gc.disable()
+        try:
+            startTime = time.perf_counter()
+            result = run()
+            duration = time.perf_counter() - startTime
+        finally:
+            gc.enable()
+
+        # ignore untimed repetition
+        if repetition > 0:
+            times.append(duration)
+
+    return times, get_check(result)
+
+
+def get_environment():
+    """
+    Description:
+    Function to describe the machine and the versions a benchmark is run with, timings are only comparable on the same
+    environment
+
+    Returns:
+    environment (dict): dictionary with the platform, processor and the versions of python, numpy, pandas and pulp
+    """
+    import pulp
+
+    return {'platform': platform.platform(), 'machine': platform.machine(), 'processor': platform.processor(),
+            'cpus': os.cpu_count(), 'python': sys.version.split()[0], 'numpy': np.__version__,
+            'pandas': pd.__version__, 'pulp': pulp.__version__}
+
+
+def run_benchmarks(cases, seed=0, caseFilter=None):
+    """
+    Description:
+    Function to run benchmark cases and to summarise their timings
+
+    Input:
+    cases (dict): dictionary with the name of the case as key and a tuple of the setup function and the number of
+    repetitions as value, as returned by get_cases
+    seed (int): the seed of the inputs of all cases, default is 0
+    caseFilter (str): only cases whose name contains the filter are run, default is None in which case all cases are run
+
+    Returns:
+    benchmark (dict): dictionary with the environment, the seed and per case the number of repetitions, the minimal,
+    median, mean and 95th percentile time in seconds and the digest of the result
+    """
+    benchmark = {'environment': get_environment(), 'seed': seed, 'time': time.time(), 'cases': {}}
+
+    # for each case
+    for name, (setup, repeats) in cases.items():
+        if caseFilter is not None and caseFilter not in name:
+            continue
+
+        # time case
+        times, check = time_case(setup, repeats, seed)
+        benchmark['cases'][name] = {'repeats': repeats, 'min': min(times), 'median': float(np.median(times)),
+                                    'mean': float(np.mean(times)), 'p95': float(np.percentile(times, 95)), 'check': check}
+        monitoring.progressLogger.info("[benchmark] %-45s median %9.3fms, min %9.3fms, p95 %9.3fms, %d repeats",
+                                       name, 1000 * benchmark['cases'][name]['median'], 1000 * min(times),
+                                       1000 * benchmark['cases'][name]['p95'], repeats)
+
+    return benchmark
+
+
+def save_baseline(benchmark, baselineFile):
+    """
+    Description:
+    Function to save a benchmark as baseline of later comparisons
+
+    Input:
+    benchmark (dict): the benchmark as returned by run_benchmarks
+    baselineFile (str): path of the JSON file of the baseline
+    """
+    if os.path.dirname(baselineFile):
+        os.makedirs(os.path.dirname(baselineFile), exist_ok=True)
+    with open(baselineFile, 'w') as file:
+        json.dump(benchmark, file, indent=2)
+
+
+def load_baseline(baselineFile):
+    """
+    Description:
+    Function to load the baseline of a comparison
+
+    Input:
+    baselineFile (str): path of the JSON file of the baseline
+
+    Returns:
+    baseline (dict): the benchmark saved as baseline
+    """
+    if not os.path.exists(baselineFile):
+        raise FileNotFoundError("No baseline {}, record one first".format(baselineFile))
+
+    with open(baselineFile) as file:
+        return json.load(file)
+
+
+def compare_benchmarks(benchmark, baseline, tolerance=0.2):
+    """
+    Description:
+    Function to compare a benchmark to its baseline by the median time of every case. A case is a regression if its
+    median time exceeds the median time of the baseline by more than the tolerance, and an improvement if it falls
+    below by more than the tolerance. Cases with a different result digest are flagged, as the benchmark then times
+    different work
+
+    Input:
+    benchmark (dict): the benchmark as returned by run_benchmarks
+    baseline (dict): the benchmark saved as baseline
+    tolerance (float): relative change of the median time which is tolerated as noise, default is 0.2
+
+    Returns:
+    comparison (dataframe): Dataframe with the median times, their ratio, the status ('regression', 'improvement',
+    'unchanged', 'new' or 'missing') and a result change indicator of every case
+    """
+    # warn if timings stem from different environments
+    if benchmark['environment'] != baseline['environment']:
+        monitoring.logger.warning("Warning! Baseline was recorded on a different environment, timings may not be comparable: %s",
+                                  {key: value for key, value in baseline['environment'].items() if benchmark['environment'].get(key) != value})
+    if benchmark['seed'] != baseline['seed']:
+        monitoring.logger.warning("Warning! Baseline was recorded with seed %s instead of %s", baseline['seed'], benchmark['seed'])
+
+    # initialise list of compared cases
+    comparison = []
+
+    # for each case of the benchmark or the baseline
+    for name in list(benchmark['cases']) + [name for name in baseline['cases'] if name not in benchmark['cases']]:
+        current, reference = benchmark['cases'].get(name), baseline['cases'].get(name)
+
+        # compare median times
+        if current is None or reference is None:
+            ratio = np.nan
+            status = "missing" if current is None else "new"
+        else:
+            ratio = current['median'] / reference['median'] if reference['median'] > 0 else np.inf
+            status = "regression" if ratio > 1 + tolerance else "improvement" if ratio < 1 - tolerance else "unchanged"
+
+        comparison.append({'case': name, 'baselineMedian': reference['median'] if reference else np.nan,
+                           'median': current['median'] if current else np.nan, 'ratio': ratio, 'status': status,
+                           'resultChanged': bool(current and reference and current['check'] != reference['check'])})
+
+    return pd.DataFrame(comparison)
+
+
+def log_comparison(comparison):
+    """
+    Description:
+    Function to report a comparison on stdout, one line per case and a summary of the regressions
+
+    Input:
+    comparison (dataframe): the comparison as returned by compare_benchmarks
+    """
+    for row in comparison.itertuples():
+        monitoring.progressLogger.info("[compare] %-45s %11s -> %11s, %6s %s%s", row.case,
+                                       "-" if np.isnan(row.baselineMedian) else "{:.3f}ms".format(1000 * row.baselineMedian),
+                                       "-" if np.isnan(row.median) else "{:.3f}ms".format(1000 * row.median),
+                                       "" if np.isnan(row.ratio) else "x{:.2f}".format(row.ratio),
+                                       row.status.upper() if row.status == "regression" else row.status,
+                                       ", RESULT CHANGED" if row.resultChanged else "")
+
+    # summarise regressions
+    regressions = comparison.loc[comparison['status'] == "regression", 'case'].tolist()
+    monitoring.progressLogger.info("[compare] %d regressions%s", len(regressions), ": " + ", ".join(regressions) if regressions else "")
@@ -0,0 +1,161 @@
+import numpy as np
+import pandas as pd
+import glob
+import os
+import pickle
+import tempfile
+
+
+# define file names inside a checkpoint directory
+seedFileName = "masterSeed.pkl"  # file containing the master seed of the checkpointed run
+chunkFilePattern = "simulations_{:06d}-{:06d}.pkl"  # file containing the results of one chunk of simulation iterations
+
+
+def get_checkpoint_directory(allowedImports, salaryCap, seasons, simulationNumber):
+    """
+    Description:
+    Function to get the directory in which the checkpoints of a simulation are stored, named like the result files
+
+    Input:
+    allowedImports (int): the number of allowed import players per team
+    salaryCap (bool): boolean parameter indicating presence of salary cap
+    seasons (int): the number of consecutive seasons to simulate
+    simulationNumber (int): the number of times the simulation shall be repeated
+
+    Returns:
+    checkpointDirectory (str): path of the checkpoint directory
+    """
+    return os.path.join("results", "checkpoints", "imports={}_cap={}_seasons={}_simNumb={}".format(allowedImports, salaryCap, seasons, simulationNumber))
+
+
+def write_atomically(fileName, content):
+    """
+    Description:
+    Function to pickle an object to a file such that the file is either complete or missing, even if the process dies
+    while writing. Every call writes to its own temporary file, so that processes writing the same file at the same
+    time do not mix their contents
+
+    Input:
+    fileName (str): path of the file
+    content (object): object to be pickled
+    """
+    # write to unique temporary file and flush it to disk
+    fileDescriptor, temporaryFileName = tempfile.mkstemp(dir=os.path.dirname(fileName) or ".", prefix=os.path.basename(fileName) + ".", suffix=".tmp")
+    with os.fdopen(fileDescriptor, 'wb') as file:
+        pickle.dump(content, file)
+        file.flush()
+        os.fsync(file.fileno())
+
+    # replace file in one step
+    os.replace(temporaryFileName, fileName)
+
+
+def resolve_master_seed(checkpointDirectories, seed=None):
+    """
+    Description:
+    Function to get the master seed of a checkpointed run. If checkpoints exist, the stored master seed is used so that
+    resumed simulations draw the same random numbers as in an uninterrupted run, otherwise a new master seed is created
+    and stored in every checkpoint directory
+
+    Input:
+    checkpointDirectories (list): the checkpoint directories of all scenarios sharing the master seed
+    seed (int): the requested master seed, default is None in which case fresh entropy is drawn for a new run
+
+    Returns:
+    masterSeed (int): the master seed of the run
+    """
+    # collect master seeds of existing checkpoints
+    storedSeeds = set()
+    for checkpointDirectory in checkpointDirectories:
+        if os.path.exists(os.path.join(checkpointDirectory, seedFileName)):
+            with open(os.path.join(checkpointDirectory, seedFileName), 'rb') as file:
+                storedSeeds.add(pickle.load(file))
+
+    # checkpoints of different runs can not be resumed together
+    if len(storedSeeds) > 1 or (storedSeeds and seed is not None and seed not in storedSeeds):
+        raise ValueError("Checkpoints were created with a different master seed, remove them or use the stored seed")
+
+    # use stored master seed or create new master seed
+    masterSeed = storedSeeds.pop() if storedSeeds else np.random.SeedSequence(seed).entropy
+
+    # store master seed in every checkpoint directory
+    for checkpointDirectory in checkpointDirectories:
+        os.makedirs(checkpointDirectory, exist_ok=True)
+        if not os.path.exists(os.path.join(checkpointDirectory, seedFileName)):
+            write_atomically(os.path.join(checkpointDirectory, seedFileName), masterSeed)
+
+    # return master seed
+    return masterSeed
+
+
+def save_checkpoint(checkpointDirectory, simulationIterations, teamResults, playerResults):
+    """
+    Description:
+    Function to save the results of a chunk of completed simulation iterations
+
+    Input:
+    checkpointDirectory (str): path of the checkpoint directory
+    simulationIterations (list): the completed simulation iterations
+    teamResults (data frame): team results of the simulation iterations
+    playerResults (data frame): player salary results of the simulation iterations
+    """
+    fileName = os.path.join(checkpointDirectory, chunkFilePattern.format(min(simulationIterations), max(simulationIterations)))
+    write_atomically(fileName, {'simulationIterations': list(simulationIterations), 'teamResults': teamResults, 'playerResults': playerResults})
+
+
+def load_checkpoints(checkpointDirectory):
+    """
+    Description:
+    Function to load all chunks of completed simulation iterations in the order of their first simulation iteration
+
+    Input:
+    checkpointDirectory (str): path of the checkpoint directory
+
+    Returns:
+    chunks (list): list of dictionaries with the simulation iterations, team results and player salary results of every chunk
+    """
+    chunks = []
+    for fileName in sorted(glob.glob(os.path.join(checkpointDirectory, "simulations_*.pkl"))):
+        with open(fileName, 'rb') as file:
+            chunks.append(pickle.load(file))
+    return chunks
+
+
+def get_missing_iterations(checkpointDirectory, simulationNumber):
+    """
+    Description:
+    Function to get the simulation iterations which are not yet contained in the checkpoints
+
+    Input:
+    checkpointDirectory (str): path of the checkpoint directory
+    simulationNumber (int): the number of times the simulation shall be repeated
+
+    Returns:
+    missingIterations (list): the simulation iterations still to be simulated in ascending order
+    """
+    completedIterations = {simulationIteration for chunk in load_checkpoints(checkpointDirectory) for simulationIteration in chunk['simulationIterations']}
+    return [simulationIteration for simulationIteration in range(1, simulationNumber + 1) if simulationIteration not in completedIterations]
+
+
+def merge_checkpoints(checkpointDirectory):
+    """
+    Description:
+    Function to merge all checkpoints of a simulation into the team and player salary results ordered by simulation
+
+    Input:
+    checkpointDirectory (str): path of the checkpoint directory
+
+    Returns:
+    combinedSimulationTeamResults (data frame): data frame containing the simulation team results for all simulations
+    combinedSimulationPlayerResults (data frame): data frame containing the simulation player salary results for all simulations
+    """
+    # load chunks
+    chunks = load_checkpoints(checkpointDirectory)
+
+    # merge results and order them by simulation, keeping the order of seasons and teams within a simulation
+    combinedSimulationTeamResults = pd.concat([chunk['teamResults'] for chunk in chunks], ignore_index=True)
+    combinedSimulationPlayerResults = pd.concat([chunk['playerResults'] for chunk in chunks], ignore_index=True)
+
+    # return merged results
+    return (combinedSimulationTeamResults.sort_values('simulation', kind='mergesort', ignore_index=True),
+            combinedSimulationPlayerResults.sort_values('simulation', kind='mergesort', ignore_index=True))
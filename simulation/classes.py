@@ -1,13 +1,14 @@
 import parameters
 import functions
+import solvers
+import monitoring
 import pandas as pd
-import random as ra
 import numpy as np
 
 
 # define domestic player pool as class
 class DomesticPlayerPool(object):
-    def __init__(self, season=1, maximalBudget=max(parameters.initialTeamBudget), allowedImports=4):
+    def __init__(self, season=1, maximalBudget=max(parameters.initialTeamBudget), allowedImports=4, rng=None):
         """
         Description:
         Initializes the domestic player pool object. The object is fully initialised based on parameters and variables
@@ -16,6 +17,8 @@ class DomesticPlayerPool(object):
         season (int): the index of season currently played, default is 1
         maximalBudget (int): the highest team budget, default is defined highest initial team budget
         allowedImports (int): the number of allowed import players per team in the league, default is 4
+        rng (np.random.Generator): the random number generator used to draw player skills, default is None in which
+        case a new unseeded generator is used
 
         A domestic player pool object has the following attributes:
         self.domesticTeamSize (int): determines the number of domestic players on team
@@ -26,16 +29,22 @@ class DomesticPlayerPool(object):
         self.allPlayerSkills (array): array with all player skills
         self.allPlayersData (dataframe): A dataframe with information about all initialised players, infos are to be found in parameter file
         self.availablePlayersData (dataframe): A dataframe with information about available players not yet picked by a team, initialised with all players
+        self.skillClasses (dataframe): A dataframe with one row per class of players with identical skill and salary, the number of players and the player ids of the class
+        self.fingerprint (str): Digest of the skill classes which identifies the skill maximization problems of the pool
+        self.knapsackTables (dict): Dictionary with selection size as key and the exact skill maximization table of all skill classes as value, is initialised empty
         """
         self.domesticTeamSize = parameters.teamSizeMax - allowedImports  # domestic players of team, references 'h_domestic' in thesis
         self.domesticSize = round(parameters.initialSwissPlayers * (1 + parameters.naturalPlayerBaseGrowth) ** season)  # domestic player pool size, references 'k_domestic' in thesis
         self.totalSize = self.domesticSize + allowedImports  # total player pool size faced by teams, references 'k_t' in thesis
         self.maximalSalary = round(parameters.bestPlayerRevenueShare * maximalBudget)  # maximal salary for best available player, references 'w_max' in thesis
         self.allPlayers = ['d'+str(p) for p in range(1, self.domesticSize+1)]  # create players with numbers from 1 to domestic player pool size to create all players in player pool, references 'p_domestic' in thesis
-        self.allPlayerSkills = np.round(np.random.beta(a=parameters.alpha, b=parameters.beta, size=self.domesticSize), 2)  # draw skill from beta distribution to create all skill levels of players in player pool, references 'S_p' in thesis
+        self.allPlayerSkills = np.round((rng if rng is not None else np.random.default_rng()).beta(a=parameters.alpha, b=parameters.beta, size=self.domesticSize), 2)  # draw skill from beta distribution to create all skill levels of players in player pool, references 'S_p' in thesis
         self.allPlayerSalaries = np.round(self.maximalSalary * self.allPlayerSkills * functions.supply_effect(self.totalSize))  # calculate player salaries to create all salaries in the player pool, references 'W_p' in thesis
         self.allPlayersData = self.get_all_player_data()
         self.availablePlayersData = self.get_all_player_data()
+        self.skillClasses = functions.get_skill_classes(self.allPlayersData)
+        self.fingerprint = solvers.get_fingerprint(self.skillClasses['skill'], self.skillClasses['salary'], self.skillClasses['count'])
+        self.knapsackTables = {}
 
     def get_all_player_data(self):
         """
@@ -104,6 +113,45 @@ class DomesticPlayerPool(object):
 
         return allPlayerSalariesList
 
+    def get_knapsack_table(self, selectionSize):
+        """
+        Description:
+        Get the exact skill maximization table of all skill classes for a selection size, the table is built once per
+        player pool and selection size and then answers the problem for any team budget
+
+        Input:
+        selectionSize (int): The number of players to be selected
+
+        Returns:
+        knapsackTable (KnapsackTable): The table of the skill maximization problem
+        """
+        # if table does not exist yet
+        if selectionSize not in self.knapsackTables:
+            # build table over all skill classes
+            self.knapsackTables[selectionSize] = solvers.KnapsackTable(
+                self.skillClasses['skill'], self.skillClasses['salary'], selectionSize, self.skillClasses['count'])
+
+        return self.knapsackTables[selectionSize]
+
+    def get_class_players(self, selectedCounts):
+        """
+        Description:
+        Get player ids for a selection given as number of players per skill class. The first ids of a class are used,
+        so that teams selecting from the same class select the same players and compete for them in the conflict
+        resolution, independent of the order in which teams select
+
+        Input:
+        selectedCounts (array): The number of selected players of every skill class
+
+        Returns:
+        selectedPlayersList (list): List of selected players
+        """
+        # take the first players of every skill class with selected players
+        selectedPlayersList = [player for skillClass in np.flatnonzero(selectedCounts)
+                               for player in self.skillClasses.at[skillClass, 'players'][:selectedCounts[skillClass]]]
+
+        return selectedPlayersList
+
     def get_available_players_set(self):
         """
         Description:
@@ -171,14 +219,18 @@ class ForeignPlayerPool(object):
         allowedImports (int): the number of allowed import players per team in the league, default is 4
 
         A foreign player pool object has the following attributes:
+        self.allowedImports (int): the number of allowed import players per team
         self.domesticSize (int): determines pool size of domestic player pool (number of available players)
         self.totalSize (int): determines the total size of player pool faced by a team
         self.allPlayers (list): list with player ids of the form f_id
         self.allPlayerSkills (array): array with all player skills
         self.allPlayerSkills (array): array with all player skills
         self.allPlayersData (dataframe): A dataframe with information about all initialised players, infos are to be found in parameter file
-        self.availablePlayersData (dataframe): A dataframe with information about available players not yet picked by a team, initialised with all players
+        self.skillClasses (dataframe): A dataframe with one row per class of players with identical skill and salary, the number of players and the player ids of the class
+        self.fingerprint (str): Digest of the skill classes which identifies the skill maximization problems of the pool
+        self.knapsackTables (dict): Dictionary with selection size as key and the exact skill maximization table of all skill classes as value, is initialised empty
         """
+        self.allowedImports = allowedImports  # allowed import players per team, references 'rho' in thesis
         self.domesticSize = round(parameters.initialSwissPlayers * (1 + parameters.naturalPlayerBaseGrowth) ** season)  # domestic player pool size, references 'k_domestic' in thesis
         self.totalSize = self.domesticSize + allowedImports  # total player pool size faced by teams, references 'k_t' in thesis
         self.maximalSalary = round(parameters.bestPlayerRevenueShare * maximalBudget)  # maximal salary for best available player, references 'w_max' in thesis
@@ -186,6 +238,9 @@ class ForeignPlayerPool(object):
         self.allPlayerSkills = np.round(np.repeat(np.arange(start=0.01, stop=1.01, step=0.01), allowedImports), 2)  # create all possible skill levels from 0 to 1 repeated as many times as there are allowed imports, references 'S_p' in thesis
         self.allPlayerSalaries = np.round(self.maximalSalary * self.allPlayerSkills * functions.supply_effect(self.totalSize))  # calculate player salaries to create all salaries in the player pool, references 'W_p' in thesis
         self.allPlayersData = self.get_all_player_data()
+        self.skillClasses = functions.get_skill_classes(self.allPlayersData)
+        self.fingerprint = solvers.get_fingerprint(self.skillClasses['skill'], self.skillClasses['salary'], self.skillClasses['count'])
+        self.knapsackTables = {}
 
     def get_all_player_data(self):
         """
@@ -242,55 +297,150 @@ class ForeignPlayerPool(object):
 
         return allPlayerSalariesList
 
+    def get_knapsack_table(self, selectionSize):
+        """
+        Description:
+        Get the exact skill maximization table of all skill classes for a selection size, the table maps any team
+        budget to the optimal import players and is shared by all pools with the same salary scale
+
+        Input:
+        selectionSize (int): The number of players to be selected
+
+        Returns:
+        knapsackTable (KnapsackTable): The table of the skill maximization problem
+        """
+        # if table does not exist yet
+        if selectionSize not in self.knapsackTables:
+            # the pool is fully defined by the allowed imports and the salary scale, so that tables are reused across
+            # seasons with the same scale
+            key = ('foreign', self.allowedImports, self.maximalSalary, self.totalSize, selectionSize)
+
+            # get table over all skill classes from cache
+            self.knapsackTables[selectionSize] = solvers.get_cached_table(
+                key, self.skillClasses['skill'], self.skillClasses['salary'], selectionSize, self.skillClasses['count'])
+
+        return self.knapsackTables[selectionSize]
+
+    def get_class_players(self, selectedCounts):
+        """
+        Description:
+        Get player ids for a selection given as number of players per skill class, the first ids of a class are used
+        since the foreign player pool is not depleted by selections
+
+        Input:
+        selectedCounts (array): The number of selected players of every skill class
+
+        Returns:
+        selectedPlayersList (list): List of selected players
+        """
+        # take the first players of every skill class with selected players
+        selectedPlayersList = [player for skillClass in np.flatnonzero(selectedCounts)
+                               for player in self.skillClasses.at[skillClass, 'players'][:selectedCounts[skillClass]]]
+
+        return selectedPlayersList
+
 
 # define league as class
 class League(object):
-    def __init__(self):
+    # columns of team data and their types, every column is stored as array indexed by team id
+    teamColumns = (('domestics', np.int64),  # the number of domestic players
+                   ('imports', np.int64),  # the number of import players
+                   ('budget', np.int64),  # team budgets, references 'R_tot_it-1'
+                   ('salaryCap', np.int64),  # salary cap, references 'R_cap', 0 if no salary cap exists
+                   ('effectiveBudget', np.int64),  # budget teams can actually spend
+                   ('payroll', np.int64),  # team payrolls, references 'sum(W_p * d_p)' in thesis
+                   ('totalSkill', np.float64),  # team skills, references 'S_i' in thesis
+                   ('revenue', np.float64),  # revenue, references 'R_tot_it' in thesis
+                   ('hockeyRevenue', np.float64),  # hockey related revenue
+                   ('wins', np.int64),  # win count
+                   ('games', np.int64),  # game count
+                   ('rank', np.int64),  # final regular season rank
+                   ('eliminatedRS', np.int64),  # binary variable indicating regular season elimination
+                   ('eliminatedPP', np.int64),  # binary variable indicating pre playoffs elimination
+                   ('eliminatedPR1', np.int64),  # binary variable indicating playoffs round 1 elimination
+                   ('eliminatedPR2', np.int64),  # binary variable indicating playoffs round 2 elimination
+                   ('eliminatedPR3', np.int64),  # binary variable indicating playoffs round 3 elimination
+                   ('champion', np.int64),  # binary variable indicating league champion
+                   ('wentBankrupt', np.int64))  # binary variable indicating if a team went bankrupt
+
+    # per team constants of team data, they do not change during a simulation and are not part of the season results
+    teamConstants = {'monetaryFactor': parameters.monetaryFactor,  # references 'z_i' in thesis
+                     'marketSize': parameters.marketSize,  # references 'm_i' in thesis
+                     'seasonPhaseFactor': parameters.seasonPhaseFactor,  # references 'r_ig' in thesis
+                     'compBalanceEffect': parameters.compBalanceEffect}  # references 'b_i' in thesis
+
+    __slots__ = ('teams', 'teamIndex', *[column for column, dtype in teamColumns], 'optimalDomesticPlayers',
+                 'optimalDomesticPlayersSet', 'optimalDomesticPlayersData', 'optimalImportPlayers', 'finalPlayerSelection',
+                 'regularSeasonRanking', 'headToHead', 'leagueCondition', 'rng')
+
+    def __init__(self, rng=None):
         """
         Description:
         Initializes a league object. The object is fully initialised based on parameters and variables
 
+        Input:
+        rng (np.random.Generator): the random number generator of the simulation the league belongs to, default is
+        None in which case a new unseeded generator is used
+
         A league object has the following attributes:
-        self.teamData (dataframe): Dataframe with information about the team, parameter description in parameters file
+        self.teams (list): List with the names of all teams, the position of a team is its team id
+        self.teamIndex (dict): Dictionary with each team as key and its team id as value
+        self.domestics, ..., self.wentBankrupt (np.ndarray): One array per column in 'teamColumns' with the value of
+        every team at the position of its team id, a data frame view is created by get_team_data()
         self.optimalDomesticPlayers (dict): Dictionary with each team as key and a list of optimal domestic players selected by the team in maximization process, is initialised empty
         self.optimalDomesticPlayersSet (set): Set containing every selected domestic player in the maximization process once, is initialised empty
         self.optimalDomesticPlayersData (dataframe): Dataframe containing information about the selected domestic players in maximization process, is initialised empty
         self.optimalDomesticPlayers (dict): Dictionary with each team as key and a list of optimal import players selected by the team in maximization process, is initialised empty
         self.finalPlayerSelection (dict): Dictionary with each team as key and a list of the final players selected by the team in replacement process, is initialised empty
         self.regularSeasonRanking (dataframe): Dataframe which contains regular season ranking, is initialised empty
+        self.headToHead (array): Matrix with the number of regular season wins of the row team against the column team, is initialised with zeros
         self.leagueCondition (str): String inidicating if a simulation breaking condition occures, is initialised with None
+        self.rng (np.random.Generator): Random number generator used for all random decisions in the league
         """
-        self.teamData = pd.DataFrame({'team': parameters.teams,
-                                      'domestics': [0] * parameters.leagueSize,  # the number of domestic players
-                                      'imports': [0] * parameters.leagueSize,  # the number of import players
-                                      'budget': parameters.initialTeamBudget,  # create variable team budgets, references 'R_tot_it-1',
-                                      'salaryCap': [False] * parameters.leagueSize,  # create variable salary cap, references 'R_cap'
-                                      'effectiveBudget': [0] * parameters.leagueSize,  # create variable for the budget teams can actually spend
-                                      'payroll': [0] * parameters.leagueSize,  # create variable team payrolls, references 'sum(W_p * d_p)' in thesis
-                                      'totalSkill': [0] * parameters.leagueSize,  # create variable team skills, references 'S_i' in thesis
-                                      'revenue': [0] * parameters.leagueSize,  # create variable revenue, references 'R_tot_it' in thesis
-                                      'hockeyRevenue': parameters.initialTeamBudget,  # create variable hockey related revenue, is initialised with initial team budgets
-                                      'wins': [0] * parameters.leagueSize,  # create variable for win count
-                                      'games': [0] * parameters.leagueSize,  # create variable for game count
-                                      'rank': [0] * parameters.leagueSize,  # create variable for final regular season rank
-                                      'eliminatedRS': [0] * parameters.leagueSize,  # create binary variable indicating regular season elimination
-                                      'eliminatedPP': [0] * parameters.leagueSize,  # create binary variable indicating pre playoffs elimination
-                                      'eliminatedPR1': [0] * parameters.leagueSize,  # create binary variable indicating playoffs round 1 elimination
-                                      'eliminatedPR2': [0] * parameters.leagueSize,  # create binary variable indicating playoffs round 2 elimination
-                                      'eliminatedPR3': [0] * parameters.leagueSize,  # create binary variable indicating playoffs round 3 elimination
-                                      'champion': [0] * parameters.leagueSize,  # create binary variable indicating league champion
-                                      'wentBankrupt': [0] * parameters.leagueSize,  # create binary variable indicating if a team went bankrupt
-                                      'monetaryFactor': parameters.monetaryFactor,
-                                      'marketSize': parameters.marketSize,
-                                      'seasonPhaseFactor': parameters.seasonPhaseFactor,
-                                      'compBalanceEffect': parameters.compBalanceEffect})
+        self.teams = list(parameters.teams)
+        self.teamIndex = {team: index for index, team in enumerate(self.teams)}
+
+        # create all columns of team data with zeros
+        for column, dtype in self.teamColumns:
+            setattr(self, column, np.zeros(parameters.leagueSize, dtype=dtype))
+
+        # initialise team budgets and hockey related revenues with initial team budgets
+        self.budget[:] = parameters.initialTeamBudget
+        self.hockeyRevenue[:] = parameters.initialTeamBudget
+
         self.optimalDomesticPlayers = {}
         self.optimalDomesticPlayersSet = set()
         self.optimalDomesticPlayersData = pd.DataFrame()
         self.optimalImportPlayers = {}
         self.finalPlayerSelection = {}
         self.regularSeasonRanking = pd.DataFrame()
+        self.headToHead = np.zeros((parameters.leagueSize, parameters.leagueSize), dtype=int)
         self.leagueCondition = None
+        self.rng = rng if rng is not None else np.random.default_rng()
+
+    def get_team_data(self):
+        """
+        Description:
+        Get a data frame view of the team data, to be used when results are emitted
+
+        Returns:
+        teamData (dataframe): Data frame with one row per team and the column 'team' followed by all columns in
+        'teamColumns' and 'teamConstants', revenues are reported in whole units and the salary cap is False if no
+        salary cap exists
+        """
+        # create data frame from columns and per team constants
+        teamData = pd.DataFrame({'team': self.teams, **{column: getattr(self, column) for column, dtype in self.teamColumns},
+                                 **self.teamConstants})
+
+        # report revenues in whole units
+        teamData['revenue'] = self.revenue.round().astype(np.int64)
+        teamData['hockeyRevenue'] = self.hockeyRevenue.round().astype(np.int64)
+
+        # report missing salary cap as False
+        if not self.salaryCap.any():
+            teamData['salaryCap'] = False
+
+        return teamData
 
     def get_teams(self):
         """
@@ -300,7 +450,7 @@ class League(object):
         Returns:
         teamsList (list): List of all teams
         """
-        teamsList = self.teamData['team'].tolist()
+        teamsList = list(self.teams)
 
         return teamsList
 
@@ -312,7 +462,7 @@ class League(object):
         Returns:
         teamBudgetsList (list): List of all team budgets
         """
-        teamBudgetsList = self.teamData['budget'].tolist()
+        teamBudgetsList = self.budget.tolist()
 
         return teamBudgetsList
 
@@ -324,7 +474,7 @@ class League(object):
         Returns:
         salaryCapList (list): List of salary cap figure repeated 'leagueSize'-times
         """
-        salaryCapList = self.teamData['salaryCap'].tolist()
+        salaryCapList = self.salaryCap.tolist()
 
         return salaryCapList
 
@@ -336,7 +486,7 @@ class League(object):
         Returns:
         effectiveTeamBudgetsList (list): List of all team budgets which teams are effectively able to spend
         """
-        effectiveTeamBudgetsList = self.teamData['effectiveBudget'].tolist()
+        effectiveTeamBudgetsList = self.effectiveBudget.tolist()
 
         return effectiveTeamBudgetsList
 
@@ -348,7 +498,7 @@ class League(object):
         Returns:
         teamPayrollsList (list): List of all team payrolls
         """
-        teamPayrollsList = self.teamData['payroll'].tolist()
+        teamPayrollsList = self.payroll.tolist()
 
         return teamPayrollsList
 
@@ -360,7 +510,7 @@ class League(object):
         Returns:
         teamSkillsList (list): List with aggregated skill level of every team
         """
-        teamSkillsList = self.teamData['totalSkill'].tolist()
+        teamSkillsList = self.totalSkill.tolist()
 
         return teamSkillsList
 
@@ -379,12 +529,12 @@ class League(object):
         if teams is None:
 
             # return all revenues
-            teamRevenuesList = self.teamData['revenue'].tolist()
+            teamRevenuesList = self.revenue.tolist()
 
         elif type(teams) is list:
 
-            # return all revenues of requested teams
-            teamRevenuesList = self.teamData.loc[self.teamData['team'].isin(teams), 'revenue'].tolist()
+            # return all revenues of requested teams in order of team ids
+            teamRevenuesList = self.revenue[sorted(self.teamIndex[team] for team in teams)].tolist()
 
         return teamRevenuesList
 
@@ -397,7 +547,7 @@ class League(object):
         hockeyRevenues (list): List with all hockey related team revenues
         """
         # return all revenues
-        hockeyRevenues = self.teamData['hockeyRevenue'].tolist()
+        hockeyRevenues = self.hockeyRevenue.tolist()
 
         return hockeyRevenues
 
@@ -424,28 +574,19 @@ class League(object):
         update team data with regular season results
 
         updates:
-        self.teamData (data frame): Data frame with data to team performance in season
+        self.wins, self.games, self.rank, self.eliminatedRS (np.ndarray): Columns of team data with regular season results
         """
-        # get required team information
-        teams = self.get_teams()
-        teamData = self.teamData.copy()
-        regularSeasonRanking = self.regularSeasonRanking.copy()
+        # get team ids in order of regular season ranking
+        regularSeasonRanking = self.regularSeasonRanking
+        teamIds = regularSeasonRanking['team'].map(self.teamIndex).to_numpy()
 
-        # for each team
-        for team in teams:
-            # update team data
-            teamData.loc[teamData['team'] == team, 'wins'] = \
-                regularSeasonRanking.loc[regularSeasonRanking['team'] == team, 'wins'].values[0]
-            teamData.loc[teamData['team'] == team, 'games'] = \
-                regularSeasonRanking.loc[regularSeasonRanking['team'] == team, 'games'].values[0]
-            teamData.loc[teamData['team'] == team, 'rank'] = \
-                regularSeasonRanking.loc[regularSeasonRanking['team'] == team, 'rank'].values[0]
+        # update team data
+        self.wins[teamIds] = regularSeasonRanking['wins'].to_numpy()
+        self.games[teamIds] = regularSeasonRanking['games'].to_numpy()
+        self.rank[teamIds] = regularSeasonRanking['rank'].to_numpy()
 
-        # label eliminated teams in regular season
-        teamData['eliminatedRS'] = teamData['rank'].map(lambda x: 1 if x in [11, 12, 13, 14] else 0)
-
-        # assign new data back
-        self.teamData = teamData
+        # label teams which do not enter any playoff round as eliminated in regular season
+        self.eliminatedRS[:] = ~np.isin(self.rank, [rank for playoffRound in parameters.playoffBracket for rank in playoffRound['entrants']])
 
     def check_intersection_optimal_final(self):
         """
@@ -453,7 +594,7 @@ class League(object):
         Check how many players initially wanted by the team end up on the team
 
         Output:
-        Printing intersection for each team
+        Logging intersection for each team
         """
         # for each team
         for team in self.finalPlayerSelection:
@@ -466,16 +607,18 @@ class League(object):
             # create intersection
             intersection = finalSelectionSet.intersection(optimalSelectionSet)
 
-            # print
-            print('Team: {}, Total: {}, Set: {}'.format(team, len(intersection), intersection))
+            # log intersection
+            monitoring.logger.debug("Team: %s, Total: %s, Set: %s", team, len(intersection), intersection)
 
-    def select_optimal_domestic_players(self, domesticPlayerPool):
+    def select_optimal_domestic_players(self, domesticPlayerPool, solver="exact"):
         """
         Description:
-        Let each team solve the maximization problem of player selection for domestic players
+        Let each team solve the maximization problem of player selection for domestic players. With the exact solver,
+        the skill versus budget frontier of the pool is built once and each team's selection is a lookup
 
         Input:
         domesticPlayerPool (PlayerPool): The initialised domestic player pool of object DomesticPlayerPool
+        solver (str): The solver used for skill maximization, 'cbc' or 'exact', default is 'exact'
 
         Updates:
         self.optimalDomesticPlayers (dict): updates the dictionary with the selected optimal domestic players by each team
@@ -494,7 +637,7 @@ class League(object):
         # for each team in the league
         for team in range(len(teams)):
             # select optimal players based on skill maximization
-            selectedPlayers = functions.skill_maximization(domesticPlayerPool, teamBudgets[team], domesticTeamSize)
+            selectedPlayers = functions.skill_maximization(domesticPlayerPool, teamBudgets[team], domesticTeamSize, solver)
 
             # add team as key and the list of selected players as value do the dictionary
             optimalDomesticPlayers[teams[team]] = selectedPlayers.player.tolist()
@@ -528,7 +671,7 @@ class League(object):
         Updates:
         playerPool (PlayerPool): The selected replacement players are removed from available players in player pool
         self.finalPlayerSelection (dict): The dictionary with the final player selection is completed
-        self.teamData (dataframe): The dataframe with information about the teams is completed
+        self.payroll, self.totalSkill (np.ndarray): The columns with information about the teams are completed
         """
         # get required team information
         teams = self.get_teams()
@@ -537,7 +680,7 @@ class League(object):
         conflicts, noConflicts = functions.identify_conflicts(self)
 
         # shuffle conflicts
-        shuffledConflicts = functions.shuffle_conflicts(conflicts)
+        shuffledConflicts = functions.shuffle_conflicts(conflicts, self.rng)
 
         # initialise dictionary for final player selection by adding a key for each team and empty lists as values
         self.finalPlayerSelection = {team: [] for team in teams}
@@ -551,7 +694,7 @@ class League(object):
             self.finalPlayerSelection = functions.assign_player(self, player, team)
 
         # update data for all teams
-        self.teamData = functions.update_team_info(self, domesticPlayerPool.allPlayersData)
+        functions.update_team_info(self, domesticPlayerPool.allPlayersData)
 
         # for each player with conflict
         for player in shuffledConflicts:
@@ -559,7 +702,7 @@ class League(object):
             interestedTeams = shuffledConflicts[player]
 
             # let the player decide which team to join
-            chosenTeam = functions.player_chooses_team(interestedTeams)
+            chosenTeam = functions.player_chooses_team(interestedTeams, self.rng)
 
             # assign the player to the team he decided to join
             self.finalPlayerSelection = functions.assign_player(self, player, chosenTeam)
@@ -568,10 +711,10 @@ class League(object):
             interestedTeams.remove(chosenTeam)
 
             # shuffle the remaining teams so that teams can pick a replacement in a random order
-            ra.shuffle(interestedTeams)
+            self.rng.shuffle(interestedTeams)
 
         # update team data after all players have chosen their team
-        self.teamData = functions.update_team_info(self, domesticPlayerPool.allPlayersData)
+        functions.update_team_info(self, domesticPlayerPool.allPlayersData)
 
         # for every player which now needs to be replaced by the remaining teams in each conflict
         for player in shuffledConflicts:
@@ -597,19 +740,22 @@ class League(object):
                 domesticPlayerPool.remove_player_from_available(replacementPlayer)
 
             # update team data after each conflict so that it is up to date when resolving next conflict
-            self.teamData = functions.update_team_info(self, domesticPlayerPool.allPlayersData)
+            functions.update_team_info(self, domesticPlayerPool.allPlayersData)
 
         assert functions.no_duplicates(self.finalPlayerSelection)
 
-    def select_optimal_import_players(self, foreignPlayerPool, domesticPlayerPool, allowedImports):
+    def select_optimal_import_players(self, foreignPlayerPool, domesticPlayerPool, allowedImports, solver="exact"):
         """
         Description:
-        Let each team solve the maximization problem of player selection for foreign players
+        Let each team solve the maximization problem of player selection for foreign players. With the exact solver,
+        each team's selection is a lookup of its remaining budget in a table shared by all teams and by all seasons
+        with the same salary scale
 
         Input:
         foreignPlayerPool (PlayerPool): The initialised foreign player pool of object ForeignPlayerPool
         domesticPlayerPool (PlayerPool): The initialised domestic player pool of object DomesticPlayerPool
         allowedImports (int): The number of allowed import players
+        solver (str): The solver used for skill maximization, 'cbc' or 'exact', default is 'exact'
 
         Updates:
         self.optimalImportPlayers (dict): updates the dictionary with the selected optimal import players by each team
@@ -629,7 +775,7 @@ class League(object):
             remainingBudget = teamBudgets[team] - teamPayrolls[team]
 
             # select optimal players based on skill maximization
-            selectedPlayers = functions.skill_maximization(foreignPlayerPool, remainingBudget, allowedImports)
+            selectedPlayers = functions.skill_maximization(foreignPlayerPool, remainingBudget, allowedImports, solver)
 
             # add selected players to dictionary
             optimalImportPlayers[teams[team]] = selectedPlayers.player.tolist()
@@ -648,7 +794,7 @@ class League(object):
         combinedPlayersData = pd.concat([domesticPlayerPool.allPlayersData, foreignPlayerPool.allPlayersData], ignore_index=True)
 
         # update team data after teams are fully stacked
-        self.teamData = functions.update_team_info(self, combinedPlayersData)
+        functions.update_team_info(self, combinedPlayersData)
 
         # capture potential simulation break conditions:
         # if at least one team does not have have at least minimum amount of players
@@ -656,14 +802,14 @@ class League(object):
                          self.finalPlayerSelection.items()}.values())):
 
             # warning message
-            print("Warning!\nAt least one team has not enough budget to assemble a fully stacked team")
+            monitoring.logger.warning("Warning! At least one team has not enough budget to assemble a fully stacked team")
 
             # extract teams which has not enough budget
             bankruptTeams = list({team: value for (team, value) in {team: len(players) >= parameters.teamSizeMin for (team, players) in
                   self.finalPlayerSelection.items()}.items() if value is False}.keys())
 
             # report bankrupt teams and break condition
-            self.teamData.loc[self.teamData['team'].isin(bankruptTeams), 'wentBankrupt'] = 1
+            self.wentBankrupt[[self.teamIndex[team] for team in bankruptTeams]] = 1
 
             # define condition and return
             self.leagueCondition = "bankruptcy"
@@ -672,8 +818,7 @@ class League(object):
         assert all(list({team: len(players) <= parameters.teamSizeMax for (team, players) in
                              self.finalPlayerSelection.items()}.values()))  # violation of budget
 
-        assert all([True if self.teamData.loc[x, 'budget'] - self.teamData.loc[x, 'payroll'] >= 0 else False for x in
-                    range(len(self.teamData))])  # payroll below budget
+        assert all(self.budget - self.payroll >= 0)  # payroll below budget
 
     def calculate_game_revenue(self, homeTeam, winPercentageHome, seasonPhase):
         """
@@ -688,38 +833,17 @@ class League(object):
         and playoffs respectively
 
         Update:
-        self.teamData (dataframe): The dataframe containing team information is updated with new revenue data
+        self.revenue (np.ndarray): The revenue of the home team is updated with new revenue data
         """
 
-        # extract home team information in order to calculate game revenues ###
-
-        # if it is a game in the regular season
-        if seasonPhase == 0:
+        # get team id of home team
+        homeTeamId = self.teamIndex[homeTeam]
 
-            # extract regular season factor
-            seasonPhaseFactor = self.teamData.loc[self.teamData['team'] == homeTeam, 'seasonPhaseFactor'].values[0][0]
-
-        # if it is a game in the playoffs
-        elif seasonPhase in [1, 2]:
-
-            # extract playoff factor
-            seasonPhaseFactor = self.teamData.loc[self.teamData['team'] == homeTeam, 'seasonPhaseFactor'].values[0][1]
-
-        # extract monetaryFactor
-        monetaryFactor = self.teamData.loc[self.teamData['team'] == homeTeam, 'monetaryFactor'].values[0]
-
-        # extract market size
-        marketSize = self.teamData.loc[self.teamData['team'] == homeTeam, 'marketSize'].values[0]
-
-        # extract effect of competitive balance
-        compBalanceEffect = self.teamData.loc[self.teamData['team'] == homeTeam, 'compBalanceEffect'].values[0]
-
-        # calculate game revenue for team
-        gameRevenue = monetaryFactor * seasonPhaseFactor * (
-                marketSize * winPercentageHome - (compBalanceEffect / 2) * winPercentageHome ** 2)
+        # calculate game revenue for team from revenue coefficients
+        gameRevenue = functions.calculate_game_revenues(homeTeamId, winPercentageHome, seasonPhase)
 
         # update revenue of home team
-        self.teamData.loc[self.teamData['team'] == homeTeam, 'revenue'] += gameRevenue
+        self.revenue[homeTeamId] += gameRevenue
 
     def simulate_season(self):
         """
@@ -731,17 +855,19 @@ class League(object):
         The name of the champion is printed out
         """
         # simulate regular season to obtain ranking
-        print("Simulation of regular season")
-        self.regularSeasonRanking = functions.simulate_regular_season(self)
+        monitoring.logger.debug("Simulation of regular season")
+        with monitoring.profiler.phase("regularSeason"):
+            self.regularSeasonRanking = functions.simulate_regular_season(self)
 
-        # update team data based on regular season ranking
-        self.update_team_data_post_regular_season()
+            # update team data based on regular season ranking
+            self.update_team_data_post_regular_season()
 
         # simulate playoffs
-        print("Simulation of playoffs")
-        champion = functions.simulate_playoffs(self)
+        monitoring.logger.debug("Simulation of playoffs")
+        with monitoring.profiler.phase("playoffs"):
+            champion = functions.simulate_playoffs(self)
 
-        print("Champion: ", champion)
+        monitoring.logger.debug("Champion: %s", champion)
 
     def calculate_season_revenue(self, season):
         """
@@ -752,22 +878,22 @@ class League(object):
         season (int): Index of current season
 
         Update:
-        self.teamData (dataframe): The dataframe containing team information is updated with final revenue data
+        self.revenue, self.hockeyRevenue (np.ndarray): The columns of team data are updated with final revenue data
         """
         # calculate broadcasting revenue for this season
         currentBroadcastingRevenue = parameters.initialBroadcastingRevenue * (
                 1 + parameters.broadcastingRevenueGrowth) ** season
 
         # calculate hockey related seasonal revenue
-        self.teamData['revenue'] += currentBroadcastingRevenue
-        self.teamData['hockeyRevenue'] = self.teamData['revenue']
+        self.revenue += currentBroadcastingRevenue
+        self.hockeyRevenue[:] = self.revenue
 
         # add remaining budget to revenue
-        self.teamData['revenue'] += self.teamData['budget'] - self.teamData['payroll']
+        self.revenue += self.budget - self.payroll
 
         # round values
-        self.teamData['revenue'] = self.teamData['revenue'].round().astype(int)
-        self.teamData['hockeyRevenue'] = self.teamData['hockeyRevenue'].round().astype(int)
+        self.revenue[:] = self.revenue.round()
+        self.hockeyRevenue[:] = self.hockeyRevenue.round()
 
     def get_player_stats(self, combinedPlayersData):
         """
@@ -803,46 +929,27 @@ class League(object):
         Resets the league object for a new season simulation
 
         Update:
-        self.teamData (dataframe): team data is prepared for new season
+        self.budget, ..., self.wentBankrupt (np.ndarray): columns of team data are prepared for new season in place
         self.optimalDomesticPlayers (dict): reset to state of league initialisation
         self.optimalDomesticPlayersSet (set): reset to state of league initialisation
         self.optimalDomesticPlayersData (dataframe): reset to state of league initialisation
         self.finalPlayerSelection (dict): reset to state of league initialisation
         self.regularSeasonRanking (dataframe): reset to state of league initialisation
+        self.headToHead (array): reset to state of league initialisation
         """
-        # extract new team budgets which is revenue of previous season
-        budgets = self.teamData['revenue'].tolist()
-        hockeyRevenues = self.teamData['hockeyRevenue'].tolist()
-
-        # update teamData
-        self.teamData = pd.DataFrame({'team': parameters.teams,
-                                      'domestics': [0] * parameters.leagueSize,  # the number of domestic players
-                                      'imports': [0] * parameters.leagueSize,  # the number of import players
-                                      'budget': budgets,  # team budgets based on previous season revenues, references 'R_tot_it-1',
-                                      'salaryCap': [False] * parameters.leagueSize,  # create variable salary cap, references 'R_cap'
-                                      'effectiveBudget': [0] * parameters.leagueSize,  # create variable for the budget teams are allowed to spend
-                                      'payroll': [0] * parameters.leagueSize,  # create variable team payrolls, references 'sum(W_p * d_p)' in thesis
-                                      'totalSkill': [0] * parameters.leagueSize,  # create variable team skills, references 'S_i' in thesis
-                                      'revenue': [0] * parameters.leagueSize,  # create variable revenue, references 'R_tot_it' in thesis
-                                      'hockeyRevenue': hockeyRevenues,  # update hockey related revenues
-                                      'wins': [0] * parameters.leagueSize,  # create variable for win count
-                                      'games': [0] * parameters.leagueSize,  # create variable for game count
-                                      'rank': [0] * parameters.leagueSize,  # create variable for final regular season rank
-                                      'eliminatedRS': [0] * parameters.leagueSize,  # create binary variable indicating regular season elimination
-                                      'eliminatedPP': [0] * parameters.leagueSize,  # create binary variable indicating pre playoffs elimination
-                                      'eliminatedPR1': [0] * parameters.leagueSize,  # create binary variable indicating playoffs round 1 elimination
-                                      'eliminatedPR2': [0] * parameters.leagueSize,  # create binary variable indicating playoffs round 2 elimination
-                                      'eliminatedPR3': [0] * parameters.leagueSize,  # create binary variable indicating playoffs round 3 elimination
-                                      'champion': [0] * parameters.leagueSize,  # create binary variable indicating league champion
-                                      'wentBankrupt': [0] * parameters.leagueSize,  # create binary variable indicating if a team went bankrupt
-                                      'monetaryFactor': parameters.monetaryFactor,
-                                      'marketSize': parameters.marketSize,
-                                      'seasonPhaseFactor': parameters.seasonPhaseFactor,
-                                      'compBalanceEffect': parameters.compBalanceEffect})
+        # new team budgets are the revenues of previous season
+        self.budget[:] = self.revenue
+
+        # reset all other columns except hockey related revenues in place
+        for column, dtype in self.teamColumns:
+            if column not in ['budget', 'hockeyRevenue']:
+                getattr(self, column).fill(0)
+
         self.optimalDomesticPlayers = {}
         self.optimalDomesticPlayersSet = set()
         self.optimalDomesticPlayersData = pd.DataFrame()
         self.optimalImportPlayers = {}
         self.finalPlayerSelection = {}
         self.regularSeasonRanking = pd.DataFrame()
+        self.headToHead = np.zeros((parameters.leagueSize, parameters.leagueSize), dtype=int)
         self.leagueCondition = None
@@ -0,0 +1,156 @@
+import numpy as np
+import pandas as pd
+import statistics
+import parameters
+
+
+# define metrics whose estimates are monitored, a precision target can be given for each of them
+metrics = ['meanPlayerSalary',  # mean player salary over the played seasons of a simulation
+           'championshipShare',  # share of the played seasons of a simulation won by each team
+           'bankruptcyRate',  # 1 if a team went bankrupt in a simulation, 0 otherwise
+           'winPercentageDispersion']  # standard deviation of the winning percentages of teams, averaged over the played seasons of a simulation
+
+
+def get_simulation_metrics(teamResults, playerResults):
+    """
+    Description:
+    Function to calculate the monitored metrics of every simulation contained in the results. Only seasons which were
+    played are considered, metrics of a simulation without played season are missing
+
+    Input:
+    teamResults (data frame): data frame containing the team results of one or several simulations
+    playerResults (data frame): data frame containing the player salary results of the same simulations
+
+    Returns:
+    simulationMetrics (dict): dictionary with the metric as key and an array with one row per simulation and one
+    column per component of the metric as value, e.g. one column per team for the championship share
+    """
+    # define simulations in order of the results
+    simulations = pd.unique(teamResults['simulation'])
+
+    # extract results of played seasons
+    playedTeamResults = teamResults.loc[teamResults['validSeason']]
+    playedPlayerResults = playerResults.loc[playerResults['validSeason']]
+
+    # calculate winning percentage dispersion of every played season
+    winPercentages = playedTeamResults.assign(winPercentage=playedTeamResults['wins'] / playedTeamResults['games'])
+    dispersion = winPercentages.groupby(['simulation', 'season'])['winPercentage'].std(ddof=0).groupby('simulation').mean()
+
+    # calculate championship share of every team
+    championshipShare = playedTeamResults.pivot_table(index='simulation', columns='team', values='champion', aggfunc='mean')
+
+    # return metrics with one row per simulation
+    return {'meanPlayerSalary': playedPlayerResults.groupby('simulation')['mean'].mean().reindex(simulations).to_numpy()[:, None],
+            'championshipShare': championshipShare.reindex(index=simulations, columns=parameters.teams).to_numpy(),
+            'bankruptcyRate': 1 - teamResults.groupby('simulation', sort=False)['validSimulation'].first().reindex(simulations).to_numpy(dtype=float)[:, None],
+            'winPercentageDispersion': dispersion.reindex(simulations).to_numpy()[:, None]}
+
+
+# define monitor of the convergence of simulation estimates as class
+class ConvergenceMonitor(object):
+    def __init__(self, precisionTargets, confidenceLevel=0.95, minSimulations=30):
+        """
+        Description:
+        Initializes a monitor which tracks the running means and confidence intervals of the monitored metrics over
+        the completed simulations of a scenario. The estimates are converged once the half width of the confidence
+        interval of every component of every targeted metric is at most its precision target
+
+        Input:
+        precisionTargets (dict): Dictionary with the metric as key and the targeted confidence interval half width as
+        value, e.g. {'meanPlayerSalary': 2000, 'championshipShare': 0.01}
+        confidenceLevel (float): Confidence level of the confidence intervals, default is 0.95
+        minSimulations (int): Number of simulations required before the estimates can be converged, protects against
+        stopping on metrics without observed variation, default is 30
+
+        A convergence monitor object has the following attributes:
+        self.precisionTargets (dict): dictionary with the metric as key and the targeted confidence interval half width as value
+        self.quantile (float): quantile of the standard normal distribution of the confidence level
+        self.minSimulations (int): number of simulations required before the estimates can be converged
+        self.observations (dict): dictionary with the metric as key and a list of arrays with the metrics of the added
+        simulations, initialised with empty lists
+        """
+        # only known metrics can be targeted
+        unknownMetrics = set(precisionTargets) - set(metrics)
+        if unknownMetrics:
+            raise ValueError("Unknown metrics {}, known metrics are {}".format(sorted(unknownMetrics), metrics))
+
+        self.precisionTargets = precisionTargets
+        self.quantile = statistics.NormalDist().inv_cdf((1 + confidenceLevel) / 2)
+        self.minSimulations = minSimulations
+        self.observations = {metric: [] for metric in metrics}
+
+    def add_results(self, teamResults, playerResults):
+        """
+        Description:
+        Add the metrics of completed simulations
+
+        Input:
+        teamResults (data frame): data frame containing the team results of one or several simulations
+        playerResults (data frame): data frame containing the player salary results of the same simulations
+        """
+        for metric, values in get_simulation_metrics(teamResults, playerResults).items():
+            self.observations[metric].append(values)
+
+    def get_estimates(self):
+        """
+        Description:
+        Calculate the running means and confidence interval half widths of all metrics, missing observations are ignored
+
+        Returns:
+        estimates (data frame): data frame with the metric, component, number of observations, mean, confidence
+        interval half width, precision target and convergence indicator of every component of every metric
+        """
+        # initialise list of estimates
+        estimates = []
+
+        # for each metric
+        for metric in metrics:
+            # combine observations of all simulations
+            values = np.concatenate(self.observations[metric])
+            observed = ~np.isnan(values)
+            count = observed.sum(axis=0)
+
+            # calculate mean and standard error of every component
+            mean = np.where(count > 0, np.nansum(values, axis=0) / np.maximum(count, 1), np.nan)
+            variance = np.where(count > 1, np.nansum((values - mean) ** 2, axis=0) / np.maximum(count - 1, 1), np.inf)
+            halfWidth = self.quantile * np.sqrt(variance / np.maximum(count, 1))
+
+            # add estimates of metric
+            target = self.precisionTargets.get(metric, np.nan)
+            estimates.append(pd.DataFrame({'metric': metric,
+                                           'component': parameters.teams if metric == 'championshipShare' else [metric],
+                                           'observations': count, 'mean': mean, 'halfWidth': halfWidth,
+                                           'target': target, 'converged': halfWidth <= target}))
+
+        # return estimates
+        return pd.concat(estimates, ignore_index=True)
+
+    def is_converged(self):
+        """
+        Description:
+        Check if the precision targets of all targeted metrics are met
+
+        Returns:
+        converged (bool): True if enough simulations were added and all targeted estimates are precise enough
+        """
+        # estimates are not converged before the minimal number of simulations
+        if sum(len(values) for values in self.observations['bankruptcyRate']) < self.minSimulations:
+            return False
+
+        # check precision of targeted metrics
+        estimates = self.get_estimates()
+        return bool(estimates.loc[estimates['metric'].isin(list(self.precisionTargets)), 'converged'].all())
+
+    def get_summary(self):
+        """
+        Description:
+        Summarise the precision of all targeted metrics in one line, by the widest confidence interval of each metric
+
+        Returns:
+        summary (str): Number of simulations and the widest confidence interval half width and target of each metric
+        """
+        estimates = self.get_estimates()
+        simulations = sum(len(values) for values in self.observations['bankruptcyRate'])
+        precision = ["{} ±{:.4g} (target {:.4g})".format(metric, estimates.loc[estimates['metric'] == metric, 'halfWidth'].max(), target)
+                     for metric, target in self.precisionTargets.items()]
+        return "{} simulations, {}".format(simulations, ", ".join(precision))
@@ -0,0 +1,46 @@
+import argparse
+import itertools as it
+import monitoring
+import workQueue
+
+# farm parameters
+spoolDirectory = "results/spool"  # directory shared by coordinator and all workers, on a file system shared by all machines
+allowedImportsGrid = [4, 6, 10]  # the numbers of allowed import players per team to simulate, references 'rho' in thesis
+salaryCapGrid = [True, False]  # the salary cap indicators to simulate, references 'R_cap' in thesis
+seasons = 10  # the number of consecutive seasons to simulate in one simulation, references 't' in thesis
+simulationNumber = 1000  # the number of times the simulation shall be repeated per scenario
+solver = "exact"  # the solver used by teams for skill maximization, 'exact' = in-process exact engine, 'cbc' = PuLP with CBC
+batchSize = 1  # the number of simulations whose seasons are played together on arrays, 1 = simulations are run one after another
+taskSize = 50  # the number of simulations per task claimed by a worker
+seed = None  # master seed shared by all scenarios (common random numbers), None = fresh entropy which is printed
+heartbeatInterval = 30  # seconds between two heartbeats of a worker
+heartbeatTimeout = 300  # seconds without heartbeat after which the task of a worker is reclaimed, should exceed clock differences between machines
+pollInterval = 10  # seconds a worker waits before looking for tasks again while tasks of other workers are running
+resultFormat = "csv"  # the format of the merged results, 'csv' = one csv file per scenario, 'parquet' or 'feather' = columnar datasets partitioned by scenario, requires pyarrow
+verbosity = "quiet"  # the output while simulating, 'quiet' = progress reports and warnings, 'info' = also every simulation, 'debug' = also every stage of every season
+reportInterval = 30  # seconds between two progress reports of simulations/s, seasons/s, ETA, bankruptcies and solver share of time
+progressFile = None  # file to which every progress report is appended as JSON line, None = no file
+
+# run role given on the command line only when executed as script
+if __name__ == "__main__":
+
+    # configure output
+    monitoring.configure_logging(verbosity, reportInterval, progressFile)
+
+    # read role of this process
+    parser = argparse.ArgumentParser(description="Simulate scenarios with workers sharing a spool directory")
+    parser.add_argument("role", choices=["coordinator", "worker", "merge"],
+                        help="coordinator = create tasks, worker = simulate tasks until none are left, merge = save results of all tasks")
+    role = parser.parse_args().role
+
+    # create tasks of all scenarios
+    if role == "coordinator":
+        workQueue.create_tasks(spoolDirectory, list(it.product(allowedImportsGrid, salaryCapGrid)), seasons, simulationNumber, solver, batchSize, taskSize, seed)
+
+    # simulate tasks
+    elif role == "worker":
+        workQueue.run_worker(spoolDirectory, heartbeatInterval, heartbeatTimeout, pollInterval)
+
+    # save results of all tasks
+    else:
+        workQueue.merge_tasks(spoolDirectory, resultFormat)
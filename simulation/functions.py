@@ -1,10 +1,11 @@
 import parameters
-from pulp import PULP_CBC_CMD
 import numpy as np
 import pandas as pd
-import pulp as pl
-import random as ra
 import itertools as it
+import math
+import time
+import solvers
+import monitoring
 
 
 def supply_effect(playerPoolSize):
@@ -30,66 +31,101 @@ def supply_effect(playerPoolSize):
         return parameters.pLambda / (playerPoolSize - parameters.pGamma)
 
 
-def skill_maximization(playerPool, teamBudget, selectionSize):
+def get_skill_classes(allPlayersData):
     """
     Description:
-    Function which allows team to select players while maximizing skill given a team size and budget constraint
+    Function to compress the players of a player pool into classes of players with identical skill and salary
+
+    Input:
+    allPlayersData (dataframe): A dataframe with information about all players in the player pool
+
+    Returns:
+    skillClasses (dataframe): A dataframe with one row per skill class containing skill, salary, the number of players
+    and the list of players in the class
+    """
+    # group players by skill and salary
+    skillClasses = allPlayersData.groupby(['skill', 'salary'])['player'].agg(list).reset_index(name='players')
+
+    # add the number of players per class
+    skillClasses.insert(loc=2, column='count', value=skillClasses['players'].map(len))
+
+    # return skill classes
+    return skillClasses
+
+
+def skill_maximization(playerPool, teamBudget, selectionSize, solver="exact"):
+    """
+    Description:
+    Function which allows team to select players while maximizing skill given a team size and budget constraint. The
+    problem is formulated as bounded knapsack over the skill classes of the player pool
 
     Input:
     playerPool (PlayerPool): A player pool of either object DomesticPlayerPool or ForeignPlayerPool
     teamBudget (int): The budget constraint for a particular team used to optimize skill
     selectionSize (int): The number of players to be selected as condition
+    solver (str, SolverBackend): The solver backend or the name of a backend in solvers.solverBackends,
+    'cbc' = PuLP model solved with CBC, 'exact' = in-process exact knapsack engine exploiting skills rounded to 0.01
+    whose table is built once per player pool, default is 'exact'
 
     Returns:
-    selectedPlayers (pandas dataframe): A pandas dataframe which includes data about selected domestic players by team
+    selectedPlayers (pandas dataframe): A pandas dataframe which includes data about selected domestic players by team,
+    the solution status is reported in attribute 'solverStatus' of the dataframe
+
+    Results are cached by the fingerprint of the pool, the budget, the selection size and the solver so that
+    identical problems, e.g. of teams whose budgets are clipped to the salary cap, are solved only once
     """
 
     # initialize variables
     playerData = playerPool.allPlayersData  # get data from all players as data frame
-    players = playerPool.get_all_players()  # get all players as list
-    skills = playerPool.get_all_player_skills()  # get skill levels of all players as list
-    salaries = playerPool.get_all_player_salaries()  # get salaries of all players as list
-    binaries = [pl.LpVariable(  # initialise list of binary variables, one for each player
-        players[i],  # name the variables: d_player
-        cat="Binary") for i in range(len(players))]  # iterate through all players
-
-    # initialize problem
-    prob = pl.LpProblem(name="BestTeam", sense=-1)  # sense=-1 indicates maximization problem
-
-    # define objective function
-    prob += pl.lpSum(binaries[i] * skills[i] for i in range(len(players)))  # maximize skill
-
-    # define the constraints
-    prob += pl.lpSum(binaries[i] for i in range(len(players))) <= selectionSize  # team size constraint
-    prob += pl.lpSum(binaries[i] * salaries[i] for i in range(len(players))) <= teamBudget  # budget constraint
-
-    # solve problem to obtain the optimal solution (best team)
-    prob.solve(solver=PULP_CBC_CMD(msg=False, timeLimit=30))
-
-    # initialize empty lists for the variable names and solution values
-    variables = []
-    solutions = []
-
-    # write each variable name and solution value to the lists
-    for v in prob.variables():
-        variable = v.name
-        solution = v.varValue
-        variables.append(variable)  # append variable name to existing list
-        solutions.append(solution)  # append solution value to existing list
-
-    # obtain selected players
-    solutions = np.array(solutions).astype(int)  # define solution values as integers (binary)
-    solutionDF = pd.DataFrame(  # define a data frame with all variables and according optimal values
-        data=np.array([variables, solutions]).T,  # .T makes sure to convert the 2xn matrix to a nx2 matrix
-        columns=['Variable', 'Optimal Value']
-    )
-    solutionDF['Optimal Value'] = solutionDF['Optimal Value'].astype(int)  # define column as binary
-    solutionDF = solutionDF[solutionDF['Optimal Value'] == 1]  # filter selected players
-    selectedPlayers = playerData.loc[  # create data frame with information about selected players
-        playerData['player'].isin(  # filter players in array
-            solutionDF['Variable'].tolist()  # select column with player and define them as integer
-        )
-    ]
+    backend = solvers.get_backend(solver)  # get solver backend
+
+    # look up result of the same problem in cache
+    cacheKey = (playerPool.fingerprint, int(teamBudget), selectionSize, backend.name)
+    cachedResult = solvers.resultCache.get(cacheKey)
+
+    # start timer of solve
+    startTime = time.perf_counter()
+
+    # if the same problem was solved before
+    if cachedResult is not None:
+
+        # reuse solution
+        selectedCounts, status, objective = cachedResult
+
+    # if the problem was not solved before
+    else:
+
+        # solve problem to obtain the optimal solution (best team)
+        selectedCounts, status, objective = backend.solve(playerPool, teamBudget, selectionSize)
+
+        # add result to cache
+        solvers.resultCache.put(cacheKey, (selectedCounts, status, objective))
+
+    # add time of solve to total solver time
+    solveTime = time.perf_counter() - startTime
+    solvers.telemetry.totalTime += solveTime
+
+    # record solve
+    if solvers.telemetry.enabled:
+        bound, gap = solvers.get_bound(playerPool, teamBudget, selectionSize, status, objective)
+        solvers.telemetry.record(pool=type(playerPool).__name__, solver=backend.name, cached=cachedResult is not None,
+                                 time=solveTime, status=status, objective=objective,
+                                 bound=bound, gap=gap, classes=len(playerPool.skillClasses),
+                                 players=len(playerData), selectionSize=selectionSize, budget=teamBudget)
+
+    # obtain selected players from their classes
+    selectedPlayersList = playerPool.get_class_players(selectedCounts)
+
+    # create data frame with information about selected players
+    selectedPlayers = playerData.loc[playerData['player'].isin(selectedPlayersList)]
+
+    # report solution status with the selected players
+    selectedPlayers.attrs['solverStatus'] = status
+
+    # if optimality of solution is not proven
+    if status != solvers.optimalStatus:
+        # warning message
+        monitoring.logger.warning("Warning! Skill maximization returned a solution with status '%s'", status)
 
     # assert that constraints hold since the solver does not throw an error when not converging to a solution
     assert len(selectedPlayers) <= selectionSize
@@ -113,45 +149,45 @@ def identify_conflicts(leagueObject):
     """
     # get required team information
     optimalDomesticPlayers = leagueObject.optimalDomesticPlayers
-    optimalDomesticPlayersSet = leagueObject.optimalDomesticPlayersSet
 
-    # create a data frame from dictionary
-    optimalDomesticPlayersDF = pd.concat(
-        pd.DataFrame({'team': k, 'player': v}) for k, v in optimalDomesticPlayers.items())
+    # collect all teams interested in the same player in team order, players are kept in order of first selection
+    # instead of set order so that the conflicts do not depend on string hashing of the process
+    interestedTeamsDict = {}
+    for team, players in optimalDomesticPlayers.items():
+        for player in players:
+            interestedTeamsDict.setdefault(player, []).append(team)
 
     # initialise empty dictionaries to be filled with observed conflicts and non conflicts
     conflicts = {}
     noConflicts = {}
 
     # loop over all players to identify conflicts
-    for player in optimalDomesticPlayersSet:
-
-        # extract all teams interested in the same player
-        interestedTeams = optimalDomesticPlayersDF.loc[optimalDomesticPlayersDF['player'] == player]
+    for player, interestedTeams in interestedTeamsDict.items():
 
         # if more than one team are interested in one player
         if len(interestedTeams) > 1:
 
             # add player as key and list of interested teams as value to the conflicts dictionary
-            conflicts[player] = interestedTeams.team.tolist()
+            conflicts[player] = interestedTeams
 
         # if only one team wants to acquire a player
         else:
 
             # add player as key and list containing interested team as value to the non conflicts dictionary
-            noConflicts[player] = interestedTeams.team.tolist()
+            noConflicts[player] = interestedTeams
 
     # return dictionaries
     return conflicts, noConflicts
 
 
-def shuffle_conflicts(conflicts):
+def shuffle_conflicts(conflicts, rng):
     """
     Description:
     Function to shuffle order of conflicts to be solved
 
     Input:
     conflicts (dict): A dictionary which contains all players as key and a list of interested teams as values
+    rng (np.random.Generator): The random number generator of the simulation
 
     Returns:
     shuffledConflicts (dict): The same dictionary as input but now with shuffled conflicts (changed order)
@@ -161,7 +197,7 @@ def shuffle_conflicts(conflicts):
     conflictItems = list(conflicts.items())
 
     # shuffle the tuples
-    ra.shuffle(conflictItems)
+    rng.shuffle(conflictItems)
 
     # create a shuffled dictionary
     shuffledConflicts = dict(conflictItems)
@@ -203,12 +239,12 @@ def update_team_info(leagueObject, allPlayersData):
     leagueObject (League): The initialised league object of class League
     allPlayersData (dataframe): A dataframe with information about all players in the player pool created when player pool was initialised
 
-    Returns:
-    teamData (dataframe): Updates and returns information about the teams in a dataframe
+    Updates:
+    leagueObject.payroll, leagueObject.totalSkill, leagueObject.domestics, leagueObject.imports (np.ndarray): Columns
+    with information about the teams
     """
     # get required team information
     finalPlayerSelection = leagueObject.finalPlayerSelection
-    teamData = leagueObject.teamData
 
     # define numeric variables to obtain and summarize
     variableName = ['salary', 'skill']
@@ -225,11 +261,11 @@ def update_team_info(leagueObject, allPlayersData):
         # if variable is 'salary'
         if variable == 'salary':
             # append a list of all team salaries to the column 'payroll'
-            teamData['payroll'] = list(variableSumDict.values())
+            leagueObject.payroll[:] = list(variableSumDict.values())
 
         if variable == 'skill':
             # append a list of all team salaries to the column 'totalSkill'
-            teamData['totalSkill'] = list(variableSumDict.values())
+            leagueObject.totalSkill[:] = list(variableSumDict.values())
 
     # list of all players
     playerList = [player for teamList in finalPlayerSelection.values() for player in teamList]
@@ -254,27 +290,25 @@ def update_team_info(leagueObject, allPlayersData):
             importPlayers[team] = imports
 
         # add player numbers to team data
-        teamData['domestics'] = list(domesticPlayers.values())
-        teamData['imports'] = list(importPlayers.values())
-
-    # return
-    return teamData
+        leagueObject.domestics[:] = list(domesticPlayers.values())
+        leagueObject.imports[:] = list(importPlayers.values())
 
 
-def player_chooses_team(interestedTeams):
+def player_chooses_team(interestedTeams, rng):
     """
     Description:
     Function representing the decision rule if a player has to choose between teams
 
     Input:
     interestedTeams (list): list of teams interested in player
+    rng (np.random.Generator): The random number generator of the simulation
 
     Returns:
     decision (str): The team team the player has chosen
     """
 
     # let player decide for one team
-    decision = ra.choice(interestedTeams)
+    decision = interestedTeams[rng.integers(len(interestedTeams))]
 
     # return player decision
     return decision
@@ -294,8 +328,8 @@ def teams_choose_replacement(player, team, domesticPlayerPool, leagueObject):
     Returns:
     replacementPlayer (int): The replacement player (number)
     """
-    # get required team information
-    teamData = leagueObject.teamData
+    # get team id
+    teamId = leagueObject.teamIndex[team]
 
     # get required player information
     allPlayersData = domesticPlayerPool.allPlayersData
@@ -311,10 +345,10 @@ def teams_choose_replacement(player, team, domesticPlayerPool, leagueObject):
     availablePlayersData.sort_values('skillGab', inplace=True, ignore_index=True)
 
     # identify current team payroll
-    teamPayroll = teamData.loc[teamData['team'] == team, 'payroll'].values[0]
+    teamPayroll = leagueObject.payroll[teamId]
 
     # identify team budget
-    teamBudget = teamData.loc[teamData['team'] == team, 'effectiveBudget'].values[0]
+    teamBudget = leagueObject.effectiveBudget[teamId]
 
     # initialise index for loop
     index = 0
@@ -406,7 +440,7 @@ def simulate_game(homeTeam, skillHomeTeam, awayTeam, skillAwayTeam, leagueObject
         leagueObject.calculate_game_revenue(homeTeam, winPercentageHome, seasonPhase)
 
     # determine whether or not home team wins
-    homeVictory = ra.choices([True, False], [winPercentageHome, 1 - winPercentageHome])[0]
+    homeVictory = leagueObject.rng.random() < winPercentageHome
 
     # if home team in pairing has won
     if homeVictory:
@@ -421,228 +455,303 @@ def simulate_game(homeTeam, skillHomeTeam, awayTeam, skillAwayTeam, leagueObject
         return awayTeam
 
 
-def placement_games(equalTeams, leagueObject):
+def placement_games(skills, rng):
     """
     Description:
     Function to simulate placement games where teams replay each other for ranking when they are equally ranked and have
-    a balanced score in direct  confrontation
+    a balanced score in direct confrontation. In each round every team plays one game against each other team, all
+    games of a round are drawn at once. Placement games do not affect revenues
 
     Input:
-    equalTeams (list): List of all teams which have same  number of wins
-    leagueObject (League): The initialised league object of class League
+    skills (np.ndarray): Skills of all teams which have the same number of wins
+    rng (np.random.Generator): The random number generator of the simulation
 
     Returns:
-    finalPlacementRanking (dataframe): Dataframe with a ranking of the placement games
+    placementOrder (np.ndarray): Positions of the teams in skills ordered by placement ranking
     """
+    # create each possible team pairing for placement round, one game against each opponent
+    homeTeams, awayTeams = np.array(list(it.combinations(range(len(skills)), 2))).T
+
+    # calculate winning-percentage of first team in each pairing
+    winPercentageHome = skills[homeTeams] / (skills[homeTeams] + skills[awayTeams])
+
+    # determine whether or not first team wins in each pairing
+    homeVictory = rng.random(len(homeTeams)) < winPercentageHome
+
+    # count wins of every team against every other team in placement round
+    placementHeadToHead = np.zeros((len(skills), len(skills)), dtype=int)
+    placementHeadToHead[np.where(homeVictory, homeTeams, awayTeams), np.where(homeVictory, awayTeams, homeTeams)] = 1
 
-    # initialise skillDictionary
-    skillDictionary = leagueObject.get_skill_dictionary()
+    # rank teams by placement wins and resolve ties of the placement round by the same rules
+    placementOrder = rank_teams(placementHeadToHead.sum(axis=1), placementHeadToHead, skills, rng)
 
-    # initialise placement decision status
-    placementDecision = False
+    return placementOrder
 
-    # while no decision in placement games
-    while not placementDecision:
 
-        # initialise empty ranking
-        placementRanking = pd.DataFrame({'rank': [0] * len(equalTeams),
-                                         'team': equalTeams,
-                                         'wins': [0] * len(equalTeams)
-                                         })
+def rank_teams(wins, headToHead, skills, rng):
+    """
+    Description:
+    Function to rank teams by wins and to resolve ties. Teams with the same number of wins are ranked by their wins in
+    direct confrontation among each other, which is repeated for teams still equal among them. If all teams in a tie
+    have the same number of direct wins, placement games are played. All tie groups of a level are resolved at once,
+    the final ranking is a lexicographic sort of all levels
+
+    Input:
+    wins (np.ndarray): Number of wins of every team
+    headToHead (np.ndarray): Matrix with the number of wins of the row team against the column team
+    skills (np.ndarray): Skill of every team, used for placement games
+    rng (np.random.Generator): The random number generator of the simulation, used for placement games
 
-        # initialise record of all game outcomes
-        placementGamesRecord = pd.DataFrame({'homeTeam': [], 'awayTeam': [], 'winner': []})
+    Returns:
+    order (np.ndarray): Positions of the teams ordered from first to last rank
+    """
+    # initialise keys of ranking with number of wins
+    keys = [np.asarray(wins)]
 
-        # create each possible team pairing for placement round, one game against each opponent, one team is away one home but it does not affect revenue
-        placementPairings = list(it.combinations(equalTeams, 2))
+    # as long as there are ties
+    while True:
 
-        # for each pairing
-        for pairing in placementPairings:
-            # extract skills of both teams
-            homeTeam = pairing[0]
-            awayTeam = pairing[1]
-            skillHomeTeam = skillDictionary[homeTeam]
-            skillAwayTeam = skillDictionary[awayTeam]
+        # identify groups of teams which are equal in all keys so far
+        groups = np.unique(np.stack(keys, axis=1), axis=0, return_inverse=True)[1].reshape(-1)
+        groupSizes = np.bincount(groups)
 
-            # simulate game between team pairing
-            winner = simulate_game(homeTeam, skillHomeTeam, awayTeam, skillAwayTeam, leagueObject,
-                                   parameters.regularSeason, placementGame=True)
+        # if all teams are ranked unambiguously
+        if groupSizes.max() == 1:
+            break
 
-            # add a win to the winning team's record
-            placementRanking.loc[placementRanking['team'] == winner, 'wins'] += 1
+        # calculate direct wins of each team against the teams of its group
+        sameGroup = groups[:, None] == groups[None, :]
+        directWins = (headToHead * sameGroup).sum(axis=1)
 
-            # sort ranking
-            placementRanking.sort_values('wins', ignore_index=True, inplace=True, ascending=False)
+        # identify groups where all teams have the exact same number of direct wins
+        maximalDirectWins = np.full(len(groupSizes), directWins.min())
+        minimalDirectWins = np.full(len(groupSizes), directWins.max())
+        np.maximum.at(maximalDirectWins, groups, directWins)
+        np.minimum.at(minimalDirectWins, groups, directWins)
+        balancedGroups = (groupSizes > 1) & (maximalDirectWins == minimalDirectWins)
 
-            # newPlacementRecord
-            newRecord = pd.DataFrame(
-                {'homeTeam': [homeTeam], 'awayTeam': [awayTeam], 'winner': [winner]})
+        # for each balanced group play placement games, the placement ranking becomes the next key
+        for group in np.flatnonzero(balancedGroups):
+            groupTeams = np.flatnonzero(groups == group)
+            directWins[groupTeams[placement_games(skills[groupTeams], rng)]] = np.arange(len(groupTeams), 0, -1)
 
-            # concat new record with record of previous games
-            placementGamesRecord = pd.concat([placementGamesRecord, newRecord], ignore_index=True)
+        # add direct wins as next key
+        keys.append(directWins)
 
-        # recursively call solve_ranking_conflicts
-        finalPlacementRanking = solve_ranking_conflicts(placementRanking, placementGamesRecord, leagueObject)
+    # sort lexicographically by all keys in decreasing order
+    order = np.lexsort([-key for key in keys[::-1]])
 
-        # if ranking is resolved
-        if len(set(finalPlacementRanking['rank'].tolist())) == len(equalTeams):
-            # return final ranking
-            return finalPlacementRanking
+    return order
 
 
-def solve_ranking_conflicts(ranking, record, leagueObject):
+def solve_ranking_conflicts(ranking, headToHead, leagueObject):
     """
     Description:
     Function to solve ranking conflicts when two teams have same number of wins (and thus winning percentage)
 
     Input:
     ranking (dataframe): Dataframe containing ranking with calculated winning percentages
-    record (dataframe): Dataframe containing the record of all games played
+    headToHead (np.ndarray): Matrix with the number of wins of the row team against the column team by team id
     leagueObject (League): The initialised league object of class League
 
     Returns:
     resolvedRanking (dataframe): Dataframe with unambiguous ranking for all teams
     """
-    # initialise row
-    row = 0
+    # get team ids and skills of teams in ranking
+    teamIds = ranking['team'].map(leagueObject.teamIndex).to_numpy()
+    skills = np.round(leagueObject.totalSkill[teamIds], 2)
 
-    # go through ranking row by row from top down
-    while row < len(ranking):
+    # rank teams and resolve ties
+    order = rank_teams(ranking['wins'].to_numpy(), headToHead[np.ix_(teamIds, teamIds)], skills, leagueObject.rng)
 
-        # extract number of wins
-        winNumber = ranking.loc[row, 'wins']
+    # sort teams based on resolved ranking and assign ranks
+    resolvedRanking = ranking.iloc[order].reset_index(drop=True)
+    resolvedRanking['rank'] = np.arange(1, len(resolvedRanking) + 1)
 
-        # if no other team had the same number of wins
-        if sum(ranking['wins'] == winNumber) == 1:
+    # return resolved ranking final
+    return resolvedRanking
 
-            # assign rank to the team
-            ranking.iloc[row, 0] = row + 1
 
-            # go to next iteration
-            row += 1
+def draw_uniform(rngs, shape):
+    """
+    Description:
+    Function to draw uniform random numbers for several independent leagues, each league draws from its own generator
+    so that results do not depend on which leagues are simulated together
+
+    Input:
+    rngs (list): List with the random number generator of every league
+    shape (tuple): Shape of the draws of one league
+
+    Returns:
+    draws (np.ndarray): Array of shape (leagues, *shape) with uniform random numbers in [0, 1)
+    """
+    return np.stack([rng.random(shape) for rng in rngs])
 
-        # if there are other teams with the same number of wins
-        else:
 
-            # identify all teams with same number of wins
-            equalTeams = ranking.loc[ranking['wins'] == winNumber, 'team'].tolist()
+def play_regular_season_games(skills, rngs):
+    """
+    Description:
+    Function to play all regular season games of one or several independent leagues at once. Every team faces every
+    other team in a number of home games
 
-            # extract all direct games between these teams
-            directRecord = record.loc[(record['homeTeam'].isin(equalTeams)) & (record['awayTeam'].isin(equalTeams))]
+    Input:
+    skills (array): Array of shape (leagues, teams) with the skill of every team in every league
+    rngs (list): List with the random number generator of every league
 
-            # calculate the direct wins by each team
-            directWins = [len(directRecord.loc[directRecord['winner'] == team]) for team in equalTeams]
+    Returns:
+    homeTeams (array): Index of home team of every pairing
+    awayTeams (array): Index of away team of every pairing
+    winPercentageHome (array): Array of shape (leagues, pairings) with the winning percentage of the home team
+    winners (array): Array of shape (leagues, games) with the index of the winning team of every game, games are
+    ordered by pairing and home game
+    headToHead (array): Array of shape (leagues, teams, teams) with the number of wins of the row team against the
+    column team
+    """
+    # get number of leagues and teams
+    leagueNumber, teamNumber = skills.shape
 
-            # if all teams have the exact same number of direct wins against each other
-            if len(set(directWins)) == 1:
+    # create pairings that each team faces any other team at home and away (first team is home team)
+    homeTeams, awayTeams = np.array(list(it.permutations(range(teamNumber), 2))).T
 
-                # play placement games
-                placementRanking = placement_games(equalTeams, leagueObject)
+    # calculate winning-percentage of home team in each pairing
+    winPercentageHome = skills[:, homeTeams] / (skills[:, homeTeams] + skills[:, awayTeams])
 
-                # for each entry in resolved direct ranking
-                for index in range(len(placementRanking)):
-                    # identify team
-                    team = placementRanking.loc[index, "team"]
+    # determine for every home game of every pairing whether or not home team wins
+    homeVictory = draw_uniform(rngs, (len(homeTeams), parameters.regularSeasonHomeGames)) < winPercentageHome[:, :, None]
 
-                    # assign this team the correct ranking
-                    ranking.loc[ranking['team'] == team, 'rank'] = row + 1
+    # identify winners and losers of every game
+    winners = np.where(homeVictory, homeTeams[:, None], awayTeams[:, None]).reshape(leagueNumber, -1)
+    losers = np.where(homeVictory, awayTeams[:, None], homeTeams[:, None]).reshape(leagueNumber, -1)
 
-                    # increase row by 1
-                    row += 1
+    # count wins of every team against every other team
+    headToHead = np.zeros((leagueNumber, teamNumber, teamNumber), dtype=int)
+    np.add.at(headToHead, (np.arange(leagueNumber)[:, None], winners, losers), 1)
 
-            # if not all teams have an equal number of wins against each other
-            else:
-                # initialise empty ranking to fill with direct record among equal teams
-                directRanking = pd.DataFrame({'rank': [0] * len(equalTeams),
-                                              'team': equalTeams,
-                                              'wins': directWins})
+    # return games
+    return homeTeams, awayTeams, winPercentageHome, winners, headToHead
 
-                # sort direct ranking dataframe based on wins
-                directRanking.sort_values('wins', ignore_index=True, inplace=True, ascending=False)
 
-                # recursively call this function with direct rankin, direct record and leagueObject
-                resolvedDirectRanking = solve_ranking_conflicts(directRanking, directRecord, leagueObject)
+def get_revenue_coefficients():
+    """
+    Description:
+    Function to build the table of revenue coefficients of all teams once from parameters. As the revenue of a home game
+    only depends on the winning percentage of the home team w, it is calculated as factor * (linear * w - quadratic * w^2)
+    where the factor depends on the season phase
 
-                # for each entry in resolved direct ranking
-                for index in range(len(resolvedDirectRanking)):
-                    # identify team
-                    team = resolvedDirectRanking.loc[index, "team"]
+    Returns:
+    revenueCoefficients (array): Array of shape (5, teams) where the rows 0, 1 and 2 contain the factor of each team in
+    the season phase of same index, row 3 the linear and row 4 the quadratic coefficient
+    """
+    # extract parameters of all teams
+    monetaryFactor = np.array(parameters.monetaryFactor)
+    seasonPhaseFactor = np.array(parameters.seasonPhaseFactor)
 
-                    # assign this team the correct ranking
-                    ranking.loc[ranking['team'] == team, 'rank'] = row + 1
+    # create table of coefficients
+    revenueCoefficients = np.array([monetaryFactor * seasonPhaseFactor[:, 0],  # regular season
+                                    monetaryFactor * seasonPhaseFactor[:, 1],  # pre playoffs
+                                    monetaryFactor * seasonPhaseFactor[:, 1],  # playoffs
+                                    np.array(parameters.marketSize, dtype=float),
+                                    np.array(parameters.compBalanceEffect) / 2])
 
-                    # increase row by 1
-                    row += 1
+    return revenueCoefficients
 
-    # Sort teams based on resolved ranking
-    ranking.sort_values('rank', inplace=True, ignore_index=True)
 
-    # return resolved ranking final
-    return ranking
+# table of revenue coefficients of all teams
+revenueCoefficients = get_revenue_coefficients()
 
 
-def simulate_regular_season(leagueObject):
+def calculate_game_revenues(homeTeams, winPercentageHome, seasonPhase):
     """
     Description:
-    Function to simulate an entire regular season based on team skills
+    Function to calculate the revenue of the home teams in many games at once
 
     Input:
-    leagueObject (League): The initialised league object of class League
+    homeTeams (array): Index of home team of every game
+    winPercentageHome (array): The winning percentage of the home team of every game
+    seasonPhase (int): Integer defining in which phase of season we are, 0 = Regular Season, 1 or 2 = pre playoffs
+    and playoffs respectively
 
     Returns:
-    ranking (dataframe): Return ranking of regular season
+    gameRevenues (array): Revenue of the home team of every game
     """
+    # calculate game revenues from coefficients of home teams
+    gameRevenues = revenueCoefficients[seasonPhase, homeTeams] * (
+            revenueCoefficients[3, homeTeams] * winPercentageHome - revenueCoefficients[4, homeTeams] * winPercentageHome ** 2)
 
-    # create skill dictionary
-    skillDictionary = leagueObject.get_skill_dictionary()
+    return gameRevenues
 
-    # initialise empty ranking
-    ranking = pd.DataFrame({'rank': [0] * len(parameters.teams),
-                            'team': list(skillDictionary.keys()),
-                            'skill': list(skillDictionary.values()),  # add column skill to dataframe
-                            'wins': [0] * len(parameters.teams),
-                            'games': [0] * len(parameters.teams),
-                            'winningPercentage': ['-'] * len(parameters.teams)})
 
-    # initialise record of all game outcomes
-    record = pd.DataFrame({'homeTeam': [], 'awayTeam': [], 'winner': []})
+def calculate_regular_season_revenues(skills):
+    """
+    Description:
+    Function to calculate the revenue of all teams from their regular season home games. As game revenues do not depend
+    on the outcome of games, the regular season revenue follows from team skills alone
 
-    # create pairings that each team faces any other team at home and away (first team is home team)
-    pairings = list(it.permutations(parameters.teams, 2))
+    Input:
+    skills (array): Array of shape (teams,) or (leagues, teams) with the skill of every team
 
-    # for each pairing
-    for pairing in pairings:
+    Returns:
+    regularSeasonRevenues (array): Array of same shape as skills with the regular season revenue of every team
+    """
+    # calculate winning percentage of row team at home against column team
+    winPercentageHome = skills[..., :, None] / (skills[..., :, None] + skills[..., None, :])
+
+    # calculate revenue of row team in home game against column team
+    teamIndex = np.arange(skills.shape[-1])[:, None]
+    gameRevenues = calculate_game_revenues(teamIndex, winPercentageHome, parameters.regularSeason)
+
+    # sum up revenues of all home games without games against the team itself
+    regularSeasonRevenues = parameters.regularSeasonHomeGames * (gameRevenues.sum(axis=-1) - np.diagonal(gameRevenues, axis1=-2, axis2=-1))
 
-        # extract names and skills of both teams
-        homeTeam = pairing[0]
-        awayTeam = pairing[1]
-        skillHomeTeam = skillDictionary[homeTeam]
-        skillAwayTeam = skillDictionary[awayTeam]
+    return regularSeasonRevenues
 
-        # initialise game count
-        game = 1
 
-        # as long as not 2 games have been played (two home games against each opponent)
-        while game < 3:
-            # simulate game between team pairing
-            winner = simulate_game(homeTeam, skillHomeTeam, awayTeam, skillAwayTeam,
-                                   leagueObject, parameters.regularSeason)
+def calculate_series_revenues(higherRankedTeams, lowerRankedTeams, winPercentageHigher, seriesLength, seasonPhase):
+    """
+    Description:
+    Function to calculate the revenue of both teams in playoff series from the realized series lengths. The higher ranked
+    team plays at home in the first game and every other game thereafter
 
-            # add a win to the winning team's record
-            ranking.loc[ranking['team'] == winner, 'wins'] += 1
+    Input:
+    higherRankedTeams (array): Index of the higher ranked team of every series
+    lowerRankedTeams (array): Index of the lower ranked team of every series
+    winPercentageHigher (array): Winning percentage of the higher ranked team of every series
+    seriesLength (array): Number of games played in every series
+    seasonPhase (int): Integer defining in which phase of season we are, 1 or 2 = pre playoffs and playoffs respectively
 
-            # create a new record for this game
-            newRecord = pd.DataFrame(
-                {'homeTeam': [homeTeam], 'awayTeam': [awayTeam], 'winner': [winner]})
+    Returns:
+    higherRankedRevenue (array): Revenue of the higher ranked team of every series
+    lowerRankedRevenue (array): Revenue of the lower ranked team of every series
+    """
+    # calculate revenue of home games of both teams times their number of home games
+    higherRankedRevenue = calculate_game_revenues(higherRankedTeams, winPercentageHigher, seasonPhase) * ((seriesLength + 1) // 2)
+    lowerRankedRevenue = calculate_game_revenues(lowerRankedTeams, 1 - winPercentageHigher, seasonPhase) * (seriesLength // 2)
 
-            # concat new record with record of previous games
-            record = pd.concat([record, newRecord], ignore_index=True)
+    return higherRankedRevenue, lowerRankedRevenue
 
-            # increase the number of games for both teams by 1
-            ranking.loc[ranking['team'].isin(pairing), 'games'] += 1
 
-            # end of game 1
-            game += 1
+def get_regular_season_ranking(leagueObject, skills, headToHead):
+    """
+    Description:
+    Function to create the regular season ranking of a league from its played games and to resolve ranking conflicts
+
+    Input:
+    leagueObject (League): The initialised league object of class League
+    skills (array): Skill of every team
+    headToHead (array): Matrix with the number of wins of the row team against the column team
+
+    Returns:
+    ranking (dataframe): Return ranking of regular season
+    """
+    # extract names of teams
+    teams = np.array(leagueObject.get_teams())
+
+    # create ranking with number of wins and games of every team
+    ranking = pd.DataFrame({'rank': [0] * len(teams),
+                            'team': teams,
+                            'skill': skills,
+                            'wins': headToHead.sum(axis=1),
+                            'games': headToHead.sum(axis=1) + headToHead.sum(axis=0)})
 
     # calculate winning percentage
     ranking['winningPercentage'] = ranking['wins'] / ranking['games']
@@ -654,7 +763,8 @@ def simulate_regular_season(leagueObject):
     oldTeamRevenues = leagueObject.get_team_revenues()
 
     # resolve ranking conflicts
-    resolvedRanking = solve_ranking_conflicts(ranking, record, leagueObject)
+    with monitoring.profiler.phase("tieBreaks"):
+        resolvedRanking = solve_ranking_conflicts(ranking, headToHead, leagueObject)
 
     # team revenues after resolving ranking conflicts
     newTeamRevenues = leagueObject.get_team_revenues()
@@ -666,201 +776,195 @@ def simulate_regular_season(leagueObject):
     return resolvedRanking
 
 
-def simulate_playoff_round(leagueObject, teamPairings, playoffsType):
+def simulate_regular_season(leagueObject):
     """
     Description:
-    Function to simulate one round of a certain playoff type (pre playoffs, playoffs)
+    Function to simulate an entire regular season based on team skills. All games are drawn at once from the home
+    winning percentages of all pairings
 
     Input:
     leagueObject (League): The initialised league object of class League
-    teamPairings (list): List of tuples with team pairings for the round
-    playoffsType (int): Integer indicating which type of playoffs is to be played, 1 = pre playoffs -> best of three,
-    2 = playoffs ->best of seven
 
     Returns:
-    winningTeams (list): List of teams which have won their respective pairing
-    """
-    # initialise skillDictionary
-    skillDictionary = leagueObject.get_skill_dictionary()
-
-    # if pre playoffs are to be played
-    if playoffsType == 1:
-        # create overall pre playoff record
-        prePlayoffsRecord = pd.DataFrame({'higherRankedTeam': [], 'lowerRankedTeam': [], 'winner': []})
-
-        # for each pairing in pre playoffs
-        for pairing in teamPairings:
-
-            # determine higher ranked team
-            higherRankedTeam = pairing[0]
-
-            # determine lower ranked team
-            lowerRankedTeam = pairing[1]
-
-            # create a within playoff pairing record of home and away games
-            prePlayoffPairingRecord = pd.DataFrame({
-                'homeTeam': [i for i in 1 * [higherRankedTeam, lowerRankedTeam] + [higherRankedTeam]],
-                'awayTeam': [i for i in 1 * [lowerRankedTeam, higherRankedTeam] + [lowerRankedTeam]],
-                'winner': [''] * 3})
-
-            # initialise game count
-            game = 1
-
-            # as long as not 4 games have been played
-            while game < 4:
-
-                # get index of game
-                gameIndex = game - 1
-
-                # define teams in that game
-                homeTeam = prePlayoffPairingRecord.loc[gameIndex, 'homeTeam']
-                awayTeam = prePlayoffPairingRecord.loc[gameIndex, 'awayTeam']
-                skillHomeTeam = skillDictionary[homeTeam]
-                skillAwayTeam = skillDictionary[awayTeam]
-
-                # add a game to count for both teams
-                leagueObject.teamData.loc[leagueObject.teamData['team'].isin([homeTeam, awayTeam]), 'games'] += 1
-
-                # simulate game between teams
-                winner = simulate_game(homeTeam, skillHomeTeam, awayTeam, skillAwayTeam,
-                                       leagueObject, parameters.prePlayoff)
-
-                # write winner to record
-                prePlayoffPairingRecord.loc[gameIndex, 'winner'] = winner
-
-                # add a win to count of winning team
-                leagueObject.teamData.loc[leagueObject.teamData['team'] == winner, 'wins'] += 1
-
-                # check if higher ranked team in pairing has already won pre playoff round
-                if len(prePlayoffPairingRecord.loc[prePlayoffPairingRecord['winner'] == higherRankedTeam]) == 2:
-
-                    # create new playoff record for this pairing
-                    newPrePlayoffsRecord = pd.DataFrame(
-                        {'higherRankedTeam': [higherRankedTeam],
-                         'lowerRankedTeam': [lowerRankedTeam],
-                         'winner': [higherRankedTeam]}
-                    )
-
-                    # concat new record with record of previous games
-                    prePlayoffsRecord = pd.concat([prePlayoffsRecord, newPrePlayoffsRecord], ignore_index=True)
-
-                    # break loop
-                    break
-
-                # check if lower ranked team in pairing has already won pre playoff round
-                elif len(prePlayoffPairingRecord.loc[prePlayoffPairingRecord['winner'] == lowerRankedTeam]) == 2:
-
-                    # create new playoff record for this pairing
-                    newPrePlayoffsRecord = pd.DataFrame(
-                        {'higherRankedTeam': [higherRankedTeam],
-                         'lowerRankedTeam': [lowerRankedTeam],
-                         'winner': [lowerRankedTeam]}
-                    )
-
-                    # concat new record with record of previous games
-                    prePlayoffsRecord = pd.concat([prePlayoffsRecord, newPrePlayoffsRecord], ignore_index=True)
-
-                    # break loop
-                    break
-
-                # end of game 1
-                game += 1
-
-        # create list of winning teams
-        winningTeams = prePlayoffsRecord['winner'].tolist()
-
-        # return winning teams
-        return winningTeams
+    ranking (dataframe): Return ranking of regular season
 
-    # if regular playoffs are to be played
-    elif playoffsType == 2:
+    Updates:
+    leagueObject.headToHead (array): Matrix with the number of regular season wins of the row team against the column
+    team
+    """
 
-        # create overall playoff round record
-        playoffRoundRecord = pd.DataFrame({'higherRankedTeam': [], 'lowerRankedTeam': [], 'winner': []})
+    # extract skills of all teams
+    skills = np.array(list(leagueObject.get_skill_dictionary().values()))
 
-        # for each pairing in playoff round
-        for pairing in teamPairings:
+    # play all games of the league
+    homeTeams, awayTeams, winPercentageHome, winners, headToHead = play_regular_season_games(skills[None, :], [leagueObject.rng])
+    leagueObject.headToHead = headToHead[0]
 
-            # determine higher ranked team
-            higherRankedTeam = pairing[0]
+    # add revenues of all home games
+    leagueObject.revenue += calculate_regular_season_revenues(skills)
 
-            # determine lower ranked team
-            lowerRankedTeam = pairing[1]
+    # create ranking and resolve ranking conflicts
+    return get_regular_season_ranking(leagueObject, skills, headToHead[0])
 
-            # create a within playoff round pairing record of home and away games
-            playoffRoundPairingRecord = pd.DataFrame({
-                'homeTeam': [i for i in 3 * [higherRankedTeam, lowerRankedTeam] + [higherRankedTeam]],
-                'awayTeam': [i for i in 3 * [lowerRankedTeam, higherRankedTeam] + [lowerRankedTeam]],
-                'winner': [''] * 7})
 
-            # initialise game count
-            game = 1
+def sample_series(winPercentageHigher, requiredWins, rngs):
+    """
+    Description:
+    Function to sample the outcome of playoff series directly from their closed form distribution. As the probability
+    of the higher ranked team to win a game is the same in every game of a pairing, the probability that the higher
+    ranked team wins the series in game n is C(n-1, w-1) * p^w * (1-p)^(n-w) where w is the number of required wins
 
-            # as long as not 8 games have been played
-            while game < 8:
+    Input:
+    winPercentageHigher (np.ndarray): Array of shape (leagues, series) with the probability of the higher ranked team
+    to win a game per series
+    requiredWins (int): Number of wins required to win a series
+    rngs (list): List with the random number generator of every league
 
-                # get index of game
-                gameIndex = game - 1
+    Returns:
+    higherRankedVictory (np.ndarray): Boolean array indicating if the higher ranked team has won the series
+    seriesLength (np.ndarray): Integer array with the number of games played per series
+    """
+    # possible series lengths from a sweep to a deciding game
+    seriesLengths = np.arange(requiredWins, 2 * requiredWins)
 
-                # define teams in that game
-                homeTeam = playoffRoundPairingRecord.loc[gameIndex, 'homeTeam']
-                awayTeam = playoffRoundPairingRecord.loc[gameIndex, 'awayTeam']
-                skillHomeTeam = skillDictionary[homeTeam]
-                skillAwayTeam = skillDictionary[awayTeam]
+    # number of orders of games in which the winner decides the series in the last game
+    orders = np.array([math.comb(length - 1, requiredWins - 1) for length in seriesLengths])
 
-                # add a game to count for both teams
-                leagueObject.teamData.loc[leagueObject.teamData['team'].isin([homeTeam, awayTeam]), 'games'] += 1
+    # calculate the probabilities of all outcomes, first higher ranked team winning in each length, then lower ranked
+    p = np.asarray(winPercentageHigher, dtype=float)[..., None]
+    higherRankedProbabilities = orders * p ** requiredWins * (1 - p) ** (seriesLengths - requiredWins)
+    lowerRankedProbabilities = orders * (1 - p) ** requiredWins * p ** (seriesLengths - requiredWins)
+    cumulativeProbabilities = np.cumsum(np.concatenate([higherRankedProbabilities, lowerRankedProbabilities], axis=-1), axis=-1)
 
-                # simulate game between teams
-                winner = simulate_game(homeTeam, skillHomeTeam, awayTeam, skillAwayTeam,
-                                       leagueObject, parameters.playoffs)
+    # draw one outcome per series
+    outcome = (draw_uniform(rngs, p.shape[1:]) * cumulativeProbabilities[..., -1:] >= cumulativeProbabilities).sum(axis=-1)
+    outcome = np.minimum(outcome, 2 * len(seriesLengths) - 1)
 
-                # write winner to record
-                playoffRoundPairingRecord.loc[gameIndex, 'winner'] = winner
+    # return winner and length of series
+    return outcome < len(seriesLengths), seriesLengths[outcome % len(seriesLengths)]
 
-                # add a win to count of winning team
-                leagueObject.teamData.loc[leagueObject.teamData['team'] == winner, 'wins'] += 1
 
-                # check if higher ranked team in pairing has already won playoff round
-                if len(playoffRoundPairingRecord.loc[playoffRoundPairingRecord['winner'] == higherRankedTeam]) == 4:
+def seed_highest_vs_lowest(roundTeams, ranks):
+    """
+    Description:
+    Seeding rule where the teams of a round are ordered by regular season rank and the highest ranked team meets the
+    lowest ranked team, the second highest the second lowest and so on
 
-                    # create new playoff round record for this pairing
-                    newPlayoffRoundRecord = pd.DataFrame(
-                        {'higherRankedTeam': [higherRankedTeam],
-                         'lowerRankedTeam': [lowerRankedTeam],
-                         'winner': [higherRankedTeam]}
-                    )
+    Input:
+    roundTeams (np.ndarray): Array of shape (leagues, teams) with the team ids of all teams playing the round
+    ranks (np.ndarray): Array of shape (leagues, leagueSize) with the regular season rank of every team
 
-                    # concat new record with record of previous games
-                    playoffRoundRecord = pd.concat([playoffRoundRecord, newPlayoffRoundRecord], ignore_index=True)
+    Returns:
+    higherRankedTeams (np.ndarray): Array of shape (leagues, pairings) with the team id of the higher ranked team
+    lowerRankedTeams (np.ndarray): Array of shape (leagues, pairings) with the team id of the lower ranked team
+    """
+    # sort teams of round by rank
+    roundTeams = np.take_along_axis(roundTeams, np.argsort(np.take_along_axis(ranks, roundTeams, axis=1), axis=1), axis=1)
 
-                    # break loop
-                    break
+    # pair first half of ranking with second half of ranking in reverse order
+    pairings = roundTeams.shape[1] // 2
+    return roundTeams[:, :pairings], roundTeams[:, ::-1][:, :pairings]
 
-                # check if lower ranked team in pairing has already won playoff round
-                elif len(playoffRoundPairingRecord.loc[playoffRoundPairingRecord['winner'] == lowerRankedTeam]) == 4:
 
-                    # create new playoff round record for this pairing
-                    newPlayoffRoundRecord = pd.DataFrame(
-                        {'higherRankedTeam': [higherRankedTeam],
-                         'lowerRankedTeam': [lowerRankedTeam],
-                         'winner': [lowerRankedTeam]}
-                    )
+# seeding rules which can be referenced in a playoff bracket
+seedingRules = {'highestVsLowest': seed_highest_vs_lowest}
 
-                    # concat new record with record of previous games
-                    playoffRoundRecord = pd.concat([playoffRoundRecord, newPlayoffRoundRecord], ignore_index=True)
 
-                    # break loop
-                    break
+def simulate_playoff_bracket(leagueObjects, bracket=parameters.playoffBracket):
+    """
+    Description:
+    Function to simulate the playoffs of one or several independent leagues according to a bracket. Each round of the
+    bracket is played by the winners of the previous round and the teams entering with their regular season rank,
+    the series of all leagues in a round are sampled at once
 
-                # end of game 1
-                game += 1
+    Input:
+    leagueObjects (list): List of league objects of class League whose regular season is completed
+    bracket (list): List of rounds where each round is a dictionary with the regular season ranks of teams entering
+    the round ('entrants'), the maximal number of games of a series ('bestOf'), the seeding rule ('seeding'), the
+    season phase of the revenue of games ('seasonPhase') and the column to label eliminated teams ('eliminated'),
+    default is parameters.playoffBracket
 
-        # create list of winning teams
-        winningTeams = playoffRoundRecord['winner'].tolist()
+    Returns:
+    champions (np.ndarray): Team id of the champion of every league
 
-        # return winning teams
-        return winningTeams
+    Updates:
+    leagueObject (League): The columns 'wins', 'games', 'revenue', the elimination columns and 'champion' of every
+    league are updated with the playoff results
+    """
+    # get number of leagues and teams
+    leagueNumber = len(leagueObjects)
+    teamNumber = len(leagueObjects[0].teams)
+
+    # extract skills and regular season rank of all teams in all leagues
+    skills = np.array([np.round(league.totalSkill, 2) for league in leagueObjects])
+    ranks = np.array([league.rank for league in leagueObjects])
+    teamsByRank = np.argsort(ranks, axis=1)
+
+    # initialise playoff results of all teams in all leagues
+    wins = np.zeros((leagueNumber, teamNumber), dtype=int)
+    games = np.zeros((leagueNumber, teamNumber), dtype=int)
+    revenues = np.zeros((leagueNumber, teamNumber))
+    eliminated = {playoffRound['eliminated']: np.zeros((leagueNumber, teamNumber), dtype=int) for playoffRound in bracket}
+
+    # initialise winners of previous round
+    roundWinners = np.zeros((leagueNumber, 0), dtype=int)
+
+    # for each round
+    for playoffRound in bracket:
+
+        # teams of round are winners of previous round and teams entering the playoffs in this round
+        entrants = teamsByRank[:, np.array(playoffRound['entrants'], dtype=int) - 1]
+        roundTeams = np.concatenate([entrants, roundWinners], axis=1)
+
+        # pair teams according to seeding rule
+        higherRankedTeams, lowerRankedTeams = seedingRules[playoffRound['seeding']](roundTeams, ranks)
+
+        # calculate winning percentage of higher ranked teams
+        skillHigherRankedTeams = np.take_along_axis(skills, higherRankedTeams, axis=1)
+        skillLowerRankedTeams = np.take_along_axis(skills, lowerRankedTeams, axis=1)
+        winPercentageHigher = skillHigherRankedTeams / (skillHigherRankedTeams + skillLowerRankedTeams)
+
+        # sample winner and length of each series
+        requiredWins = (playoffRound['bestOf'] + 1) // 2
+        higherRankedVictory, seriesLength = sample_series(winPercentageHigher, requiredWins, [league.rng for league in leagueObjects])
+        roundWinners = np.where(higherRankedVictory, higherRankedTeams, lowerRankedTeams)
+        roundLosers = np.where(higherRankedVictory, lowerRankedTeams, higherRankedTeams)
+
+        # calculate revenue of home games of both teams
+        higherRankedRevenue, lowerRankedRevenue = calculate_series_revenues(higherRankedTeams, lowerRankedTeams, winPercentageHigher,
+                                                                            seriesLength, playoffRound['seasonPhase'])
+
+        # assert that every team of round earns revenue
+        assert (higherRankedRevenue > 0).all() and (lowerRankedRevenue > 0).all()
+
+        # add games, wins and revenues of series to both teams, each team plays at most one series per round
+        for teams, gamesAdded, winsAdded, revenueAdded in [(higherRankedTeams, seriesLength, np.where(higherRankedVictory, requiredWins, seriesLength - requiredWins), higherRankedRevenue),
+                                                           (lowerRankedTeams, seriesLength, np.where(higherRankedVictory, seriesLength - requiredWins, requiredWins), lowerRankedRevenue)]:
+            np.put_along_axis(games, teams, np.take_along_axis(games, teams, axis=1) + gamesAdded, axis=1)
+            np.put_along_axis(wins, teams, np.take_along_axis(wins, teams, axis=1) + winsAdded, axis=1)
+            np.put_along_axis(revenues, teams, np.take_along_axis(revenues, teams, axis=1) + revenueAdded, axis=1)
+
+        # label eliminated teams
+        np.put_along_axis(eliminated[playoffRound['eliminated']], roundLosers, 1, axis=1)
+
+    # assert that the bracket ends with one champion per league
+    assert roundWinners.shape == (leagueNumber, 1)
+    champions = roundWinners[:, 0]
+
+    # for each league
+    for league, leagueObject in enumerate(leagueObjects):
+        # add playoff results
+        leagueObject.wins += wins[league]
+        leagueObject.games += games[league]
+        leagueObject.revenue += revenues[league]
+        for column in eliminated:
+            getattr(leagueObject, column)[:] += eliminated[column][league]
+
+        # label champion
+        leagueObject.champion[champions[league]] += 1
+
+    # return champions
+    return champions
 
 
 def simulate_playoffs(leagueObject):
@@ -874,186 +978,55 @@ def simulate_playoffs(leagueObject):
     Returns:
     champion [str]: Name of final champion
     """
+    # simulate playoff bracket of league
+    champion = simulate_playoff_bracket([leagueObject])[0]
 
-    # get required team information
-    regularSeasonRanking = leagueObject.regularSeasonRanking
-
-    # pre-playoffs ###
-
-    # extract teams to play pre-playoffs in ranking order
-    prePlayoffTeams = regularSeasonRanking.loc[regularSeasonRanking['rank'].isin([7, 8, 9, 10]), 'team'].tolist()
-
-    # extract not pre playoff teams
-    notPrePlayoffTeams = regularSeasonRanking.loc[~regularSeasonRanking['rank'].isin([7, 8, 9, 10]), 'team'].tolist()
-
-    # create list of teams in first and second half of ranking so that the teams meet in pre playoffs elementwise
-    firstHalf = [prePlayoffTeams[i] for i in range(0, int(len(prePlayoffTeams) / 2))]  # first half of ranking
-    secondHalf = [prePlayoffTeams[j] for j in
-                  range(-1, -int(len(prePlayoffTeams) / 2) - 1, -1)]  # second half of ranking
-
-    # create pairings
-    prePlayoffPairings = list(zip(firstHalf, secondHalf))
-
-    # extract team revenues of pre playoff teams and not pre playoff teams before pre playoff
-    prePlayoffTeamRevenuesBefore = leagueObject.get_team_revenues(prePlayoffTeams)
-    notPrePlayoffTeamRevenuesBefore = leagueObject.get_team_revenues(notPrePlayoffTeams)
-
-    # simulate pre playoffs
-    prePlayoffWinners = simulate_playoff_round(leagueObject, prePlayoffPairings, parameters.prePlayoff)
-
-    # identify losers
-    prePlayoffLosers = set(prePlayoffTeams).difference(set(prePlayoffWinners))
-
-    # label eliminated teams in data
-    leagueObject.teamData.loc[leagueObject.teamData['team'].isin(prePlayoffLosers), 'eliminatedPP'] += 1
-
-    # extract team revenues of pre playoff teams and not pre playoff teams before pre playoff
-    prePlayoffTeamRevenuesAfter = leagueObject.get_team_revenues(prePlayoffTeams)
-    notPrePlayoffTeamRevenuesAfter = leagueObject.get_team_revenues(notPrePlayoffTeams)
-
-    # assertions ###
-
-    # assert that the revenues of pre playoff teams have changed
-    assert all([prePlayoffTeamRevenuesBefore[i] != prePlayoffTeamRevenuesAfter[i] for i in
-                range(len(prePlayoffTeamRevenuesAfter))])
-
-    # assert that the revenues of non pre playoff teams have not changed
-    assert all([notPrePlayoffTeamRevenuesBefore[i] == notPrePlayoffTeamRevenuesAfter[i] for i in
-                range(len(notPrePlayoffTeamRevenuesAfter))])
-
-    # playoffs round 1 ###
-
-    # extract top 6 teams after regular season and winning teams of pre playoffs in ranking order
-    roundOneTeams = regularSeasonRanking.loc[
-        (regularSeasonRanking['rank'].isin([1, 2, 3, 4, 5, 6])) | (
-            regularSeasonRanking['team'].isin(prePlayoffWinners)),
-        'team'
-    ].tolist()
-
-    # extract non round one teams
-    notRoundOneTeams = regularSeasonRanking.loc[~regularSeasonRanking['team'].isin(roundOneTeams), 'team'].tolist()
-
-    # create list of teams in first and second half of ranking so that the teams meet in pre playoffs
-    firstHalf = [roundOneTeams[i] for i in range(0, int(len(roundOneTeams) / 2))]  # first half of ranking
-    secondHalf = [roundOneTeams[j] for j in
-                  range(-1, -int(len(roundOneTeams) / 2) - 1, -1)]  # second half of ranking
-
-    # create pairings
-    roundOnePairings = list(zip(firstHalf, secondHalf))
-
-    # extract team revenues of round one teams and not round one teams before round one
-    roundOneTeamRevenuesBefore = leagueObject.get_team_revenues(roundOneTeams)
-    notRoundOneTeamRevenuesBefore = leagueObject.get_team_revenues(notRoundOneTeams)
-
-    # simulate playoffs round 2
-    roundOneWinners = simulate_playoff_round(leagueObject, roundOnePairings, parameters.playoffs)
-
-    # identify losers
-    roundOneLosers = set(roundOneTeams).difference(set(roundOneWinners))
-
-    # label eliminated teams in data
-    leagueObject.teamData.loc[leagueObject.teamData['team'].isin(roundOneLosers), 'eliminatedPR1'] += 1
-
-    # extract team revenues of round one teams and not round one teams after round one
-    roundOneTeamRevenuesAfter = leagueObject.get_team_revenues(roundOneTeams)
-    notRoundOneTeamRevenuesAfter = leagueObject.get_team_revenues(notRoundOneTeams)
-
-    # assertions ###
-
-    # assert that the revenues of round one teams have changed
-    assert all([roundOneTeamRevenuesBefore[i] != roundOneTeamRevenuesAfter[i] for i in
-                range(len(roundOneTeamRevenuesAfter))])
-
-    # assert that the revenues of non round one teams have not changed
-    assert all([notRoundOneTeamRevenuesBefore[i] == notRoundOneTeamRevenuesAfter[i] for i in
-                range(len(notRoundOneTeamRevenuesAfter))])
-
-    # playoffs round 2 ###
-
-    # extract round one winners for round two in ranking order
-    roundTwoTeams = regularSeasonRanking.loc[regularSeasonRanking['team'].isin(roundOneWinners), 'team'].tolist()
-
-    # extract non round two teams
-    notRoundTwoTeams = regularSeasonRanking.loc[~regularSeasonRanking['team'].isin(roundTwoTeams), 'team'].tolist()
-
-    # create list of teams in first and second half of ranking so that the teams meet in playoffs
-    firstHalf = [roundTwoTeams[i] for i in range(0, int(len(roundTwoTeams) / 2))]  # first half of ranking
-    secondHalf = [roundTwoTeams[j] for j in
-                  range(-1, -int(len(roundTwoTeams) / 2) - 1, -1)]  # second half of ranking
-
-    # create pairings
-    roundTwoPairings = list(zip(firstHalf, secondHalf))
-
-    # extract team revenues of round two teams and not round two teams before round two
-    roundTwoTeamRevenuesBefore = leagueObject.get_team_revenues(roundTwoTeams)
-    notRoundTwoTeamRevenuesBefore = leagueObject.get_team_revenues(notRoundTwoTeams)
-
-    # simulate playoffs round 1
-    roundTwoWinners = simulate_playoff_round(leagueObject, roundTwoPairings, parameters.playoffs)
-
-    # identify losers
-    roundTwoLosers = set(roundTwoTeams).difference(set(roundTwoWinners))
-
-    # label eliminated teams in data
-    leagueObject.teamData.loc[leagueObject.teamData['team'].isin(roundTwoLosers), 'eliminatedPR2'] += 1
-
-    # extract team revenues of round two teams and not round two teams after round two
-    roundTwoTeamRevenuesAfter = leagueObject.get_team_revenues(roundTwoTeams)
-    notRoundTwoTeamRevenuesAfter = leagueObject.get_team_revenues(notRoundTwoTeams)
-
-    # assertions ###
-
-    # assert that the revenues of round two teams have changed
-    assert all([roundTwoTeamRevenuesBefore[i] != roundTwoTeamRevenuesAfter[i] for i in
-                range(len(roundTwoTeamRevenuesAfter))])
-
-    # assert that the revenues of non round two teams have not changed
-    assert all([notRoundTwoTeamRevenuesBefore[i] == notRoundTwoTeamRevenuesAfter[i] for i in
-                range(len(notRoundTwoTeamRevenuesAfter))])
-
-    # playoffs round 3 ###
-
-    # extract round two winners for round three in ranking order
-    roundThreeTeams = regularSeasonRanking.loc[regularSeasonRanking['team'].isin(roundTwoWinners), 'team'].tolist()
-
-    # extract non round three teams
-    notRoundThreeTeams = regularSeasonRanking.loc[~regularSeasonRanking['team'].isin(roundThreeTeams), 'team'].tolist()
+    # return champion
+    return leagueObject.teams[champion]
 
-    # create pairing
-    roundThreePairing = [(roundThreeTeams[0], roundThreeTeams[1])]
 
-    # extract team revenues of round three teams and not round three teams before round three
-    roundThreeTeamRevenuesBefore = leagueObject.get_team_revenues(roundThreeTeams)
-    notRoundThreeTeamRevenuesBefore = leagueObject.get_team_revenues(notRoundThreeTeams)
+def simulate_seasons_batch(leagueObjects):
+    """
+    Description:
+    Function to simulate the regular season and playoffs of several independent leagues at once. Games and revenues of
+    all leagues are calculated on arrays with a leading league axis, rankings are resolved per league
 
-    # simulate playoffs round 3
-    champion = simulate_playoff_round(leagueObject, roundThreePairing, parameters.playoffs)
+    Input:
+    leagueObjects (list): List of league objects of class League whose teams are fully stacked
 
-    # identify loser
-    roundThreeLoser = set(roundThreeTeams).difference(set(champion))
+    Updates:
+    leagueObject (League): Regular season ranking, head to head record and team data of every league are updated
+    """
+    # if no league is left
+    if len(leagueObjects) == 0:
+        return
 
-    # label eliminated teams in data
-    leagueObject.teamData.loc[leagueObject.teamData['team'].isin(roundThreeLoser), 'eliminatedPR3'] += 1
+    # play regular seasons of all leagues as one profiled phase
+    with monitoring.profiler.phase("regularSeason"):
+        # extract skills of all teams in all leagues
+        skills = np.array([list(league.get_skill_dictionary().values()) for league in leagueObjects])
 
-    # label champion
-    leagueObject.teamData.loc[leagueObject.teamData['team'] == champion[0], 'champion'] += 1
+        # play all regular season games of all leagues
+        homeTeams, awayTeams, winPercentageHome, winners, headToHead = play_regular_season_games(skills, [league.rng for league in leagueObjects])
 
-    # extract team revenues of round three teams and not round three teams after round three
-    roundThreeTeamRevenuesAfter = leagueObject.get_team_revenues(roundThreeTeams)
-    notRoundThreeTeamRevenuesAfter = leagueObject.get_team_revenues(notRoundThreeTeams)
+        # calculate regular season revenues of all teams in all leagues
+        regularSeasonRevenues = calculate_regular_season_revenues(skills)
 
-    # assertions ###
+        # for each league
+        for league, leagueObject in enumerate(leagueObjects):
+            # add regular season revenues
+            leagueObject.revenue += regularSeasonRevenues[league]
 
-    # assert that the revenues of round three teams have changed
-    assert all([roundThreeTeamRevenuesBefore[i] != roundThreeTeamRevenuesAfter[i] for i in
-                range(len(roundThreeTeamRevenuesAfter))])
+            # store head to head record and resolve ranking
+            leagueObject.headToHead = headToHead[league]
+            leagueObject.regularSeasonRanking = get_regular_season_ranking(leagueObject, skills[league], headToHead[league])
 
-    # assert that the revenues of non round three teams have not changed
-    assert all([notRoundThreeTeamRevenuesBefore[i] == notRoundThreeTeamRevenuesAfter[i] for i in
-                range(len(notRoundThreeTeamRevenuesAfter))])
+            # update team data based on regular season ranking
+            leagueObject.update_team_data_post_regular_season()
 
-    # return champion
-    return champion[0]
+    # simulate playoffs of all leagues
+    with monitoring.profiler.phase("playoffs"):
+        simulate_playoff_bracket(leagueObjects)
 
 
 def calculate_maximal_budget(league, salaryCap):
@@ -1069,7 +1042,7 @@ def calculate_maximal_budget(league, salaryCap):
     maximalBudget (int): maximal budget a team has to spend for the upcoming season
 
     Updates:
-    teamData (dataFrame): Updates the columns 'salaryCap' and 'effectiveBudget' of teams
+    league (League): Updates the columns 'salaryCap' and 'effectiveBudget' of teams
     """
     # if a salary cap exists
     if salaryCap:
@@ -1081,10 +1054,10 @@ def calculate_maximal_budget(league, salaryCap):
         maximalBudget = int(((sum(hockeyRevenues))/parameters.leagueSize)*parameters.salaryCapFactor)
 
         # update information about salary cap in team data
-        league.teamData['salaryCap'] = [maximalBudget] * parameters.leagueSize
+        league.salaryCap[:] = maximalBudget
 
         # calculate allowed budget for teams to spend
-        league.teamData['effectiveBudget'] = list(map(min, zip(league.get_team_budgets(), league.get_salary_cap())))
+        league.effectiveBudget[:] = np.minimum(league.budget, league.salaryCap)
 
     # if no salary cap exists
     else:
@@ -1092,12 +1065,7 @@ def calculate_maximal_budget(league, salaryCap):
         maximalBudget = max(league.get_team_budgets())
 
         # calculate allowed budget for teams to spend
-        league.teamData['effectiveBudget'] = league.get_team_budgets()
+        league.effectiveBudget[:] = league.budget
 
     # return maximal salary
     return maximalBudget
-
-
-
-
-
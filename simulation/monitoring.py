@@ -0,0 +1,323 @@
+import numpy as np
+import pandas as pd
+import contextlib
+import json
+import logging
+import sys
+import time
+import parameters
+import solvers
+
+
+# define loggers, events of the simulation are reported according to the verbosity, progress is always reported
+logger = logging.getLogger("simulation")
+progressLogger = logging.getLogger("simulation.progress")
+
+# define logging levels of the verbosities
+verbosityLevels = {'quiet': logging.WARNING,  # progress reports and warnings only
+                   'info': logging.INFO,  # also start and end of simulations, chunks and tasks
+                   'debug': logging.DEBUG}  # also every stage of every season
+
+# define profiled phases of a season in the order in which they are played
+phases = ['poolInitialisation',  # calculation of the maximal budget and initialisation of the player pools
+          'domesticSelection',  # sub-problem 1, selection of domestic players by every team
+          'conflictResolution',  # resolution of conflicting domestic player selections
+          'importSelection',  # sub-problem 3, selection of import players by every team
+          'regularSeason',  # regular season games and ranking, without tie-breaks
+          'tieBreaks',  # resolution of ranking conflicts
+          'playoffs',  # pre-playoffs and playoffs
+          'revenue',  # calculation of the final team revenues
+          'resultExtraction']  # extraction of the team and player results of the season
+
+
+def configure_logging(verbosity="quiet", reportInterval=30, progressFile=None):
+    """
+    Description:
+    Function to configure the output of a run, messages are written to stdout without decoration
+
+    Input:
+    verbosity (str): the verbosity of the output, 'quiet', 'info' or 'debug', default is 'quiet'
+    reportInterval (float): seconds between two progress reports, default is 30
+    progressFile (str): path of a file to which every progress report is appended as one JSON line, default is None
+    in which case no JSON lines are written
+    """
+    # write messages to stdout
+    if not logger.handlers:
+        handler = logging.StreamHandler(sys.stdout)
+        handler.setFormatter(logging.Formatter("%(message)s"))
+        logger.addHandler(handler)
+        logger.propagate = False
+
+    # set verbosity, progress reports are not affected
+    logger.setLevel(verbosityLevels[verbosity])
+    progressLogger.setLevel(logging.INFO)
+
+    # set progress reporting
+    progress.reportInterval = reportInterval
+    progress.progressFile = progressFile
+
+
+# define reporter of the progress of a run as class
+class ProgressReporter(object):
+    def __init__(self):
+        """
+        Description:
+        Initializes the reporter of the progress of a run, which regularly reports throughput, expected remaining time,
+        bankruptcies and the share of time spent in the skill maximization solvers
+
+        A progress reporter object has the following attributes:
+        self.reportInterval (float): seconds between two progress reports
+        self.progressFile (str): path of the JSON lines file of progress reports, None = no file
+        self.active (bool): indicator if a run is reported, completed simulations are ignored otherwise
+        self.totalSimulations (int): the number of simulations of the run, None if unknown
+        self.startTime (float): time at the start of the run
+        self.lastReportTime (float): time of the last progress report
+        self.solverStartTime (float): total solver time at the start of the run
+        self.simulations (int): the number of completed simulations
+        self.seasons (int): the number of simulated seasons of the completed simulations
+        self.bankruptcies (int): the number of completed simulations terminated by a bankruptcy
+        """
+        self.reportInterval = 30
+        self.progressFile = None
+        self.active = False
+        self.totalSimulations = None
+        self.startTime = None
+        self.lastReportTime = None
+        self.solverStartTime = 0
+        self.simulations = 0
+        self.seasons = 0
+        self.bankruptcies = 0
+
+    def start(self, totalSimulations=None, **details):
+        """
+        Description:
+        Start reporting a run
+
+        Input:
+        totalSimulations (int): the number of simulations of the run, default is None if unknown
+        details (dict): information added to the start report, e.g. the master seed
+        """
+        self.active = True
+        self.totalSimulations = totalSimulations
+        self.startTime = self.lastReportTime = time.perf_counter()
+        self.solverStartTime = solvers.telemetry.totalTime
+        self.simulations = self.seasons = self.bankruptcies = 0
+        self.report("start", **details)
+
+    def update(self, teamResults):
+        """
+        Description:
+        Add completed simulations and report progress if the report interval has passed
+
+        Input:
+        teamResults (data frame): data frame containing the team results of the completed simulations
+        """
+        # if no run is reported
+        if not self.active:
+            return
+
+        # count simulations, seasons and bankruptcies
+        simulationStatus = teamResults.groupby('simulation', sort=False)['validSimulation'].first()
+        self.simulations += len(simulationStatus)
+        self.seasons += len(teamResults) // parameters.leagueSize
+        self.bankruptcies += int((~simulationStatus).sum())
+
+        # report progress
+        if time.perf_counter() - self.lastReportTime >= self.reportInterval:
+            self.report("progress")
+
+    def finish(self):
+        """
+        Description:
+        Report the end of the run
+        """
+        if self.active:
+            self.report("finish")
+            self.active = False
+
+    def report(self, event, **details):
+        """
+        Description:
+        Report the progress as one line on stdout and as JSON line in the progress file
+
+        Input:
+        event (str): the reported event, 'start', 'progress' or 'finish'
+        details (dict): information added to the report
+        """
+        # calculate throughput
+        now = time.perf_counter()
+        elapsed = now - self.startTime
+        simulationsPerSecond = self.simulations / elapsed if elapsed > 0 else 0.0
+        remaining = None if self.totalSimulations is None else max(self.totalSimulations - self.simulations, 0)
+        eta = remaining / simulationsPerSecond if remaining is not None and simulationsPerSecond > 0 else None
+        record = {'event': event, 'time': time.time(), 'elapsed': elapsed, 'simulations': self.simulations,
+                  'totalSimulations': self.totalSimulations, 'simulationsPerSecond': simulationsPerSecond,
+                  'seasonsPerSecond': self.seasons / elapsed if elapsed > 0 else 0.0, 'eta': eta,
+                  'bankruptcies': self.bankruptcies,
+                  'solverShare': (solvers.telemetry.totalTime - self.solverStartTime) / elapsed if elapsed > 0 else 0.0,
+                  **details}
+        self.lastReportTime = now
+
+        # report on stdout
+        progressLogger.info("[%s] %d/%s simulations, %.2f simulations/s, %.2f seasons/s, ETA %s, %d bankruptcies, solver %.0f%% of time%s",
+                            event, self.simulations, self.totalSimulations if self.totalSimulations is not None else "?",
+                            record['simulationsPerSecond'], record['seasonsPerSecond'], "?" if eta is None else "{:.0f}s".format(eta),
+                            self.bankruptcies, 100 * record['solverShare'],
+                            "".join(", {} {}".format(key, value) for key, value in details.items()))
+
+        # append report to progress file
+        if self.progressFile is not None:
+            with open(self.progressFile, 'a') as file:
+                file.write(json.dumps(record) + "\n")
+
+
+# define reporter of the progress of a run
+progress = ProgressReporter()
+
+
+# define timer of one phase as class
+class PhaseTimer(object):
+    def __init__(self, profiler, phase):
+        """
+        Description:
+        Initializes the timer of one execution of a phase, used as context manager around the phase
+
+        A phase timer object has the following attributes:
+        self.profiler (PhaseProfiler): the profiler to which the duration is added
+        self.phase (str): the name of the phase
+        self.startTime (float): time at the start of the phase
+        """
+        self.profiler = profiler
+        self.phase = phase
+        self.startTime = None
+
+    def __enter__(self):
+        # call hooks and start timer, nested phases are collected on the stack of the profiler
+        for hook in self.profiler.hooks:
+            hook(self.phase, "start", self.profiler.scenario)
+        self.profiler.stack.append(0.0)
+        self.startTime = time.perf_counter()
+        return self
+
+    def __exit__(self, *exception):
+        # stop timer, the time of nested phases is only counted for the nested phases
+        duration = time.perf_counter() - self.startTime
+        nestedTime = self.profiler.stack.pop()
+        if self.profiler.stack:
+            self.profiler.stack[-1] += duration
+        self.profiler.add_duration(self.phase, duration - nestedTime)
+
+        # call hooks
+        for hook in self.profiler.hooks:
+            hook(self.phase, "end", self.profiler.scenario)
+        return False
+
+
+# define profiler of the phases of a season as class
+class PhaseProfiler(object):
+    def __init__(self):
+        """
+        Description:
+        Initializes the profiler of the phases of a season, which times every phase per scenario and calls hooks at
+        the start and end of every phase, e.g. to mark phases in an external profiler. Without hooks and with
+        profiling disabled, phases are not timed at all
+
+        A phase profiler object has the following attributes:
+        self.enabled (bool): indicator if phases are timed, initialised with False
+        self.hooks (list): callables which are called with the phase, the event 'start' or 'end' and the scenario
+        self.scenario (tuple): the scenario of the current season, the number of allowed imports and the salary cap indicator,
+        initialised with (None, None)
+        self.durations (dict): dictionary with the scenario and phase as key and a list of durations in seconds as value
+        self.stack (list): accumulated time of nested phases of every running phase
+        """
+        self.enabled = False
+        self.hooks = []
+        self.scenario = (None, None)
+        self.durations = {}
+        self.stack = []
+
+    def phase(self, phase):
+        """
+        Description:
+        Get the context manager timing one execution of a phase
+
+        Input:
+        phase (str): the name of the phase, one of phases
+
+        Returns:
+        timer (PhaseTimer): timer of the phase, a context manager doing nothing if profiling is disabled and no hooks are set
+        """
+        if not self.enabled and not self.hooks:
+            return contextlib.nullcontext()
+        return PhaseTimer(self, phase)
+
+    def add_duration(self, phase, duration):
+        """
+        Description:
+        Add the duration of one execution of a phase of the current scenario if profiling is enabled
+
+        Input:
+        phase (str): the name of the phase
+        duration (float): the duration in seconds, without nested phases
+        """
+        if self.enabled:
+            self.durations.setdefault((*self.scenario, phase), []).append(duration)
+
+    def add_durations(self, durations):
+        """
+        Description:
+        Add the durations recorded by another process, e.g. a worker process
+
+        Input:
+        durations (dict): dictionary with the scenario and phase as key and a list of durations in seconds as value
+        """
+        for key, phaseDurations in durations.items():
+            self.durations.setdefault(key, []).extend(phaseDurations)
+
+    def get_report(self):
+        """
+        Description:
+        Aggregate the recorded durations per scenario and phase
+
+        Returns:
+        report (dataframe): Dataframe with the number of calls, the total time, the share of the total time of the
+        scenario and the mean, median and 95th percentile of the time per call of every phase of every scenario
+        """
+        # aggregate durations of every scenario and phase
+        report = pd.DataFrame([{'allowedImports': allowedImports, 'salaryCap': salaryCap, 'phase': phase,
+                                'calls': len(phaseDurations), 'totalTime': sum(phaseDurations),
+                                'meanTime': np.mean(phaseDurations), 'p50': np.percentile(phaseDurations, 50),
+                                'p95': np.percentile(phaseDurations, 95)}
+                               for (allowedImports, salaryCap, phase), phaseDurations in self.durations.items()])
+
+        # if nothing was recorded
+        if report.empty:
+            return report
+
+        # calculate share of time of every phase within its scenario
+        report.insert(5, 'share', report['totalTime'] / report.groupby(['allowedImports', 'salaryCap'])['totalTime'].transform('sum'))
+
+        # order phases as they are played
+        report['order'] = report['phase'].map({phase: order for order, phase in enumerate(phases)})
+        return report.sort_values(['allowedImports', 'salaryCap', 'order'], ignore_index=True).drop(columns='order')
+
+    def log_report(self):
+        """
+        Description:
+        Report the time share, calls and time per call of every phase of every scenario on stdout
+        """
+        for row in self.get_report().itertuples():
+            progressLogger.info("[profile] imports=%s cap=%s %-18s %5.1f%% of time, %d calls, p50 %.2fms, p95 %.2fms",
+                                row.allowedImports, row.salaryCap, row.phase, 100 * row.share, row.calls, 1000 * row.p50, 1000 * row.p95)
+
+    def reset(self):
+        """
+        Description:
+        Remove all durations
+        """
+        self.durations = {}
+        self.stack = []
+
+
+# define profiler of the phases of a season
+profiler = PhaseProfiler()
@@ -24,6 +24,12 @@ monetaryFactor = [averageGameRevenues[team]/(marketSize[team]*averageWinPer[team
 initialBroadcastingRevenue = 1450000  # the initial revenue teams receive from broadcasting rights, references 'B' in thesis
 broadcastingRevenueGrowth = 0.031  # factor by which the revenue of teams from broadcasting rights grows, references 'pi' in thesis
 regularSeason = 0  # parameter indicating regular season
+regularSeasonHomeGames = 2  # number of home games of each team against every other team in regular season
 prePlayoff = 1  # parameter indicating prePlayoffs which means best of five series
 playoffs = 2  # parameter indicating Playoffs which means best of seven series
+playoffBracket = [  # rounds of the playoffs in order of play, each round is played by the winners of the previous round and the teams with the listed regular season ranks
+    {'name': 'prePlayoffs', 'entrants': [7, 8, 9, 10], 'bestOf': 3, 'seeding': 'highestVsLowest', 'seasonPhase': prePlayoff, 'eliminated': 'eliminatedPP'},
+    {'name': 'playoffsRoundOne', 'entrants': [1, 2, 3, 4, 5, 6], 'bestOf': 7, 'seeding': 'highestVsLowest', 'seasonPhase': playoffs, 'eliminated': 'eliminatedPR1'},
+    {'name': 'playoffsRoundTwo', 'entrants': [], 'bestOf': 7, 'seeding': 'highestVsLowest', 'seasonPhase': playoffs, 'eliminated': 'eliminatedPR2'},
+    {'name': 'playoffsRoundThree', 'entrants': [], 'bestOf': 7, 'seeding': 'highestVsLowest', 'seasonPhase': playoffs, 'eliminated': 'eliminatedPR3'}]
 salaryCapFactor = 1.05*1.15  # parameter indicating salary cap scale parameter, references 'tau' in thesis
@@ -1,27 +1,63 @@
-import os
+import monitoring
 import simulationModules
+import solvers
 
 # simulation parameters
 allowedImports = 10  # the number of allowed import players per team, references 'rho' in thesis
 salaryCap = True  # boolean indicator if salary cap is to be simulated or not, references 'R_cap' in thesis
 seasons = 10  # the number of consecutive seasons to simulate in one simulation, references 't' in thesis
 simulationNumber = 1000  # the number of times the simulation shall be repeated
+solver = "exact"  # the solver used by teams for skill maximization, 'exact' = in-process exact engine, 'cbc' = PuLP with CBC
+batchSize = 1  # the number of simulations whose seasons are played together on arrays, 1 = simulations are run one after another
+workers = 1  # the number of worker processes simulating chunks of simulations in parallel, 1 = no parallel execution
+chunkSize = None  # the number of simulations per chunk sent to a worker process, None = about four chunks per worker
+seed = None  # master seed from which every simulation derives its own random number generator, None = fresh entropy which is printed
+checkpoint = False  # boolean indicator if completed simulations are saved to results/checkpoints and an interrupted run is resumed from them
+streamResults = False  # boolean indicator if results are written to the result files while simulating instead of being kept in memory
+resultFormat = "csv"  # the format of the results, 'csv' = one csv file per scenario, 'parquet' or 'feather' = columnar datasets partitioned by scenario, requires pyarrow
+precisionTargets = None  # confidence interval half widths per metric at which a run stops early, e.g. {'meanPlayerSalary': 2000, 'championshipShare': 0.02}, simulationNumber is then the maximum, None = fixed simulationNumber
+checkInterval = 50  # the number of simulations between two checks of the precision targets
+verbosity = "quiet"  # the output while simulating, 'quiet' = progress reports and warnings, 'info' = also every simulation, 'debug' = also every stage of every season
+reportInterval = 30  # seconds between two progress reports of simulations/s, seasons/s, ETA, bankruptcies and solver share of time
+progressFile = None  # file to which every progress report is appended as JSON line, None = no file
+solverCacheFile = None  # file to persist solved skill maximization problems so that repeated runs start warm, None = no persistence
+solverDiagnostics = False  # boolean indicator if solver telemetry is recorded and saved as diagnostics table beside the results
+phaseProfiling = False  # boolean indicator if the phases of every season are timed, reported at the end and saved as profile table beside the results
 
-# run simulation with defined parameters to obtain results on teams and player salaries
-combinedSimulationTeamResults, combinedSimulationPlayerResults = simulationModules.simulation(allowedImports, salaryCap, seasons, simulationNumber)
+# run simulation only when executed as script, so that worker processes can import this file safely
+if __name__ == "__main__":
 
-# define file name to save results
-playerFileName = "results/playerResults_imports={}_cap={}_seasons={}_simNumb={}.csv".format(allowedImports, salaryCap, seasons, simulationNumber)
-teamFileName = "results/teamResults_imports={}_cap={}_seasons={}_simNumb={}.csv".format(allowedImports, salaryCap, seasons, simulationNumber)
+    # configure output
+    monitoring.configure_logging(verbosity, reportInterval, progressFile)
 
-# define directory to store results in
-saveDirectory = os.path.join(os.getcwd(), "results")
+    # enable solver telemetry and phase profiling
+    solvers.telemetry.enabled = solverDiagnostics
+    monitoring.profiler.enabled = phaseProfiling
 
-# if directory does not already exist
-if not os.path.exists(saveDirectory):
-    # create new directory
-    os.mkdir(saveDirectory)
+    # load solved problems of previous runs
+    if solverCacheFile is not None:
+        solvers.resultCache.load(solverCacheFile)
 
-# save results to new directory
-combinedSimulationPlayerResults.to_csv(playerFileName, index=False)
-combinedSimulationTeamResults.to_csv(teamFileName, index=False)
+    # run simulation with defined parameters to obtain results on teams and player salaries
+    combinedSimulationTeamResults, combinedSimulationPlayerResults, simulatedNumber = simulationModules.simulation(allowedImports, salaryCap, seasons, simulationNumber, solver, batchSize, workers, chunkSize, seed, checkpoint, streamResults, resultFormat, precisionTargets, checkInterval)
+
+    # save solved problems for later runs
+    if solverCacheFile is not None:
+        solvers.resultCache.save(solverCacheFile)
+
+    # save results if they were not already written while simulating, named by the number of simulations run, which is smaller than simulationNumber if the precision targets were met early
+    if not streamResults:
+        simulationModules.save_results(combinedSimulationTeamResults, combinedSimulationPlayerResults, allowedImports, salaryCap, seasons, simulatedNumber, resultFormat)
+
+    # if solver telemetry is recorded
+    if solverDiagnostics:
+        # save diagnostics table to new directory
+        diagnosticsFileName = "results/solverDiagnostics_imports={}_cap={}_seasons={}_simNumb={}.csv".format(allowedImports, salaryCap, seasons, simulatedNumber)
+        solvers.telemetry.get_diagnostics().to_csv(diagnosticsFileName, index=False)
+
+    # if phases are profiled
+    if phaseProfiling:
+        # report and save phase profile to new directory
+        monitoring.profiler.log_report()
+        profileFileName = "results/phaseProfile_imports={}_cap={}_seasons={}_simNumb={}.csv".format(allowedImports, salaryCap, seasons, simulatedNumber)
+        monitoring.profiler.get_report().to_csv(profileFileName, index=False)
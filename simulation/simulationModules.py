@@ -1,55 +1,89 @@
+import logging
+import os
+import numpy as np
 import pandas as pd
+import concurrent.futures
+import accumulators
+import checkpoints
 import classes
+import convergence
 import functions
+import monitoring
 import parameters
+import solvers
 
 
-def simulate_one_season(league, allowedImports, salaryCap, season, simulationIteration):
+def select_players(league, allowedImports, salaryCap, season, simulationIteration, solver="exact"):
     """
     Description:
-    Module to simulate one single season
+    Module to let all teams of a league select their domestic and import players for one season
 
     Input:
     league (League): A league of object League
-    season (int): An integer the number of allowed import players per team
+    allowedImports (int): An integer the number of allowed import players per team
     salaryCap (bool): boolean parameter indicating presence of salary cap
     season (int): An integer indicating the season
     simulationIteration (int): the current simulation iteration
+    solver (str): the solver used by teams for skill maximization, 'cbc' or 'exact', default is 'exact'
 
     Returns:
-    seasonTeamResults (data frame): A data frame with all relevant team results from the season simulation
-    seasonPlayerResults (data frame): A data frame with all relevant player salary results from the season simulation
+    domesticPlayerPool (DomesticPlayerPool): The domestic player pool of the season
+    foreignPlayerPool (ForeignPlayerPool): The foreign player pool of the season
     """
-    # calculate maximal budget
-    maximalBudget = functions.calculate_maximal_budget(league, salaryCap)
+    # add season to records of solver telemetry and scenario to phase profile
+    solvers.telemetry.context = {'simulation': simulationIteration, 'season': season}
+    monitoring.profiler.scenario = (allowedImports, salaryCap)
+
+    # initialise player pools with maximal budget
+    monitoring.logger.debug("Player pools are initialised")
+    with monitoring.profiler.phase("poolInitialisation"):
+        maximalBudget = functions.calculate_maximal_budget(league, salaryCap)
+        domesticPlayerPool = classes.DomesticPlayerPool(season, maximalBudget, allowedImports, league.rng)
+        foreignPlayerPool = classes.ForeignPlayerPool(season, maximalBudget, allowedImports)
+
+    # solve skill maximization problem for each team on domestic players and remove all selected players from the pool
+    monitoring.logger.debug("Teams solve sub-problem 1: Selection of domestic players")
+    with monitoring.profiler.phase("domesticSelection"):
+        league.select_optimal_domestic_players(domesticPlayerPool, solver)
+        domesticPlayerPool.update_player_pool_after_maximization(league.optimalDomesticPlayersSet)
 
-    # initialise player pools
-    print("Player pools are initialised")
-    domesticPlayerPool = classes.DomesticPlayerPool(season, maximalBudget, allowedImports)
-    foreignPlayerPool = classes.ForeignPlayerPool(season, maximalBudget, allowedImports)
+    # resolve conflict of domestic player assignment
+    monitoring.logger.debug("Teams solve sub-problem 1: Conflicting domestic player selection")
+    with monitoring.profiler.phase("conflictResolution"):
+        league.resolve_player_conflicts(domesticPlayerPool)
 
-    # solve skill maximization problem for each team on domestic players
-    print("Teams solve sub-problem 1: Selection of domestic players")
-    league.select_optimal_domestic_players(domesticPlayerPool)
+    # select import players
+    monitoring.logger.debug("Teams solve sub-problem 3: Selection of import players")
+    with monitoring.profiler.phase("importSelection"):
+        league.select_optimal_import_players(foreignPlayerPool, domesticPlayerPool, allowedImports, solver)
 
-    # remove all selected players from the pool of domestic players
-    domesticPlayerPool.update_player_pool_after_maximization(league.optimalDomesticPlayersSet)
+    # return player pools
+    return domesticPlayerPool, foreignPlayerPool
 
-    # resolve conflict of domestic player assignment
-    print("Teams solve sub-problem 1: Conflicting domestic player selection")
-    league.resolve_player_conflicts(domesticPlayerPool)
 
-    # select import players
-    print("Teams solve sub-problem 3: Selection of import players")
-    league.select_optimal_import_players(foreignPlayerPool, domesticPlayerPool, allowedImports)
+def get_season_results(league, domesticPlayerPool, foreignPlayerPool, season, validSeason):
+    """
+    Description:
+    Module to extract the team and player results of a season
 
-    # if a team went bankrupt
-    if league.leagueCondition == "bankruptcy":
-        # create season results
-        seasonTeamResults = league.teamData.iloc[:, :-4]
+    Input:
+    league (League): A league of object League
+    domesticPlayerPool (DomesticPlayerPool): The domestic player pool of the season
+    foreignPlayerPool (ForeignPlayerPool): The foreign player pool of the season
+    season (int): An integer indicating the season
+    validSeason (bool): boolean parameter indicating if the season was played, False if a team went bankrupt
+
+    Returns:
+    seasonTeamResults (data frame): A data frame with all relevant team results from the season simulation
+    seasonPlayerResults (data frame): A data frame with all relevant player salary results from the season simulation
+    """
+    # extract results as profiled phase
+    with monitoring.profiler.phase("resultExtraction"):
+        # create season results without per team constants
+        seasonTeamResults = league.get_team_data().drop(columns=list(league.teamConstants))
 
         # add columns to inform season status to team data
-        seasonTeamResults.insert(loc=0, column='validSeason', value=[False] * parameters.leagueSize)
+        seasonTeamResults.insert(loc=0, column='validSeason', value=[validSeason] * parameters.leagueSize)
         seasonTeamResults.insert(loc=0, column='season', value=[season] * parameters.leagueSize)
 
         # combine player data of both player pools for player statistics
@@ -60,42 +94,91 @@ def simulate_one_season(league, allowedImports, salaryCap, season, simulationIte
         seasonPlayerResults = league.get_player_stats(combinedPlayersData)
 
         # add columns to inform season status to player data
-        seasonPlayerResults.insert(loc=0, column='validSeason', value=False)
+        seasonPlayerResults.insert(loc=0, column='validSeason', value=validSeason)
         seasonPlayerResults.insert(loc=0, column='season', value=season)
 
-        # return seasonResults
-        return seasonTeamResults, seasonPlayerResults
+    # return seasonResults
+    return seasonTeamResults, seasonPlayerResults
+
+
+def simulate_one_season(league, allowedImports, salaryCap, season, simulationIteration, solver="exact"):
+    """
+    Description:
+    Module to simulate one single season
+
+    Input:
+    league (League): A league of object League
+    allowedImports (int): An integer the number of allowed import players per team
+    salaryCap (bool): boolean parameter indicating presence of salary cap
+    season (int): An integer indicating the season
+    simulationIteration (int): the current simulation iteration
+    solver (str): the solver used by teams for skill maximization, 'cbc' or 'exact', default is 'exact'
+
+    Returns:
+    seasonTeamResults (data frame): A data frame with all relevant team results from the season simulation
+    seasonPlayerResults (data frame): A data frame with all relevant player salary results from the season simulation
+    """
+    # let teams select their players
+    domesticPlayerPool, foreignPlayerPool = select_players(league, allowedImports, salaryCap, season, simulationIteration, solver)
+
+    # if a team went bankrupt
+    if league.leagueCondition == "bankruptcy":
+        # return season results
+        return get_season_results(league, domesticPlayerPool, foreignPlayerPool, season, False)
 
     # simulate season
     league.simulate_season()
 
     # calculate final team revenue
-    print("Final revenues are calculated")
-    league.calculate_season_revenue(season)
+    monitoring.logger.debug("Final revenues are calculated")
+    with monitoring.profiler.phase("revenue"):
+        league.calculate_season_revenue(season)
 
-    # create season results
-    seasonTeamResults = league.teamData.iloc[:, :-4]
+    # return season results
+    return get_season_results(league, domesticPlayerPool, foreignPlayerPool, season, True)
 
-    # add columns to inform season status to team data
-    seasonTeamResults.insert(loc=0, column='validSeason', value=[True] * parameters.leagueSize)
-    seasonTeamResults.insert(loc=0, column='season', value=[season] * parameters.leagueSize)
 
-    # combine player data of both player pools for player statistics
-    combinedPlayersData = pd.concat([domesticPlayerPool.allPlayersData, foreignPlayerPool.allPlayersData],
-                                    ignore_index=True)
+def get_simulation_rng(masterSeed, simulationIteration):
+    """
+    Description:
+    Module to create the random number generator of one simulation. The generator is seeded with the child of the
+    master seed sequence with index simulationIteration - 1, so that any simulation can be re-run in isolation and
+    results do not depend on how simulations are distributed to batches or worker processes
 
-    # extract player stats
-    seasonPlayerResults = league.get_player_stats(combinedPlayersData)
+    Input:
+    masterSeed (int): the master seed of the simulation run, None = fresh entropy
+    simulationIteration (int): the simulation iteration
 
-    # add columns to inform season status to player data
-    seasonPlayerResults.insert(loc=0, column='validSeason', value=True)
-    seasonPlayerResults.insert(loc=0, column='season', value=season)
+    Returns:
+    rng (np.random.Generator): the random number generator of the simulation
+    """
+    # derive seed sequence of simulation as child of master seed sequence
+    seedSequence = np.random.SeedSequence(masterSeed, spawn_key=(simulationIteration - 1,))
 
-    # return seasonResults
-    return seasonTeamResults, seasonPlayerResults
+    return np.random.default_rng(seedSequence)
+
+
+def add_simulation_status(simulationResults, simulationIteration, validSimulation):
+    """
+    Description:
+    Module to add the simulation iteration and status to the results of one simulation
 
+    Input:
+    simulationResults (data frame): data frame containing the team or player results of one simulation
+    simulationIteration (int): the simulation iteration
+    validSimulation (bool): boolean parameter indicating if all seasons were played, False if a team went bankrupt
 
-def simulate_consecutive_seasons(simulationTeamResults, simulationPlayerResults, allowedImports, salaryCap, seasons, simulationIteration, simulationNumber):
+    Returns:
+    simulationResults (data frame): data frame with columns 'simulation' and 'validSimulation' added in front
+    """
+    # add columns to inform simulation status to data
+    simulationResults.insert(loc=0, column='validSimulation', value=[validSimulation] * len(simulationResults))
+    simulationResults.insert(loc=0, column='simulation', value=[simulationIteration] * len(simulationResults))
+
+    return simulationResults
+
+
+def simulate_consecutive_seasons(simulationTeamResults, simulationPlayerResults, allowedImports, salaryCap, seasons, simulationIteration, simulationNumber, solver="exact", masterSeed=None):
     """
     Description:
     Module to simulate consecutive seasons
@@ -107,70 +190,708 @@ def simulate_consecutive_seasons(simulationTeamResults, simulationPlayerResults,
     salaryCap (bool): boolean parameter indicating presence of salary cap
     seasons (int): the number of consecutive seasons to simulate
     simulationNumber (int): the total number of simulations to be conducted
+    solver (str): the solver used by teams for skill maximization, 'cbc' or 'exact', default is 'exact'
+    masterSeed (int): the master seed from which the random number generator of every simulation is derived,
+    default is None in which case fresh entropy is used
 
     Returns:
     simulationTeamResults (data frame): data frame containing the updated simulation team results for one simulation
     simulationPlayerResults (data frame): data frame containing the updated simulation player salary results for one simulation
     """
+    # initialise lists of season results, combined once at the end of the simulation
+    seasonTeamResultsList = [simulationTeamResults]
+    seasonPlayerResultsList = [simulationPlayerResults]
+
+    # initialise simulation status
+    validSimulation = True
+
     # for each season in the range of seasons
     for season in range(1, seasons + 1):
 
         # print season
-        print("\n\nSimulation {}/{}, Season {}/{}:\n".format(simulationIteration, simulationNumber, season, seasons))
+        monitoring.logger.debug("Simulation %s/%s, Season %s/%s:", simulationIteration, simulationNumber, season, seasons)
 
         # if it is the first season
         if season == 1:
             # initialise the league
-            league = classes.League()
-            print("One-time initialization of league\n")
+            league = classes.League(get_simulation_rng(masterSeed, simulationIteration))
+            monitoring.logger.debug("One-time initialization of league")
 
         # simulate season and get results
-        seasonTeamResults, seasonPlayerResults = simulate_one_season(league, allowedImports, salaryCap, season, simulationIteration)
+        seasonTeamResults, seasonPlayerResults = simulate_one_season(league, allowedImports, salaryCap, season, simulationIteration, solver)
+
+        # add season results to simulation results
+        seasonTeamResultsList.append(seasonTeamResults)
+        seasonPlayerResultsList.append(seasonPlayerResults)
 
         # if the simulation came to a break condition
         if not seasonTeamResults['validSeason'][0]:
+            # break simulation
+            monitoring.logger.info("Simulation %s is terminated and termination condition is noted", simulationIteration)
+            validSimulation = False
+            break
 
-            # add season team result to simulation results
-            simulationTeamResults = pd.concat([simulationTeamResults, seasonTeamResults], ignore_index=True)
+        # prepare data for following season
+        monitoring.logger.debug("League is reset for next season simulation")
+        league.reset_for_new_season()
 
-            # add season player result to simulation results
-            simulationPlayerResults = pd.concat([simulationPlayerResults, seasonPlayerResults], ignore_index=True)
+    # combine season results and add columns to inform simulation status to team and player data
+    simulationTeamResults = add_simulation_status(pd.concat(seasonTeamResultsList, ignore_index=True), simulationIteration, validSimulation)
+    simulationPlayerResults = add_simulation_status(pd.concat(seasonPlayerResultsList, ignore_index=True), simulationIteration, validSimulation)
 
-            # add columns to inform simulation status to team data
-            simulationTeamResults.insert(loc=0, column='validSimulation', value=[False] * len(simulationTeamResults))
-            simulationTeamResults.insert(loc=0, column='simulation', value=[simulationIteration] * len(simulationTeamResults))
+    # return simulation result
+    return simulationTeamResults, simulationPlayerResults
 
-            # add columns to inform simulation status to player data
-            simulationPlayerResults.insert(loc=0, column='validSimulation', value=[False] * len(simulationPlayerResults))
-            simulationPlayerResults.insert(loc=0, column='simulation', value=[simulationIteration] * len(simulationPlayerResults))
 
-            # break simulation
-            print("Simulation is terminated and termination condition is noted")
-            return simulationTeamResults, simulationPlayerResults
+def simulate_simulation_batch(simulationIterations, allowedImports, salaryCap, seasons, simulationNumber, solver="exact", masterSeed=None):
+    """
+    Description:
+    Module to simulate several independent simulations together. Each league selects its players on its own, the
+    regular seasons and playoffs of all leagues still in the batch are then played together on arrays
 
-        # add season team result to simulation results
-        simulationTeamResults = pd.concat([simulationTeamResults, seasonTeamResults], ignore_index=True)
+    Input:
+    simulationIterations (list): the simulation iterations to be simulated together
+    allowedImports (int): the number of allowed import players per team
+    salaryCap (bool): boolean parameter indicating presence of salary cap
+    seasons (int): the number of consecutive seasons to simulate
+    simulationNumber (int): the total number of simulations to be conducted
+    solver (str): the solver used by teams for skill maximization, 'cbc' or 'exact', default is 'exact'
+    masterSeed (int): the master seed from which the random number generator of every simulation is derived,
+    default is None in which case fresh entropy is used
 
-        # add season player result to simulation results
-        simulationPlayerResults = pd.concat([simulationPlayerResults, seasonPlayerResults], ignore_index=True)
+    Returns:
+    batchTeamResults (data frame): data frame containing the team results of all simulations in the batch
+    batchPlayerResults (data frame): data frame containing the player salary results of all simulations in the batch
+    """
+    # initialise one league and empty result lists per simulation
+    leagues = {simulationIteration: classes.League(get_simulation_rng(masterSeed, simulationIteration)) for simulationIteration in simulationIterations}
+    teamResults = {simulationIteration: [] for simulationIteration in simulationIterations}
+    playerResults = {simulationIteration: [] for simulationIteration in simulationIterations}
+    validSimulations = {simulationIteration: True for simulationIteration in simulationIterations}
 
-        # prepare data for following season
-        print("League is reset for next season simulation")
-        league.reset_for_new_season()
+    # initialise simulations which are still running
+    activeIterations = list(simulationIterations)
 
-    # add columns to inform simulation status to team data
-    simulationTeamResults.insert(loc=0, column='validSimulation', value=[True] * len(simulationTeamResults))
-    simulationTeamResults.insert(loc=0, column='simulation', value=[simulationIteration] * len(simulationTeamResults))
+    # for each season in the range of seasons
+    for season in range(1, seasons + 1):
 
-    # add columns to inform simulation status to player data
-    simulationPlayerResults.insert(loc=0, column='validSimulation', value=[True] * len(simulationPlayerResults))
-    simulationPlayerResults.insert(loc=0, column='simulation', value=[simulationIteration] * len(simulationPlayerResults))
+        # print season
+        monitoring.logger.debug("Simulations %s-%s/%s, Season %s/%s:", simulationIterations[0], simulationIterations[-1], simulationNumber, season, seasons)
+
+        # initialise player pools of leagues which play the season
+        playerPools = {}
+
+        # for each running simulation
+        for simulationIteration in activeIterations:
+            # let teams select their players
+            league = leagues[simulationIteration]
+            domesticPlayerPool, foreignPlayerPool = select_players(league, allowedImports, salaryCap, season, simulationIteration, solver)
+
+            # if a team went bankrupt
+            if league.leagueCondition == "bankruptcy":
+                # add season results and terminate simulation
+                seasonTeamResults, seasonPlayerResults = get_season_results(league, domesticPlayerPool, foreignPlayerPool, season, False)
+                teamResults[simulationIteration].append(seasonTeamResults)
+                playerResults[simulationIteration].append(seasonPlayerResults)
+                validSimulations[simulationIteration] = False
+
+            # if teams are fully stacked
+            else:
+                playerPools[simulationIteration] = (domesticPlayerPool, foreignPlayerPool)
+
+        # simulate seasons of all leagues which are still running together
+        activeIterations = list(playerPools.keys())
+        monitoring.logger.debug("Simulation of regular seasons and playoffs of %s leagues", len(activeIterations))
+        functions.simulate_seasons_batch([leagues[simulationIteration] for simulationIteration in activeIterations])
+
+        # for each league which played the season
+        for simulationIteration in activeIterations:
+            # calculate final team revenue
+            league = leagues[simulationIteration]
+            with monitoring.profiler.phase("revenue"):
+                league.calculate_season_revenue(season)
+
+            # add season results
+            seasonTeamResults, seasonPlayerResults = get_season_results(league, *playerPools[simulationIteration], season, True)
+            teamResults[simulationIteration].append(seasonTeamResults)
+            playerResults[simulationIteration].append(seasonPlayerResults)
+
+            # prepare data for following season
+            league.reset_for_new_season()
+
+    # combine results of each simulation in simulation order and add simulation status
+    batchTeamResults = pd.concat([add_simulation_status(pd.concat(teamResults[simulationIteration], ignore_index=True), simulationIteration, validSimulations[simulationIteration])
+                                  for simulationIteration in simulationIterations], ignore_index=True)
+    batchPlayerResults = pd.concat([add_simulation_status(pd.concat(playerResults[simulationIteration], ignore_index=True), simulationIteration, validSimulations[simulationIteration])
+                                    for simulationIteration in simulationIterations], ignore_index=True)
+
+    # return batch results
+    return batchTeamResults, batchPlayerResults
+
+
+def simulate_iterations(simulationIterations, allowedImports, salaryCap, seasons, simulationNumber, solver="exact", batchSize=1, masterSeed=None, teamSink=None, playerSink=None):
+    """
+    Description:
+    Module to simulate a list of simulation iterations one after another or in batches
 
-    # return simulation result
-    return simulationTeamResults, simulationPlayerResults
+    Input:
+    simulationIterations (list): the simulation iterations to be simulated
+    allowedImports (int): the number of allowed import players per team
+    salaryCap (bool): boolean parameter indicating presence of salary cap
+    seasons (int): the number of consecutive seasons to simulate
+    simulationNumber (int): the total number of simulations to be conducted
+    solver (str): the solver used by teams for skill maximization, 'cbc' or 'exact', default is 'exact'
+    batchSize (int): the number of simulations whose seasons are played together on arrays, default is 1
+    masterSeed (int): the master seed from which the random number generator of every simulation is derived,
+    default is None in which case fresh entropy is used
+    teamSink (CsvSink, ColumnarSink): sink the team results are streamed to, default is None in which case results are
+    kept in memory
+    playerSink (CsvSink, ColumnarSink): sink the player salary results are streamed to, default is None in which case
+    results are kept in memory
+
+    Returns:
+    iterationsTeamResults (data frame): data frame containing the team results of all simulation iterations, None if streamed
+    iterationsPlayerResults (data frame): data frame containing the player salary results of all simulation iterations, None if streamed
+    """
+    # initialise accumulators of results, writing to the sinks if results are streamed
+    teamResults = accumulators.ResultAccumulator(teamSink)
+    playerResults = accumulators.ResultAccumulator(playerSink)
+
+    # if simulations are to be run in batches
+    if batchSize > 1:
+
+        # for each batch of simulation iterations
+        for batch in range(0, len(simulationIterations), batchSize):
+            # simulate batch
+            batchTeamResults, batchPlayerResults = simulate_simulation_batch(simulationIterations[batch:batch + batchSize], allowedImports, salaryCap, seasons, simulationNumber, solver, masterSeed)
+            teamResults.append(batchTeamResults)
+            playerResults.append(batchPlayerResults)
+            monitoring.progress.update(batchTeamResults)
+
+    # if simulations are run one after another
+    else:
+
+        # for each simulation iteration
+        for simulationIteration in simulationIterations:
+            # run one simulation of defined consecutive seasons
+            monitoring.logger.info("Start of simulation %s of %s", simulationIteration, simulationNumber)
+            simulationTeamResults, simulationPlayerResults = simulate_consecutive_seasons(pd.DataFrame(), pd.DataFrame(), allowedImports, salaryCap, seasons, simulationIteration, simulationNumber, solver, masterSeed)
+            teamResults.append(simulationTeamResults)
+            playerResults.append(simulationPlayerResults)
+            monitoring.progress.update(simulationTeamResults)
+            monitoring.logger.info("End of simulation %s of %s", simulationIteration, simulationNumber)
+
+    # return results
+    return teamResults.get_results(), playerResults.get_results()
+
+
+def compact_results(results):
+    """
+    Description:
+    Module to convert a result data frame into a compact dictionary of arrays which is cheap to send between processes.
+    Text columns are encoded as integer codes with their categories
+
+    Input:
+    results (data frame): data frame containing team or player results
+
+    Returns:
+    compactResults (dict): dictionary with column names as keys and arrays or tuples of codes and categories as values
+    """
+    # initialise compact results
+    compactResults = {}
+
+    # for each column
+    for column in results.columns:
+
+        # if column contains text
+        if pd.api.types.is_object_dtype(results[column]) or pd.api.types.is_string_dtype(results[column]):
+            # encode text as integer codes
+            codes, categories = pd.factorize(results[column])
+            compactResults[column] = (codes.astype(np.int16), np.asarray(categories))
+
+        # if column is numeric or boolean
+        else:
+            compactResults[column] = results[column].to_numpy()
+
+    return compactResults
+
+
+def expand_results(compactResultsList):
+    """
+    Description:
+    Module to merge compact results into one data frame in the given order
+
+    Input:
+    compactResultsList (list): list of compact results created by compact_results with the same columns
+
+    Returns:
+    results (data frame): data frame containing all results with the columns and types of the original data frames
+    """
+    # initialise columns
+    columns = {}
+
+    # for each column
+    for column in compactResultsList[0]:
+
+        # if column was encoded as integer codes
+        if isinstance(compactResultsList[0][column], tuple):
+            columns[column] = np.concatenate([categories[codes] for codes, categories in
+                                              [compactResults[column] for compactResults in compactResultsList]])
+
+        # if column is numeric or boolean
+        else:
+            columns[column] = np.concatenate([compactResults[column] for compactResults in compactResultsList])
+
+    return pd.DataFrame(columns)
 
 
-def simulation(allowedImports, salaryCap, seasons, simulationNumber):
+def initialise_worker(telemetryEnabled, profilingEnabled=False, profilingHooks=()):
+    """
+    Description:
+    Module to initialise a worker process of a parallel simulation, the progress output of workers is suppressed while
+    warnings, e.g. about solutions without proven optimality, are still reported
+
+    Input:
+    telemetryEnabled (bool): boolean parameter indicating if solver telemetry is recorded
+    profilingEnabled (bool): boolean parameter indicating if the phases of every season are timed, default is False
+    profilingHooks (list): hooks called at the start and end of every phase, default is no hooks
+    """
+    # suppress progress output, progress is reported by the main process
+    monitoring.logger.setLevel(max(monitoring.logger.getEffectiveLevel(), logging.WARNING))
+    monitoring.progressLogger.disabled = True
+    monitoring.progress.active = False
+
+    # enable solver telemetry and phase profiling as in main process
+    solvers.telemetry.enabled = telemetryEnabled
+    monitoring.profiler.enabled = profilingEnabled
+    monitoring.profiler.hooks = list(profilingHooks)
+
+
+def create_executor(workers):
+    """
+    Description:
+    Module to create a pool of worker processes which are initialised like the main process. A pool can be used for
+    several calls of simulate_parallel, so that workers keep their warm solver caches
+
+    Input:
+    workers (int): the number of worker processes
+
+    Returns:
+    executor (ProcessPoolExecutor): the pool of worker processes, to be shut down by the caller
+    """
+    return concurrent.futures.ProcessPoolExecutor(max_workers=workers, initializer=initialise_worker,
+                                                  initargs=(solvers.telemetry.enabled, monitoring.profiler.enabled, monitoring.profiler.hooks))
+
+
+def simulate_chunk(simulationIterations, allowedImports, salaryCap, seasons, simulationNumber, solver="exact", batchSize=1, masterSeed=None):
+    """
+    Description:
+    Module to simulate a chunk of simulation iterations in a worker process
+
+    Input:
+    simulationIterations (list): the simulation iterations of the chunk
+    allowedImports (int): the number of allowed import players per team
+    salaryCap (bool): boolean parameter indicating presence of salary cap
+    seasons (int): the number of consecutive seasons to simulate
+    simulationNumber (int): the total number of simulations to be conducted
+    solver (str): the solver used by teams for skill maximization, 'cbc' or 'exact', default is 'exact'
+    batchSize (int): the number of simulations whose seasons are played together on arrays, default is 1
+    masterSeed (int): the master seed from which the random number generator of every simulation is derived,
+    default is None in which case fresh entropy is used
+
+    Returns:
+    chunkTeamResults (dict): compact team results of the chunk
+    chunkPlayerResults (dict): compact player salary results of the chunk
+    chunkSolverRecords (list): solver telemetry records of the chunk
+    chunkSolverTime (float): wall time of all solves of the chunk in seconds
+    chunkPhaseDurations (dict): durations of the profiled phases of the chunk
+    """
+    # reset telemetry records, solver time and phase durations of worker
+    solvers.telemetry.records = []
+    solvers.telemetry.totalTime = 0.0
+    monitoring.profiler.reset()
+
+    # simulate all iterations of chunk
+    chunkTeamResults, chunkPlayerResults = simulate_iterations(simulationIterations, allowedImports, salaryCap, seasons, simulationNumber, solver, batchSize, masterSeed)
+
+    # return compact results
+    return compact_results(chunkTeamResults), compact_results(chunkPlayerResults), solvers.telemetry.records, solvers.telemetry.totalTime, monitoring.profiler.durations
+
+
+def simulate_parallel(scenarios, seasons, simulationNumber, solver="exact", batchSize=1, workers=2, chunkSize=None, masterSeed=None, checkpoint=False, simulationIterations=None, executor=None,
+                      resultAccumulators=None):
+    """
+    Description:
+    Module to distribute chunks of simulation iterations of one or several scenarios to a shared pool of worker
+    processes. Chunks of all scenarios are interleaved so that all scenarios progress together. Results are merged in
+    simulation order, independent of the order in which chunks are completed. If result accumulators are given, every
+    chunk is passed on as soon as all chunks before it are completed, so that only chunks completed out of order are
+    kept in memory
+
+    Input:
+    scenarios (list): list of scenarios, each a tuple of the number of allowed imports and the salary cap indicator
+    seasons (int): the number of consecutive seasons to simulate
+    simulationNumber (int): the number of times the simulation shall be repeated per scenario
+    solver (str): the solver used by teams for skill maximization, 'cbc' or 'exact', default is 'exact'
+    batchSize (int): the number of simulations whose seasons are played together on arrays within a chunk, default is 1
+    workers (int): the number of worker processes, default is 2
+    chunkSize (int): the number of simulation iterations per chunk, default is None in which case every worker
+    receives about four chunks
+    masterSeed (int): the master seed from which the random number generator of every simulation is derived,
+    default is None in which case fresh entropy is used
+    checkpoint (bool): boolean parameter indicating if every completed chunk is saved as checkpoint and only
+    simulation iterations missing in the checkpoints are simulated, default is False
+    simulationIterations (list): the simulation iterations to be simulated for every scenario, default is None in
+    which case all simulation iterations are simulated
+    executor (ProcessPoolExecutor): pool of worker processes created by create_executor with the same number of
+    workers, default is None in which case a pool is created and shut down within the call
+    resultAccumulators (dict): dictionary with each scenario as key and a tuple of the accumulators of the team results
+    and the player salary results as value, e.g. streaming to the result files, default is None in which case
+    results are merged once all chunks are completed
+
+    Returns:
+    scenarioResults (dict): dictionary with each scenario as key and a tuple of the data frames containing the team
+    results and the player salary results of all simulations as value, as returned by the accumulators if given
+    """
+    # define simulation iterations to be simulated for every scenario
+    scenarioIterations = {scenario: list(simulationIterations or range(1, simulationNumber + 1)) for scenario in scenarios}
+    if checkpoint:
+        scenarioIterations = {scenario: checkpoints.get_missing_iterations(checkpoints.get_checkpoint_directory(*scenario, seasons, simulationNumber), simulationNumber)
+                              for scenario in scenarios}
+
+    # define chunk size
+    if chunkSize is None:
+        chunkSize = max(1, -(-sum(len(iterations) for iterations in scenarioIterations.values()) // (4 * workers)))
+        chunkSize = min(chunkSize, simulationNumber)
+
+    # create chunks of simulation iterations
+    chunks = {scenario: [iterations[firstIndex:firstIndex + chunkSize] for firstIndex in range(0, len(iterations), chunkSize)]
+              for scenario, iterations in scenarioIterations.items()}
+
+    # create pool of worker processes unless an existing pool is used
+    ownExecutor = executor is None
+    if ownExecutor:
+        executor = create_executor(workers)
+
+    # distribute chunks to worker processes
+    try:
+        futures = {executor.submit(simulate_chunk, chunks[scenario][chunkIndex], *scenario, seasons, simulationNumber, solver, batchSize, masterSeed): (scenario, chunkIndex)
+                   for chunkIndex in range(max(len(scenarioChunks) for scenarioChunks in chunks.values()))
+                   for scenario in scenarios if chunkIndex < len(chunks[scenario])}
+
+        # initialise results of completed chunks not yet passed on, solver telemetry of all chunks and the next chunk
+        # of every scenario to be passed to its accumulators
+        chunkResults = {}
+        chunkSolverRecords = {}
+        nextChunks = {scenario: 0 for scenario in scenarios}
+        totalChunks = len(futures)
+
+        # whenever chunks are completed
+        while futures:
+            completedFutures, _ = concurrent.futures.wait(futures, return_when=concurrent.futures.FIRST_COMPLETED)
+            for future in completedFutures:
+                # release future, so that results passed on are not kept in memory
+                scenario, chunkIndex = futures.pop(future)
+                chunkTeamResults, chunkPlayerResults, chunkSolverRecords[(scenario, chunkIndex)], chunkSolverTime, chunkPhaseDurations = future.result()
+                chunkResults[(scenario, chunkIndex)] = (chunkTeamResults, chunkPlayerResults)
+
+                # add chunk to progress and phase profile
+                solvers.telemetry.totalTime += chunkSolverTime
+                monitoring.profiler.add_durations(chunkPhaseDurations)
+                monitoring.progress.update(pd.DataFrame({'simulation': chunkTeamResults['simulation'], 'validSimulation': chunkTeamResults['validSimulation']}))
+
+                # save chunk as checkpoint
+                if checkpoint:
+                    checkpoints.save_checkpoint(checkpoints.get_checkpoint_directory(*scenario, seasons, simulationNumber), chunks[scenario][chunkIndex],
+                                                expand_results([chunkTeamResults]), expand_results([chunkPlayerResults]))
+
+                # pass chunks on to accumulators in simulation order
+                if resultAccumulators is not None:
+                    while (scenario, nextChunks[scenario]) in chunkResults:
+                        nextTeamResults, nextPlayerResults = chunkResults.pop((scenario, nextChunks[scenario]))
+                        resultAccumulators[scenario][0].append(expand_results([nextTeamResults]))
+                        resultAccumulators[scenario][1].append(expand_results([nextPlayerResults]))
+                        nextChunks[scenario] += 1
+
+                # report chunk
+                monitoring.logger.info("Completed chunk %s of %s", totalChunks - len(futures), totalChunks)
+    finally:
+        if ownExecutor:
+            executor.shutdown()
+
+    # initialise results of all scenarios
+    scenarioResults = {}
+
+    # for each scenario
+    for scenario in scenarios:
+        # add solver telemetry of workers in simulation order
+        for chunkIndex in range(len(chunks[scenario])):
+            solvers.telemetry.records.extend(chunkSolverRecords[(scenario, chunkIndex)])
+
+        # merge results of all checkpoints
+        if checkpoint:
+            scenarioResults[scenario] = checkpoints.merge_checkpoints(checkpoints.get_checkpoint_directory(*scenario, seasons, simulationNumber))
+
+        # combine results passed on to the accumulators
+        elif resultAccumulators is not None:
+            scenarioResults[scenario] = (resultAccumulators[scenario][0].get_results(), resultAccumulators[scenario][1].get_results())
+
+        # merge results in simulation order
+        else:
+            scenarioResults[scenario] = (expand_results([chunkResults[(scenario, chunkIndex)][0] for chunkIndex in range(len(chunks[scenario]))]),
+                                         expand_results([chunkResults[(scenario, chunkIndex)][1] for chunkIndex in range(len(chunks[scenario]))]))
+
+    # return results of all scenarios
+    return scenarioResults
+
+
+def simulate_checkpointed(allowedImports, salaryCap, seasons, simulationNumber, solver="exact", batchSize=1, masterSeed=None):
+    """
+    Description:
+    Module to simulate the simulation iterations missing in the checkpoints of a simulation in this process. Every
+    simulation, or every batch of simulations, is saved as checkpoint once it is completed, so that an interrupted
+    simulation can be resumed with the same random numbers
+
+    Input:
+    allowedImports (int): the number of allowed import players per team
+    salaryCap (bool): boolean parameter indicating presence of salary cap
+    seasons (int): the number of consecutive seasons to simulate
+    simulationNumber (int): the number of times the simulation shall be repeated
+    solver (str): the solver used by teams for skill maximization, 'cbc' or 'exact', default is 'exact'
+    batchSize (int): the number of simulations whose seasons are played together on arrays, default is 1
+    masterSeed (int): the master seed from which the random number generator of every simulation is derived,
+    default is None in which case fresh entropy is used
+
+    Returns:
+    combinedSimulationTeamResults (data frame): data frame containing the simulation team results for all simulations
+    combinedSimulationPlayerResults (data frame): data frame containing the simulation player salary results for all simulations
+    """
+    # define checkpoint directory and simulation iterations still to be simulated
+    checkpointDirectory = checkpoints.get_checkpoint_directory(allowedImports, salaryCap, seasons, simulationNumber)
+    missingIterations = checkpoints.get_missing_iterations(checkpointDirectory, simulationNumber)
+    monitoring.logger.info("Resuming with %s of %s simulations missing", len(missingIterations), simulationNumber)
+
+    # for each simulation or batch of simulations still to be simulated
+    for firstIndex in range(0, len(missingIterations), max(batchSize, 1)):
+        # simulate and save as checkpoint
+        simulationIterations = missingIterations[firstIndex:firstIndex + max(batchSize, 1)]
+        teamResults, playerResults = simulate_iterations(simulationIterations, allowedImports, salaryCap, seasons, simulationNumber, solver, batchSize, masterSeed)
+        checkpoints.save_checkpoint(checkpointDirectory, simulationIterations, teamResults, playerResults)
+
+    # return results of all checkpoints
+    return checkpoints.merge_checkpoints(checkpointDirectory)
+
+
+def simulate_adaptive(scenarios, seasons, simulationNumber, solver="exact", batchSize=1, workers=1, chunkSize=None, masterSeed=None, precisionTargets=None, checkInterval=50):
+    """
+    Description:
+    Module to simulate scenarios until the estimates of the monitored metrics are precise enough. Simulations are run
+    in blocks, after each block the confidence intervals of every scenario are checked and scenarios whose precision
+    targets are met are not simulated any further. Simulation i uses the same random numbers as in a run with a fixed
+    number of simulations
+
+    Input:
+    scenarios (list): list of scenarios, each a tuple of the number of allowed imports and the salary cap indicator
+    seasons (int): the number of consecutive seasons to simulate
+    simulationNumber (int): the maximal number of simulations per scenario
+    solver (str): the solver used by teams for skill maximization, 'cbc' or 'exact', default is 'exact'
+    batchSize (int): the number of simulations whose seasons are played together on arrays, default is 1
+    workers (int): the number of worker processes shared by all scenarios, default is 1
+    chunkSize (int): the number of simulation iterations per chunk sent to a worker process, default is None
+    masterSeed (int): the master seed from which the random number generator of every simulation is derived,
+    default is None in which case fresh entropy is used
+    precisionTargets (dict): dictionary with the metric as key and the targeted confidence interval half width as
+    value, see convergence.metrics
+    checkInterval (int): the number of simulations per scenario between two checks of the precision, default is 50
+
+    Returns:
+    scenarioResults (dict): dictionary with each scenario as key and a tuple of the data frames containing the team
+    results and the player salary results of all simulations as value
+    """
+    # initialise convergence monitor and result accumulators of every scenario
+    monitors = {scenario: convergence.ConvergenceMonitor(precisionTargets) for scenario in scenarios}
+    teamResults = {scenario: accumulators.ResultAccumulator() for scenario in scenarios}
+    playerResults = {scenario: accumulators.ResultAccumulator() for scenario in scenarios}
+
+    # initialise scenarios whose precision targets are not yet met
+    activeScenarios = list(scenarios)
+
+    # create pool of worker processes once for all blocks, so that workers keep their warm solver caches
+    executor = create_executor(workers) if workers > 1 else None
+
+    try:
+        # for each block of simulation iterations
+        for firstIteration in range(1, simulationNumber + 1, checkInterval):
+            simulationIterations = list(range(firstIteration, min(firstIteration + checkInterval, simulationNumber + 1)))
+
+            # simulate block of all active scenarios
+            if workers > 1:
+                blockResults = simulate_parallel(activeScenarios, seasons, simulationNumber, solver, batchSize, workers, chunkSize, masterSeed, simulationIterations=simulationIterations, executor=executor)
+            else:
+                blockResults = {scenario: simulate_iterations(simulationIterations, *scenario, seasons, simulationNumber, solver, batchSize, masterSeed)
+                                for scenario in activeScenarios}
+
+            # for each active scenario
+            for scenario in activeScenarios:
+                # add results of block
+                teamResults[scenario].append(blockResults[scenario][0])
+                playerResults[scenario].append(blockResults[scenario][1])
+                monitors[scenario].add_results(*blockResults[scenario])
+
+                # print precision of estimates
+                monitoring.logger.info("Scenario imports=%s cap=%s: %s", *scenario, monitors[scenario].get_summary())
+
+            # stop simulating scenarios whose precision targets are met
+            activeScenarios = [scenario for scenario in activeScenarios if not monitors[scenario].is_converged()]
+            if not activeScenarios:
+                break
+    finally:
+        if executor is not None:
+            executor.shutdown()
+
+    # return results of all scenarios
+    return {scenario: (teamResults[scenario].get_results(), playerResults[scenario].get_results()) for scenario in scenarios}
+
+
+def simulate_scenarios(scenarios, seasons, simulationNumber, solver="exact", batchSize=1, workers=1, chunkSize=None, seed=None, checkpoint=False, precisionTargets=None, checkInterval=50):
+    """
+    Description:
+    Module to conduct the simulations of several scenarios. All scenarios use the same master seed, so simulation
+    iteration i of every scenario uses the same random number stream and faces the same season 1 domestic player
+    skills (common random numbers), differences between scenarios are thus not blurred by different draws
+
+    Input:
+    scenarios (list): list of scenarios, each a tuple of the number of allowed imports and the salary cap indicator
+    seasons (int): the number of consecutive seasons to simulate
+    simulationNumber (int): the number of times the simulation shall be repeated per scenario
+    solver (str): the solver used by teams for skill maximization, 'cbc' or 'exact', default is 'exact'
+    batchSize (int): the number of simulations whose seasons are played together on arrays, default is 1
+    workers (int): the number of worker processes shared by all scenarios, default is 1 in which case scenarios are
+    simulated one after another in this process
+    chunkSize (int): the number of simulation iterations per chunk sent to a worker process, default is None
+    seed (int): the master seed shared by all scenarios, default is None in which case fresh entropy is drawn and
+    printed so that the run can be reproduced
+    checkpoint (bool): boolean parameter indicating if completed simulations are saved as checkpoints and an
+    interrupted sweep is resumed from them with the stored master seed, default is False
+    precisionTargets (dict): dictionary with the metric as key and the targeted confidence interval half width as
+    value, default is None in which case simulationNumber simulations are run, otherwise simulationNumber is the
+    maximal number of simulations of a scenario which stops once its targets are met
+    checkInterval (int): the number of simulations per scenario between two checks of the precision, default is 50
+
+    Returns:
+    scenarioResults (dict): dictionary with each scenario as key and a tuple of the data frames containing the team
+    results and the player salary results of all simulations as value
+    """
+    # adaptive stopping decides on the number of simulations itself, which checkpoints can not resume
+    if checkpoint and precisionTargets is not None:
+        raise ValueError("Checkpoints can not be combined with precision targets")
+
+    # create master seed shared by all scenarios, or use master seed of existing checkpoints
+    if checkpoint:
+        masterSeed = checkpoints.resolve_master_seed([checkpoints.get_checkpoint_directory(*scenario, seasons, simulationNumber) for scenario in scenarios], seed)
+    else:
+        masterSeed = np.random.SeedSequence(seed).entropy
+
+    # start progress reports
+    monitoring.progress.start(len(scenarios) * simulationNumber, masterSeed=masterSeed)
+
+    # simulate scenarios until precision targets are met
+    if precisionTargets is not None:
+        scenarioResults = simulate_adaptive(scenarios, seasons, simulationNumber, solver, batchSize, workers, chunkSize, masterSeed, precisionTargets, checkInterval)
+
+    # if scenarios are to be simulated in parallel
+    elif workers > 1:
+        scenarioResults = simulate_parallel(scenarios, seasons, simulationNumber, solver, batchSize, workers, chunkSize, masterSeed, checkpoint)
+
+    # simulate scenarios one after another, saving checkpoints
+    elif checkpoint:
+        scenarioResults = {scenario: simulate_checkpointed(*scenario, seasons, simulationNumber, solver, batchSize, masterSeed) for scenario in scenarios}
+
+    # simulate scenarios one after another
+    else:
+        scenarioResults = {scenario: simulate_iterations(list(range(1, simulationNumber + 1)), *scenario, seasons, simulationNumber, solver, batchSize, masterSeed)
+                           for scenario in scenarios}
+
+    # report end of run
+    monitoring.progress.finish()
+
+    # return results of all scenarios
+    return scenarioResults
+
+
+def get_result_file_names(allowedImports, salaryCap, seasons, simulationNumber):
+    """
+    Description:
+    Module to get the names of the files the team and player salary results of a simulation are saved to
+
+    Input:
+    allowedImports (int): the number of allowed import players per team
+    salaryCap (bool): boolean parameter indicating presence of salary cap
+    seasons (int): the number of consecutive seasons simulated
+    simulationNumber (int): the number of simulations
+
+    Returns:
+    teamFileName (str): path of the file containing the team results
+    playerFileName (str): path of the file containing the player salary results
+    """
+    teamFileName = "results/teamResults_imports={}_cap={}_seasons={}_simNumb={}.csv".format(allowedImports, salaryCap, seasons, simulationNumber)
+    playerFileName = "results/playerResults_imports={}_cap={}_seasons={}_simNumb={}.csv".format(allowedImports, salaryCap, seasons, simulationNumber)
+    return teamFileName, playerFileName
+
+
+def get_result_sinks(allowedImports, salaryCap, seasons, simulationNumber, resultFormat="csv"):
+    """
+    Description:
+    Module to create the sinks the team and player salary results of a simulation are written to. Csv results are
+    written to one file per scenario, columnar results to the datasets 'results/teamResults' and
+    'results/playerResults' partitioned by the scenario parameters
+
+    Input:
+    allowedImports (int): the number of allowed import players per team
+    salaryCap (bool): boolean parameter indicating presence of salary cap
+    seasons (int): the number of consecutive seasons simulated
+    simulationNumber (int): the number of simulations
+    resultFormat (str): the format of the results, 'csv', 'parquet' or 'feather', default is 'csv'
+
+    Returns:
+    teamSink (CsvSink, ColumnarSink): sink of the team results
+    playerSink (CsvSink, ColumnarSink): sink of the player salary results
+    """
+    # if results are saved as csv files
+    if resultFormat == "csv":
+        teamFileName, playerFileName = get_result_file_names(allowedImports, salaryCap, seasons, simulationNumber)
+        return accumulators.CsvSink(teamFileName), accumulators.CsvSink(playerFileName)
+
+    # partition columnar results by scenario parameters
+    partition = {'allowedImports': allowedImports, 'cap': salaryCap, 'seasons': seasons, 'simulationNumber': simulationNumber}
+    return (accumulators.ColumnarSink(os.path.join("results", "teamResults"), partition, resultFormat),
+            accumulators.ColumnarSink(os.path.join("results", "playerResults"), partition, resultFormat))
+
+
+def save_results(combinedSimulationTeamResults, combinedSimulationPlayerResults, allowedImports, salaryCap, seasons, simulationNumber, resultFormat="csv"):
+    """
+    Description:
+    Module to save the results of a simulation to the results directory
+
+    Input:
+    combinedSimulationTeamResults (data frame): data frame containing the simulation team results for all simulations
+    combinedSimulationPlayerResults (data frame): data frame containing the simulation player salary results for all simulations
+    allowedImports (int): the number of allowed import players per team
+    salaryCap (bool): boolean parameter indicating presence of salary cap
+    seasons (int): the number of consecutive seasons simulated
+    simulationNumber (int): the number of simulations
+    resultFormat (str): the format of the results, 'csv', 'parquet' or 'feather', default is 'csv'
+    """
+    # define sinks to save results, directories are created if necessary
+    teamSink, playerSink = get_result_sinks(allowedImports, salaryCap, seasons, simulationNumber, resultFormat)
+
+    # save results
+    for sink, results in [(playerSink, combinedSimulationPlayerResults), (teamSink, combinedSimulationTeamResults)]:
+        sink.write(results)
+        sink.close()
+
+
+def simulation(allowedImports, salaryCap, seasons, simulationNumber, solver="exact", batchSize=1, workers=1, chunkSize=None, seed=None, checkpoint=False, streamResults=False, resultFormat="csv", precisionTargets=None, checkInterval=50):
     """
     Description:
     Module to conduct a simulation given the input parameters
@@ -180,42 +901,80 @@ def simulation(allowedImports, salaryCap, seasons, simulationNumber):
     salaryCap (bool): boolean parameter indicating presence of salary cap, True = present
     seasons (int): the number of consecutive seasons to simulate
     simulationNumber (int): the number of times the simulation shall be repeated
+    solver (str): the solver used by teams for skill maximization, 'cbc' or 'exact', default is 'exact'
+    batchSize (int): the number of simulations whose seasons are played together on arrays, default is 1 in which
+    case simulations are run one after another
+    workers (int): the number of worker processes, default is 1 in which case simulations are run in this process
+    chunkSize (int): the number of simulation iterations per chunk sent to a worker process, default is None in which
+    case every worker receives about four chunks
+    seed (int): the master seed from which the random number generator of every simulation is derived, default is
+    None in which case fresh entropy is drawn and printed so that the run can be reproduced
+    checkpoint (bool): boolean parameter indicating if completed simulations are saved as checkpoints and an
+    interrupted simulation is resumed from them with the stored master seed, default is False
+    streamResults (bool): boolean parameter indicating if results are written to the result files while simulating
+    instead of being kept in memory, default is False
+    resultFormat (str): the format of the results if they are streamed, 'csv', 'parquet' or 'feather', default is 'csv'
+    precisionTargets (dict): dictionary with the metric as key and the targeted confidence interval half width as
+    value, default is None in which case simulationNumber simulations are run, otherwise simulationNumber is the
+    maximal number of simulations which stops once the targets are met
+    checkInterval (int): the number of simulations between two checks of the precision, default is 50
 
     Returns:
-    combinedSimulationTeamResults (data frame): data frame containing the updated simulation team results for all simulations
-    combinedSimulationPlayerResults (data frame): data frame containing the updated simulation player salary results for all simulations
+    combinedSimulationTeamResults (data frame): data frame containing the updated simulation team results for all simulations, None if streamed
+    combinedSimulationPlayerResults (data frame): data frame containing the updated simulation player salary results for all simulations, None if streamed
+    simulatedNumber (int): the number of simulations run, which is smaller than simulationNumber if the precision
+    targets were met early, result files are named by it
     """
-    # initialize empty data frames to log results of all simulations
-    combinedSimulationTeamResults = pd.DataFrame()
-    combinedSimulationPlayerResults = pd.DataFrame()
+    # if completed simulations are saved as checkpoints or simulations stop once precision targets are met
+    if checkpoint or precisionTargets is not None:
+        # simulate as single scenario sweep
+        teamResults, playerResults = simulate_scenarios([(allowedImports, salaryCap)], seasons, simulationNumber, solver, batchSize, workers, chunkSize, seed, checkpoint,
+                                                        precisionTargets, checkInterval)[(allowedImports, salaryCap)]
+
+        # count simulations run, which are fewer if the targets were met early
+        simulatedNumber = teamResults['simulation'].nunique()
+
+        # define sinks of the result files named by the simulations run if results are streamed
+        teamSink, playerSink = get_result_sinks(allowedImports, salaryCap, seasons, simulatedNumber, resultFormat) if streamResults else (None, None)
 
-    # initialize simulation iterable
-    simulationIteration = 1
+    # if simulations are not resumed or stopped early
+    else:
+        # all simulations are run
+        simulatedNumber = simulationNumber
 
-    # while the total number of simulations is not reached
-    while simulationIteration <= simulationNumber:
+        # define sinks of the result files if results are streamed
+        teamSink, playerSink = get_result_sinks(allowedImports, salaryCap, seasons, simulatedNumber, resultFormat) if streamResults else (None, None)
 
-        # print information simulation
-        print("\nStart of simulation {} of {}".format(simulationIteration, simulationNumber))
+        # create master seed, every simulation derives its own random number generator from it
+        masterSeed = np.random.SeedSequence(seed).entropy
 
-        # initialize empty data frames to log results of one simulation
-        simulationTeamResults = pd.DataFrame()
-        simulationPlayerResults = pd.DataFrame()
+        # start progress reports
+        monitoring.progress.start(simulationNumber, masterSeed=masterSeed)
 
-        # run one simulation of defined consecutive seasons
-        simulationTeamResults, simulationPlayerResults = simulate_consecutive_seasons(simulationTeamResults, simulationPlayerResults, allowedImports, salaryCap, seasons, simulationIteration, simulationNumber)
+        # if simulations are to be run in parallel, simulate chunks of simulation iterations in worker processes,
+        # streaming every chunk to the result files as soon as the chunks before it are completed
+        if workers > 1:
+            resultAccumulators = {(allowedImports, salaryCap): (accumulators.ResultAccumulator(teamSink), accumulators.ResultAccumulator(playerSink))} if streamResults else None
+            teamResults, playerResults = simulate_parallel([(allowedImports, salaryCap)], seasons, simulationNumber, solver, batchSize, workers, chunkSize, masterSeed,
+                                                           resultAccumulators=resultAccumulators)[(allowedImports, salaryCap)]
 
-        # add simulation team result to combined simulation results
-        combinedSimulationTeamResults = pd.concat([combinedSimulationTeamResults, simulationTeamResults], ignore_index=True)
+        # if simulations are run in this process, one after another or in batches
+        else:
+            teamResults, playerResults = simulate_iterations(list(range(1, simulationNumber + 1)), allowedImports, salaryCap, seasons, simulationNumber, solver, batchSize, masterSeed,
+                                                             teamSink, playerSink)
 
-        # add simulation player result to combined simulation results
-        combinedSimulationPlayerResults = pd.concat([combinedSimulationPlayerResults, simulationPlayerResults], ignore_index=True)
+        # report end of run
+        monitoring.progress.finish()
 
-        # print information to indicate end of simulation
-        print("\nEnd of simulation {} of {}\n\n".format(simulationIteration, simulationNumber))
+    # results simulated in this process are already streamed
+    if teamResults is None:
+        return None, None, simulatedNumber
 
-        # increase simulation iterable
-        simulationIteration += 1
+    # add results of all simulations, writing to the result files if results are streamed
+    combinedSimulationTeamResults = accumulators.ResultAccumulator(teamSink)
+    combinedSimulationPlayerResults = accumulators.ResultAccumulator(playerSink)
+    combinedSimulationTeamResults.append(teamResults)
+    combinedSimulationPlayerResults.append(playerResults)
 
     # return simulation result
-    return combinedSimulationTeamResults, combinedSimulationPlayerResults
\ No newline at end of file
+    return combinedSimulationTeamResults.get_results(), combinedSimulationPlayerResults.get_results(), simulatedNumber
@@ -0,0 +1,721 @@
+import numpy as np
+import pandas as pd
+import abc
+import collections
+import hashlib
+import os
+import pickle
+import pulp as pl
+from pulp import PULP_CBC_CMD
+
+
+# define solution status labels reported by the skill maximization engines
+optimalStatus = "Optimal"  # solution is proven to be optimal
+feasibleStatus = "Feasible"  # a feasible solution is found but optimality is not proven, e.g. after a time limit
+notSolvedStatus = "Not Solved"  # no solution is available
+
+# translation of the solution status reported by CBC to the solution status of the skill maximization engines
+cbcStatus = {pl.LpSolutionOptimal: optimalStatus,
+             pl.LpSolutionIntegerFeasible: feasibleStatus}
+
+
+def get_fingerprint(skills, salaries, counts):
+    """
+    Description:
+    Function to calculate a fingerprint which identifies a player pool by the skills, salaries and number of players
+    of its skill classes, pools with the same fingerprint lead to the same skill maximization problems
+
+    Input:
+    skills (list, array): The skill levels of all skill classes, rounded to two decimals
+    salaries (list, array): The salaries of all skill classes
+    counts (list, array): The number of players in every skill class
+
+    Returns:
+    fingerprint (str): Hexadecimal digest of the pool
+    """
+    # initialise hash
+    digest = hashlib.sha1()
+
+    # add the integer representation of every vector to the hash
+    for vector in [get_skill_units(skills), np.rint(np.asarray(salaries, dtype=float)), np.asarray(counts)]:
+        digest.update(np.ascontiguousarray(vector, dtype=np.int64).tobytes())
+
+    # return digest
+    return digest.hexdigest()
+
+
+def get_skill_units(skills):
+    """
+    Description:
+    Function to convert player skills which are rounded to two decimals into integer skill units of 0.01
+
+    Input:
+    skills (list, array): The skill levels of players, rounded to two decimals
+
+    Returns:
+    skillUnits (array): Integer array with the skill of every player expressed in units of 0.01
+    """
+    # scale skills to units of 0.01
+    scaledSkills = np.asarray(skills, dtype=float) * 100
+
+    # round scaled skills to the closest integer
+    skillUnits = np.rint(scaledSkills).astype(np.int64)
+
+    # the engine is only exact if the skills are on the grid of 0.01
+    if not np.allclose(scaledSkills, skillUnits, rtol=0, atol=1e-6) or np.any(skillUnits < 0):
+        raise ValueError("Player skills must be non-negative and rounded to two decimals")
+
+    # return skill units
+    return skillUnits
+
+
+# define exact table of the cardinality constrained knapsack problem as class
+class KnapsackTable(object):
+    def __init__(self, skills, salaries, selectionSize, counts=None):
+        """
+        Description:
+        Initializes the table of the cardinality constrained bounded knapsack problem which teams solve to maximize
+        skill. Players are given as skill classes of identical skill and salary with a number of available players per
+        class. Since skills are rounded to 0.01, the problem is solved exactly with integer dynamic programming over the
+        number of selected players and the achieved skill, storing the minimal salary sum for every combination
+
+        Input:
+        skills (list, array): The skill levels of all skill classes, rounded to two decimals
+        salaries (list, array): The salaries of all skill classes
+        selectionSize (int): The maximal number of players to be selected
+        counts (list, array): The number of players in every skill class, default is None in which case every class
+        consists of one player
+
+        A knapsack table object has the following attributes:
+        self.skillUnits (array): integer skill of every skill class in units of 0.01
+        self.salaries (array): integer salary of every skill class
+        self.counts (array): number of players in every skill class
+        self.selectionSize (int): the maximal number of players to be selected
+        self.pieceClass (array): skill class of every piece, classes are split into pieces of 1, 2, 4, ... players so
+        that any number of players of a class is a combination of its pieces
+        self.pieceSize (array): number of players in every piece
+        self.minimalSalary (array): array of shape (selectionSize+1, maximal skill units+1) with the minimal salary sum
+        required to select exactly a certain number of players with exactly a certain skill sum
+        self.frontierSalary (array): minimal salary sum required to reach at least a certain skill sum, the optimal
+        value versus budget frontier which is non-decreasing in the skill sum
+        self.selectionBudget (array): minimal budget of every point on the frontier at which the optimal skill sum
+        increases, increasing so that the selection for a budget is found by binary search
+        self.selectionUnits (array): optimal skill sum in units of 0.01 of every point on the frontier
+        self.selectionCounts (array): array of shape (points on frontier, skill classes) with the number of selected
+        players per skill class of every point on the frontier
+        """
+        self.skillUnits = get_skill_units(skills)
+        self.salaries = np.rint(np.asarray(salaries, dtype=float)).astype(np.int64)
+        self.counts = np.ones(len(self.skillUnits), dtype=np.int64) if counts is None else np.asarray(counts, dtype=np.int64)
+        self.selectionSize = int(selectionSize)
+        self.pieceClass, self.pieceSize = self.split_classes()
+        self.minimalSalary, takesPiece = self.build_table()
+        self.frontierSalary = np.minimum.accumulate(self.minimalSalary.min(axis=0)[::-1])[::-1]
+        self.selectionBudget, self.selectionUnits, self.selectionCounts = self.build_selection_table(takesPiece)
+
+    def split_classes(self):
+        """
+        Description:
+        Split every skill class into pieces of 1, 2, 4, ... players and a remainder, a class never contributes more
+        players than the selection size
+
+        Returns:
+        pieceClass (array): Skill class of every piece
+        pieceSize (array): Number of players in every piece
+        """
+        # initialise empty lists of pieces
+        pieceClass = []
+        pieceSize = []
+
+        # for each skill class
+        for skillClass, count in enumerate(np.minimum(self.counts, self.selectionSize)):
+            # initialise size of first piece
+            size = 1
+
+            # as long as players of the class are left
+            while count > 0:
+                # add piece with at most the remaining players
+                pieceClass.append(skillClass)
+                pieceSize.append(min(size, count))
+
+                # go to next piece
+                count -= size
+                size *= 2
+
+        # return pieces
+        return np.array(pieceClass, dtype=np.int64), np.array(pieceSize, dtype=np.int64)
+
+    def build_table(self):
+        """
+        Description:
+        Fill the dynamic programming table piece by piece
+
+        Returns:
+        minimalSalary (array): Minimal salary sum per number of selected players and skill sum, unreachable states
+        have the value of an integer larger than any budget
+        takesPiece (array): Indicator if a piece is taken in the cheapest selection reaching a state
+        """
+        # get the largest reachable skill sum given the selection size
+        maximalUnits = int(np.sort(np.repeat(self.skillUnits[self.pieceClass], self.pieceSize))[::-1][:self.selectionSize].sum())
+
+        # define a value for unreachable states which can not overflow when salaries are added
+        unreachable = np.iinfo(np.int64).max // 2
+
+        # initialise table where only the empty selection is reachable
+        minimalSalary = np.full((self.selectionSize + 1, maximalUnits + 1), unreachable, dtype=np.int64)
+        minimalSalary[0, 0] = 0
+
+        # initialise table of piece decisions
+        takesPiece = np.zeros((len(self.pieceClass), self.selectionSize + 1, maximalUnits + 1), dtype=bool)
+
+        # for each piece
+        for piece in range(len(self.pieceClass)):
+            # extract number of players, skill units and salary of piece
+            size = self.pieceSize[piece]
+            units = self.skillUnits[self.pieceClass[piece]] * size
+            salary = self.salaries[self.pieceClass[piece]] * size
+
+            # pieces with a skill above the reachable maximum can not be part of any selection
+            if units > maximalUnits:
+                continue
+
+            # calculate salary sums of all states when the piece is added to every state with less players
+            candidateSalary = minimalSalary[:-size, :maximalUnits + 1 - units] + salary
+
+            # identify states which are reached cheaper by taking the piece
+            reachedStates = minimalSalary[size:, units:]
+            improvement = candidateSalary < reachedStates
+
+            # store decision and update table in place
+            takesPiece[piece, size:, units:] = improvement
+            np.minimum(reachedStates, candidateSalary, out=reachedStates)
+
+        # return tables
+        return minimalSalary, takesPiece
+
+    def build_selection_table(self, takesPiece):
+        """
+        Description:
+        Recover the selected players of every point on the frontier at once by going backwards through the piece
+        decisions for all points simultaneously, the piece decisions are not required afterwards
+
+        Input:
+        takesPiece (array): Indicator if a piece is taken in the cheapest selection reaching a state
+
+        Returns:
+        selectionBudget (array): Minimal budget of every point on the frontier
+        selectionUnits (array): Optimal skill sum in units of 0.01 of every point on the frontier
+        selectionCounts (array): Number of selected players per skill class of every point on the frontier
+        """
+        # identify the highest skill sum of every required budget, the highest skill sum is always reachable
+        selectionUnits = np.flatnonzero(np.diff(self.frontierSalary, append=np.iinfo(np.int64).max) > 0)
+        selectionBudget = self.frontierSalary[selectionUnits]
+
+        # among all selection sizes reaching a skill sum choose the cheapest one
+        units = selectionUnits.copy()
+        size = np.argmin(self.minimalSalary[:, units], axis=0)
+
+        # initialise table of selected players, a class never contributes more than the selection size
+        selectionCounts = np.zeros((len(units), len(self.skillUnits)), dtype=np.uint8)
+
+        # for each piece in reversed order
+        for piece in range(len(self.pieceClass) - 1, -1, -1):
+            # identify points whose current state contains the piece, the empty selection never contains a piece
+            takes = takesPiece[piece, size, units]
+
+            # add players of piece and go to states without the piece
+            selectionCounts[takes, self.pieceClass[piece]] += int(self.pieceSize[piece])
+            size[takes] -= self.pieceSize[piece]
+            units[takes] -= self.skillUnits[self.pieceClass[piece]] * self.pieceSize[piece]
+
+        # return selection table
+        return selectionBudget, selectionUnits, selectionCounts
+
+    def solve(self, budget):
+        """
+        Description:
+        Solve the knapsack problem for a budget by looking up the point on the frontier with the highest skill sum
+        which can be afforded
+
+        Input:
+        budget (int): The budget constraint used to optimize skill
+
+        Returns:
+        selectedCounts (array): Number of selected players of every skill class
+        status (str): Status of solution which is optimal since the table is exact, or not solved if not even the
+        cheapest point of the frontier can be afforded, e.g. with a negative budget
+        objective (float): The maximal skill sum
+        """
+        # the budgets of the frontier are increasing so that the affordable points form a prefix
+        point = int(np.searchsorted(self.selectionBudget, budget, side='right')) - 1
+
+        # if no point can be afforded, the problem is infeasible as for CBC
+        if point < 0:
+            return np.zeros(len(self.skillUnits), dtype=np.int64), notSolvedStatus, 0.0
+
+        # return number of selected players per class
+        return self.selectionCounts[point].astype(np.int64), optimalStatus, self.selectionUnits[point] / 100
+
+    def get_frontier(self):
+        """
+        Description:
+        Get the optimal skill versus budget frontier of the player pool
+
+        Returns:
+        frontier (dataframe): Dataframe with the minimal budget required for every skill sum at which the optimal
+        skill sum increases
+        """
+        # return frontier
+        return pd.DataFrame({'budget': self.selectionBudget, 'skill': self.selectionUnits / 100})
+
+
+def solve_knapsack(skills, salaries, budget, selectionSize, counts=None):
+    """
+    Description:
+    Function which solves a single cardinality constrained knapsack problem exactly
+
+    Input:
+    skills (list, array): The skill levels of all skill classes, rounded to two decimals
+    salaries (list, array): The salaries of all skill classes
+    budget (int): The budget constraint used to optimize skill
+    selectionSize (int): The maximal number of players to be selected
+    counts (list, array): The number of players in every skill class, default is None in which case every class
+    consists of one player
+
+    Returns:
+    selectedCounts (array): Number of selected players of every skill class
+    status (str): Status of solution
+    objective (float): The maximal skill sum
+    """
+    # build table and solve it for the budget
+    return KnapsackTable(skills, salaries, selectionSize, counts).solve(budget)
+
+
+# define cache with least recently used eviction as class
+class SolverCache(object):
+    def __init__(self, maxSize):
+        """
+        Description:
+        Initializes a cache of solver results or tables. When the cache is full, the least recently used entry is
+        removed
+
+        Input:
+        maxSize (int): The maximal number of entries kept in the cache
+
+        A solver cache object has the following attributes:
+        self.maxSize (int): the maximal number of entries
+        self.entries (OrderedDict): the cached entries ordered from least to most recently used
+        self.hits (int): the number of successful lookups
+        self.misses (int): the number of lookups of missing entries
+        """
+        self.maxSize = maxSize
+        self.entries = collections.OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key):
+        """
+        Description:
+        Look up an entry and mark it as most recently used
+
+        Input:
+        key (tuple): Key of the entry
+
+        Returns:
+        value (object): The cached value or None if the entry does not exist
+        """
+        # if entry does not exist
+        if key not in self.entries:
+            # count miss
+            self.misses += 1
+
+            return None
+
+        # count hit and mark entry as most recently used
+        self.hits += 1
+        self.entries.move_to_end(key)
+
+        return self.entries[key]
+
+    def put(self, key, value):
+        """
+        Description:
+        Add an entry to the cache and remove the least recently used entries if the cache is full
+
+        Input:
+        key (tuple): Key of the entry
+        value (object): Value to be cached
+        """
+        # add entry as most recently used
+        self.entries[key] = value
+        self.entries.move_to_end(key)
+
+        # remove least recently used entries
+        while len(self.entries) > self.maxSize:
+            self.entries.popitem(last=False)
+
+    def get_stats(self):
+        """
+        Description:
+        Get the usage statistics of the cache
+
+        Returns:
+        stats (dict): Dictionary with the number of hits, misses, entries and the hit rate
+        """
+        # calculate share of successful lookups
+        lookups = self.hits + self.misses
+        hitRate = self.hits / lookups if lookups > 0 else 0
+
+        return {'hits': self.hits, 'misses': self.misses, 'entries': len(self.entries), 'hitRate': hitRate}
+
+    def clear(self):
+        """
+        Description:
+        Remove all entries and reset the usage statistics, e.g. to time solves without cached results
+        """
+        self.entries = collections.OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def save(self, fileName):
+        """
+        Description:
+        Save the cached entries to disk so that later runs start with a warm cache
+
+        Input:
+        fileName (str): Path of the file
+        """
+        with open(fileName, 'wb') as file:
+            pickle.dump(self.entries, file)
+
+    def load(self, fileName):
+        """
+        Description:
+        Load cached entries from disk if the file exists
+
+        Input:
+        fileName (str): Path of the file
+        """
+        # if no cache was saved yet
+        if not os.path.exists(fileName):
+            return
+
+        # add saved entries as least recently used entries
+        with open(fileName, 'rb') as file:
+            savedEntries = pickle.load(file)
+        savedEntries.update(self.entries)
+        self.entries = savedEntries
+
+        # remove least recently used entries
+        while len(self.entries) > self.maxSize:
+            self.entries.popitem(last=False)
+
+
+# define collector of solver telemetry as class
+class SolverTelemetry(object):
+    def __init__(self):
+        """
+        Description:
+        Initializes the collector of solver telemetry which records every skill maximization solve
+
+        A solver telemetry object has the following attributes:
+        self.enabled (bool): indicator if solves are recorded, initialised with False
+        self.context (dict): information added to every record, e.g. the current simulation and season
+        self.records (list): list with one dictionary per recorded solve
+        self.totalTime (float): total wall time of all solves of the process in seconds, accumulated even if
+        telemetry is disabled so that the share of solver time can be reported
+        """
+        self.enabled = False
+        self.context = {}
+        self.records = []
+        self.totalTime = 0.0
+
+    def record(self, **values):
+        """
+        Description:
+        Record a solve together with the current context if telemetry is enabled
+
+        Input:
+        values (dict): Information about the solve
+        """
+        # if telemetry is enabled
+        if self.enabled:
+            # add record
+            self.records.append({**self.context, **values})
+
+    def get_records(self):
+        """
+        Description:
+        Get all recorded solves
+
+        Returns:
+        solverRecords (dataframe): Dataframe with one row per recorded solve
+        """
+        return pd.DataFrame(self.records)
+
+    def get_diagnostics(self):
+        """
+        Description:
+        Aggregate recorded solves per simulation, season, player pool and solver
+
+        Returns:
+        diagnostics (dataframe): Dataframe with the number of solves, cached solves and solves without proven
+        optimality, the total and maximal wall time, the maximal optimality gap and the mean problem size
+        """
+        # get recorded solves
+        solverRecords = self.get_records()
+
+        # if nothing was recorded
+        if solverRecords.empty:
+            return solverRecords
+
+        # define columns to group by
+        groups = [column for column in ['simulation', 'season', 'pool', 'solver'] if column in solverRecords.columns]
+
+        # aggregate records
+        diagnostics = solverRecords.groupby(groups).agg(
+            solves=('time', 'size'),
+            cachedSolves=('cached', 'sum'),
+            notOptimal=('status', lambda status: int((status != optimalStatus).sum())),
+            totalTime=('time', 'sum'),
+            maxTime=('time', 'max'),
+            maxGap=('gap', 'max'),
+            meanClasses=('classes', 'mean')
+        ).reset_index()
+
+        return diagnostics
+
+    def reset(self):
+        """
+        Description:
+        Remove all records and the context
+        """
+        self.context = {}
+        self.records = []
+
+
+# define collector of solver telemetry
+telemetry = SolverTelemetry()
+
+
+def get_bound(playerPool, teamBudget, selectionSize, status, objective):
+    """
+    Description:
+    Function to get an upper bound of the skill maximization problem and the optimality gap of a solution, solutions
+    without proven optimality are bounded by the exact solution of the problem
+
+    Input:
+    playerPool (PlayerPool): A player pool of either object DomesticPlayerPool or ForeignPlayerPool
+    teamBudget (int): The budget constraint for a particular team used to optimize skill
+    selectionSize (int): The number of players to be selected as condition
+    status (str): Status of solution
+    objective (float): The skill sum of the solution
+
+    Returns:
+    bound (float): Upper bound of the skill sum
+    gap (float): Relative gap between bound and skill sum of the solution
+    """
+    # if solution is proven to be optimal
+    if status == optimalStatus:
+        # objective is the bound
+        bound = objective
+
+    # if optimality is not proven
+    else:
+        # look up exact optimum
+        bound = playerPool.get_knapsack_table(selectionSize).solve(teamBudget)[2]
+
+    # calculate relative gap
+    gap = (bound - objective) / bound if bound > 0 else 0
+
+    return bound, gap
+
+
+# define caches which are reused across seasons and simulations
+tableCache = SolverCache(64)  # knapsack tables of foreign player pools, identified by allowed imports and salary scale
+resultCache = SolverCache(65536)  # results of skill maximization, identified by pool fingerprint, budget, selection size and solver
+
+
+def get_cached_table(key, skills, salaries, selectionSize, counts=None):
+    """
+    Description:
+    Function to get a knapsack table from the cache of tables which are reused across seasons and simulations, the
+    table is built and added to the cache if it does not exist yet
+
+    Input:
+    key (tuple): Key which uniquely identifies the skills, salaries, counts and selection size of the table
+    skills (list, array): The skill levels of all skill classes, rounded to two decimals
+    salaries (list, array): The salaries of all skill classes
+    selectionSize (int): The maximal number of players to be selected
+    counts (list, array): The number of players in every skill class, default is None
+
+    Returns:
+    knapsackTable (KnapsackTable): The table of the skill maximization problem
+    """
+    # look up table
+    knapsackTable = tableCache.get(key)
+
+    # if table does not exist yet
+    if knapsackTable is None:
+        # build table and add it to the cache
+        knapsackTable = KnapsackTable(skills, salaries, selectionSize, counts)
+        tableCache.put(key, knapsackTable)
+
+    return knapsackTable
+
+
+# define interface of solver backends as abstract class
+class SolverBackend(abc.ABC):
+    name = None  # name of backend used in configuration and cache keys
+
+    @abc.abstractmethod
+    def solve(self, playerPool, teamBudget, selectionSize):
+        """
+        Description:
+        Solve the skill maximization problem of a team over the skill classes of a player pool
+
+        Input:
+        playerPool (PlayerPool): A player pool of either object DomesticPlayerPool or ForeignPlayerPool
+        teamBudget (int): The budget constraint for a particular team used to optimize skill
+        selectionSize (int): The number of players to be selected as condition
+
+        Returns:
+        selectedCounts (array): Number of selected players of every skill class
+        status (str): Status of solution
+        objective (float): The skill sum of the selection
+        """
+
+
+# define exact in-process backend as class
+class ExactBackend(SolverBackend):
+    name = "exact"
+
+    def solve(self, playerPool, teamBudget, selectionSize):
+        """
+        Description:
+        Solve the skill maximization problem with the exact knapsack table of the player pool which is built once per
+        pool and selection size, no external process is involved
+        """
+        # look up solution in table
+        return playerPool.get_knapsack_table(selectionSize).solve(teamBudget)
+
+
+# define CBC backend as class
+class CbcBackend(SolverBackend):
+    name = "cbc"
+
+    def __init__(self, timeLimit=30):
+        """
+        Description:
+        Initializes the CBC backend which solves a PuLP model with the CBC binary. One model is kept per player pool and
+        selection size so that only the budget of the budget constraint changes between teams
+
+        Input:
+        timeLimit (int): The time limit of CBC in seconds, default is 30
+
+        A CBC backend object has the following attributes:
+        self.timeLimit (int): the time limit of CBC in seconds
+        self.models (SolverCache): the persistent models with pool fingerprint and selection size as key and a tuple
+        of problem and variables as value
+        """
+        self.timeLimit = timeLimit
+        self.models = SolverCache(4)
+
+    def build_model(self, playerPool, selectionSize):
+        """
+        Description:
+        Build the bounded knapsack model over the skill classes of a player pool with a budget constraint whose budget
+        is set before every solve
+
+        Input:
+        playerPool (PlayerPool): A player pool of either object DomesticPlayerPool or ForeignPlayerPool
+        selectionSize (int): The number of players to be selected as condition
+
+        Returns:
+        prob (LpProblem): The model
+        integers (list): The integer variables of the skill classes
+        """
+        # initialize variables
+        skills = playerPool.skillClasses['skill'].tolist()  # get skill levels of all classes as list
+        salaries = playerPool.skillClasses['salary'].tolist()  # get salaries of all classes as list
+        counts = playerPool.skillClasses['count'].tolist()  # get number of players of all classes as list
+        integers = [pl.LpVariable(  # initialise list of integer variables, one for each skill class
+            "class_{}".format(i),  # name the variables: class_index
+            lowBound=0, upBound=counts[i],  # at most all players of the class can be selected
+            cat="Integer") for i in range(len(skills))]  # iterate through all classes
+
+        # initialize problem
+        prob = pl.LpProblem(name="BestTeam", sense=-1)  # sense=-1 indicates maximization problem
+
+        # define objective function
+        prob += pl.lpSum(integers[i] * skills[i] for i in range(len(skills)))  # maximize skill
+
+        # define the constraints
+        prob += pl.lpSum(integers[i] for i in range(len(skills))) <= selectionSize, "size"  # team size constraint
+        prob += pl.lpSum(integers[i] * salaries[i] for i in range(len(skills))) <= 0, "budget"  # budget constraint
+
+        return prob, integers
+
+    def solve(self, playerPool, teamBudget, selectionSize):
+        """
+        Description:
+        Solve the skill maximization problem with CBC after setting the budget of the persistent model
+        """
+        # get persistent model of player pool
+        key = (playerPool.fingerprint, selectionSize)
+        model = self.models.get(key)
+
+        # if model does not exist yet
+        if model is None:
+            # build model
+            model = self.build_model(playerPool, selectionSize)
+            self.models.put(key, model)
+
+        # set budget of team as right hand side of budget constraint
+        prob, integers = model
+        prob.constraints['budget'].constant = -teamBudget
+
+        # solve problem to obtain the optimal solution (best team)
+        prob.solve(solver=PULP_CBC_CMD(msg=False, timeLimit=self.timeLimit))
+
+        # translate solution status of solver
+        status = cbcStatus.get(prob.sol_status, notSolvedStatus)
+
+        # obtain number of selected players per class
+        selectedCounts = np.array([round(v.varValue or 0) for v in integers]).astype(int)
+
+        return selectedCounts, status, pl.value(prob.objective)
+
+
+# define available solver backends
+solverBackends = {ExactBackend.name: ExactBackend, CbcBackend.name: CbcBackend}
+
+# define instances of solver backends which are created once per run
+backendInstances = {}
+
+
+def get_backend(solver):
+    """
+    Description:
+    Function to get the solver backend for a configured solver, one instance is kept per backend name so that
+    persistent models are reused across calls
+
+    Input:
+    solver (str, SolverBackend): The solver backend or the name of a backend in solverBackends
+
+    Returns:
+    backend (SolverBackend): The solver backend
+    """
+    # if a backend is passed directly
+    if isinstance(solver, SolverBackend):
+        return solver
+
+    # if solver is unknown
+    if solver not in solverBackends:
+        raise ValueError("Unknown solver '{}', use one of {}".format(solver, list(solverBackends)))
+
+    # if backend is not yet instantiated
+    if solver not in backendInstances:
+        backendInstances[solver] = solverBackends[solver]()
+
+    return backendInstances[solver]
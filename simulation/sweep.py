@@ -0,0 +1,49 @@
+import itertools as it
+import monitoring
+import simulationModules
+
+# sweep parameters
+allowedImportsGrid = [4, 6, 10]  # the numbers of allowed import players per team to simulate, references 'rho' in thesis
+salaryCapGrid = [True, False]  # the salary cap indicators to simulate, references 'R_cap' in thesis
+seasons = 10  # the number of consecutive seasons to simulate in one simulation, references 't' in thesis
+simulationNumber = 1000  # the number of times the simulation shall be repeated per scenario
+solver = "exact"  # the solver used by teams for skill maximization, 'exact' = in-process exact engine, 'cbc' = PuLP with CBC
+batchSize = 1  # the number of simulations whose seasons are played together on arrays, 1 = simulations are run one after another
+workers = 1  # the number of worker processes shared by all scenarios, 1 = scenarios are simulated one after another
+chunkSize = None  # the number of simulations per chunk sent to a worker process, None = about four chunks per worker
+seed = None  # master seed shared by all scenarios (common random numbers), None = fresh entropy which is printed
+checkpoint = False  # boolean indicator if completed simulations are saved to results/checkpoints and an interrupted sweep is resumed from them
+resultFormat = "csv"  # the format of the results, 'csv' = one csv file per scenario, 'parquet' or 'feather' = columnar datasets partitioned by scenario, requires pyarrow
+precisionTargets = None  # confidence interval half widths per metric at which a scenario stops early, e.g. {'meanPlayerSalary': 2000, 'championshipShare': 0.02}, simulationNumber is then the maximum, None = fixed simulationNumber
+checkInterval = 50  # the number of simulations between two checks of the precision targets
+verbosity = "quiet"  # the output while simulating, 'quiet' = progress reports and warnings, 'info' = also every simulation, 'debug' = also every stage of every season
+reportInterval = 30  # seconds between two progress reports of simulations/s, seasons/s, ETA, bankruptcies and solver share of time
+progressFile = None  # file to which every progress report is appended as JSON line, None = no file
+phaseProfiling = False  # boolean indicator if the phases of every season are timed, reported per scenario at the end and saved as profile table beside the results
+
+# run sweep only when executed as script, so that worker processes can import this file safely
+if __name__ == "__main__":
+
+    # configure output
+    monitoring.configure_logging(verbosity, reportInterval, progressFile)
+
+    # enable phase profiling
+    monitoring.profiler.enabled = phaseProfiling
+
+    # define all combinations of scenario parameters
+    scenarios = list(it.product(allowedImportsGrid, salaryCapGrid))
+
+    # run simulations of all scenarios with defined parameters
+    scenarioResults = simulationModules.simulate_scenarios(scenarios, seasons, simulationNumber, solver, batchSize, workers, chunkSize, seed, checkpoint, precisionTargets, checkInterval)
+
+    # save results of every scenario, named by the number of simulations run, which is smaller if the precision targets were met early
+    for (allowedImports, salaryCap), (combinedSimulationTeamResults, combinedSimulationPlayerResults) in scenarioResults.items():
+        simulatedNumber = combinedSimulationTeamResults['simulation'].nunique()
+        simulationModules.save_results(combinedSimulationTeamResults, combinedSimulationPlayerResults, allowedImports, salaryCap, seasons, simulatedNumber, resultFormat)
+
+    # if phases are profiled
+    if phaseProfiling:
+        # report and save phase profile of all scenarios to new directory
+        monitoring.profiler.log_report()
+        profileFileName = "results/phaseProfile_sweep_seasons={}_simNumb={}.csv".format(seasons, simulationNumber)
+        monitoring.profiler.get_report().to_csv(profileFileName, index=False)
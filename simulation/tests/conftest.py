@@ -0,0 +1,7 @@
+import os
+import sys
+
+# run tests from the simulation folder, whose modules import each other by name and read data by relative paths
+simulationDirectory = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, simulationDirectory)
+os.chdir(simulationDirectory)
@@ -0,0 +1,26 @@
+import os
+import pandas as pd
+import checkpoints
+import monitoring
+import simulationModules
+
+
+def test_resumed_results_equal_uninterrupted_results(tmp_path, monkeypatch):
+    # save checkpoints in a temporary results folder
+    monkeypatch.chdir(tmp_path)
+    monitoring.configure_logging("quiet")
+    scenario = (4, True)
+    checkpointDirectory = checkpoints.get_checkpoint_directory(*scenario, 2, 5)
+
+    # run without checkpoints
+    uninterruptedResults = simulationModules.simulate_scenarios([scenario], 2, 5, "exact", seed=11)[scenario]
+
+    # run with checkpoints, delete some checkpoints and resume with the stored master seed
+    simulationModules.simulate_scenarios([scenario], 2, 5, "exact", seed=11, checkpoint=True)
+    for simulationIteration in [2, 5]:
+        os.remove(os.path.join(checkpointDirectory, checkpoints.chunkFilePattern.format(simulationIteration, simulationIteration)))
+    assert checkpoints.get_missing_iterations(checkpointDirectory, 5) == [2, 5]
+    resumedResults = simulationModules.simulate_scenarios([scenario], 2, 5, "exact", checkpoint=True)[scenario]
+
+    pd.testing.assert_frame_equal(resumedResults[0], uninterruptedResults[0])
+    pd.testing.assert_frame_equal(resumedResults[1], uninterruptedResults[1])
@@ -0,0 +1,22 @@
+import numpy as np
+import classes
+import simulationModules
+
+# columns of the team data frame of the league before team data was stored as arrays
+baselineTeamDataColumns = ['team', 'domestics', 'imports', 'budget', 'salaryCap', 'effectiveBudget', 'payroll', 'totalSkill', 'revenue',
+                           'hockeyRevenue', 'wins', 'games', 'rank', 'eliminatedRS', 'eliminatedPP', 'eliminatedPR1', 'eliminatedPR2',
+                           'eliminatedPR3', 'champion', 'wentBankrupt', 'monetaryFactor', 'marketSize', 'seasonPhaseFactor', 'compBalanceEffect']
+
+
+def test_team_data_columns_equal_baseline():
+    assert list(classes.League().get_team_data().columns) == baselineTeamDataColumns
+
+
+def test_season_team_result_columns_equal_baseline():
+    rng = np.random.default_rng(0)
+    league = classes.League(rng)
+
+    # season results leave out the per team constants as before
+    seasonTeamResults, _ = simulationModules.get_season_results(league, classes.DomesticPlayerPool(rng=rng), classes.ForeignPlayerPool(), 1, True)
+
+    assert list(seasonTeamResults.columns) == ['season', 'validSeason'] + baselineTeamDataColumns[:-4]
@@ -0,0 +1,168 @@
+import numpy as np
+import pandas as pd
+import pytest
+import classes
+import functions
+import parameters
+
+
+def rank_by_baseline_rule(teams, wins, headToHead, skills):
+    """
+    Description:
+    Function to rank teams by the recursive rule of the baseline: teams are ranked by wins, teams with the same number
+    of wins by their direct wins among each other, repeated for teams still equal, and teams with balanced direct wins
+    by placement games, which are won by the team with the higher skill here
+
+    Input:
+    teams (list): Positions of the teams to rank
+    wins (dict): Dictionary with each team as key and its number of wins as value
+    headToHead (np.ndarray): Matrix with the number of wins of the row team against the column team
+    skills (np.ndarray): Skill of every team
+
+    Returns:
+    order (list): Positions of the teams ordered from first to last rank
+    """
+    sortedTeams = sorted(teams, key=lambda team: -wins[team])
+    order = []
+    row = 0
+
+    # go through ranking from top down
+    while row < len(sortedTeams):
+        equalTeams = [team for team in sortedTeams if wins[team] == wins[sortedTeams[row]]]
+
+        # rank team without tie
+        if len(equalTeams) == 1:
+            order.append(sortedTeams[row])
+
+        # play placement games if all direct wins are equal, resolve ties by direct wins otherwise
+        else:
+            directWins = {team: sum(headToHead[team, opponent] for opponent in equalTeams) for team in equalTeams}
+            if len(set(directWins.values())) == 1:
+                order.extend(sorted(equalTeams, key=lambda team: -skills[team]))
+            else:
+                order.extend(rank_by_baseline_rule(equalTeams, directWins, headToHead, skills))
+
+        row += len(equalTeams)
+
+    return order
+
+
+@pytest.fixture(autouse=True)
+def placement_by_skill(monkeypatch):
+    # placement games are won by the team with the higher skill, so that rankings are deterministic
+    monkeypatch.setattr(functions, "placement_games", lambda skills, rng: np.argsort(-skills, kind="stable"))
+
+
+def get_random_head_to_head(rng, teams):
+    # play two games of every pairing of teams
+    headToHead = np.zeros((teams, teams), dtype=int)
+    for homeTeam in range(teams):
+        for awayTeam in range(homeTeam + 1, teams):
+            homeWins = rng.integers(0, 3)
+            headToHead[homeTeam, awayTeam], headToHead[awayTeam, homeTeam] = homeWins, 2 - homeWins
+    return headToHead
+
+
+def test_all_tied_teams_are_ranked_by_placement_games():
+    # every pairing is split, so all teams have the same wins and direct wins
+    headToHead = np.ones((14, 14), dtype=int) - np.eye(14, dtype=int)
+    skills = np.random.default_rng(0).permutation(np.linspace(5, 15, 14))
+
+    order = functions.rank_teams(headToHead.sum(axis=1), headToHead, skills, None)
+
+    assert list(order) == list(np.argsort(-skills))
+    assert list(order) == rank_by_baseline_rule(list(range(14)), dict(enumerate(headToHead.sum(axis=1))), headToHead, skills)
+
+
+def test_pairwise_ties_are_ranked_by_direct_wins():
+    # teams 2k and 2k+1 have the same wins, team 2k+1 won both direct games for even k and team 2k for odd k
+    teams = 14
+    headToHead = np.zeros((teams, teams), dtype=int)
+    for team in range(teams):
+        for opponent in range(teams):
+            if team // 2 < opponent // 2:
+                headToHead[team, opponent] = 2
+    for pair in range(teams // 2):
+        winner, loser = (2 * pair + 1, 2 * pair) if pair % 2 == 0 else (2 * pair, 2 * pair + 1)
+        headToHead[winner, loser] = 2
+    wins = headToHead.sum(axis=1)
+    wins[1::2] = wins[::2]
+
+    order = functions.rank_teams(wins, headToHead, np.linspace(5, 15, teams), None)
+
+    assert list(order) == [1, 0, 2, 3, 5, 4, 6, 7, 9, 8, 10, 11, 13, 12]
+    assert list(order) == rank_by_baseline_rule(list(range(teams)), dict(enumerate(wins)), headToHead, np.linspace(5, 15, teams))
+
+
+@pytest.mark.parametrize("seed", range(50))
+def test_ranking_follows_baseline_rule_order(seed):
+    rng = np.random.default_rng(seed)
+    headToHead = get_random_head_to_head(rng, 14)
+    skills = rng.permutation(np.linspace(5, 15, 14))
+
+    order = functions.rank_teams(headToHead.sum(axis=1), headToHead, skills, None)
+
+    assert list(order) == rank_by_baseline_rule(list(range(14)), dict(enumerate(headToHead.sum(axis=1))), headToHead, skills)
+
+
+def test_solve_ranking_conflicts_assigns_ranks_in_resolved_order():
+    league = classes.League(np.random.default_rng(0))
+    league.totalSkill[:] = np.linspace(5, 15, 14)
+    headToHead = np.ones((14, 14), dtype=int) - np.eye(14, dtype=int)
+    ranking = pd.DataFrame({'rank': 0, 'team': league.get_teams(), 'wins': headToHead.sum(axis=1)})
+
+    resolvedRanking = functions.solve_ranking_conflicts(ranking, headToHead, league)
+
+    assert resolvedRanking['team'].tolist() == league.get_teams()[::-1]
+    assert resolvedRanking['rank'].tolist() == list(range(1, 15))
+
+
+def play_series_by_games(league, higherRankedTeam, lowerRankedTeam, requiredWins, seasonPhase):
+    # play games alternating home advantage until one team has the required wins, as the baseline playoff rounds do
+    skills = {higherRankedTeam: 12.0, lowerRankedTeam: 8.0}
+    homeTeams = [higherRankedTeam, lowerRankedTeam]
+    wins = {higherRankedTeam: 0, lowerRankedTeam: 0}
+    revenueBefore = league.revenue.copy()
+    game = 0
+    while max(wins.values()) < requiredWins:
+        homeTeam, awayTeam = homeTeams[game % 2], homeTeams[(game + 1) % 2]
+        wins[functions.simulate_game(homeTeam, skills[homeTeam], awayTeam, skills[awayTeam], league, seasonPhase)] += 1
+        game += 1
+
+    # count home games from the earned revenues
+    homeGames = [(league.revenue[league.teamIndex[team]] - revenueBefore[league.teamIndex[team]])
+                 / functions.calculate_game_revenues(league.teamIndex[team], skills[team] / 20, seasonPhase) for team in homeTeams]
+
+    return wins[higherRankedTeam] == requiredWins, game, *np.rint(homeGames).astype(int)
+
+
+def get_outcome_frequencies(outcomes):
+    # count relative frequency of every combination of series winner, series length and home games
+    values, counts = np.unique(np.array(outcomes, dtype=int), axis=0, return_counts=True)
+    return {tuple(value): count / len(outcomes) for value, count in zip(values, counts)}
+
+
+@pytest.mark.parametrize("bestOf, seasonPhase", [(3, parameters.prePlayoff), (7, parameters.playoffs)])
+def test_sampled_series_match_series_of_simulated_games(bestOf, seasonPhase):
+    series = 20000
+    requiredWins = bestOf // 2 + 1
+    league = classes.League(np.random.default_rng(1))
+    higherRankedTeam, lowerRankedTeam = league.get_teams()[:2]
+
+    # play series game by game
+    playedOutcomes = [play_series_by_games(league, higherRankedTeam, lowerRankedTeam, requiredWins, seasonPhase) for _ in range(series)]
+
+    # sample series from their distribution and count home games from the series revenues
+    winPercentageHigher = np.full((1, series), 0.6)
+    higherRankedVictory, seriesLength = functions.sample_series(winPercentageHigher, requiredWins, [np.random.default_rng(2)])
+    higherRankedRevenue, lowerRankedRevenue = functions.calculate_series_revenues(0, 1, winPercentageHigher, seriesLength, seasonPhase)
+    higherRankedHomeGames = higherRankedRevenue / functions.calculate_game_revenues(0, 0.6, seasonPhase)
+    lowerRankedHomeGames = lowerRankedRevenue / functions.calculate_game_revenues(1, 0.4, seasonPhase)
+    sampledOutcomes = np.stack([higherRankedVictory, seriesLength, np.rint(higherRankedHomeGames), np.rint(lowerRankedHomeGames)], axis=-1)[0]
+
+    playedFrequencies = get_outcome_frequencies(playedOutcomes)
+    sampledFrequencies = get_outcome_frequencies(sampledOutcomes)
+
+    assert set(sampledFrequencies) <= set(playedFrequencies)
+    for outcome in playedFrequencies:
+        assert sampledFrequencies.get(outcome, 0) == pytest.approx(playedFrequencies[outcome], abs=0.02)
@@ -0,0 +1,35 @@
+import io
+import pandas as pd
+import pytest
+import monitoring
+import simulationModules
+
+
+@pytest.fixture(scope="module")
+def serialResults():
+    monitoring.configure_logging("quiet")
+    return simulationModules.simulate_iterations(list(range(1, 5)), 4, True, 2, 4, "exact", 1, 7)
+
+
+def test_batched_results_equal_serial_results(serialResults):
+    batchedResults = simulationModules.simulate_iterations(list(range(1, 5)), 4, True, 2, 4, "exact", 3, 7)
+
+    pd.testing.assert_frame_equal(batchedResults[0], serialResults[0])
+    pd.testing.assert_frame_equal(batchedResults[1], serialResults[1])
+
+
+def test_parallel_results_equal_serial_results(serialResults):
+    parallelResults = simulationModules.simulate_parallel([(4, True)], 2, 4, "exact", 1, 2, 2, 7)[(4, True)]
+
+    pd.testing.assert_frame_equal(parallelResults[0], serialResults[0])
+    pd.testing.assert_frame_equal(parallelResults[1], serialResults[1])
+
+
+def test_streamed_parallel_results_equal_serial_results(serialResults, tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+
+    # stream results of chunks to the result files while simulating
+    assert simulationModules.simulation(4, True, 2, 4, "exact", 1, 2, 1, 7, streamResults=True) == (None, None, 4)
+
+    for fileName, results in zip(simulationModules.get_result_file_names(4, True, 2, 4), serialResults):
+        pd.testing.assert_frame_equal(pd.read_csv(fileName), pd.read_csv(io.StringIO(results.to_csv(index=False))))
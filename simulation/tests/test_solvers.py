@@ -0,0 +1,82 @@
+import numpy as np
+import pytest
+import classes
+import functions
+import solvers
+
+
+def get_small_pool(rng, poolSize):
+    """
+    Description:
+    Function to create a domestic player pool reduced to a random sample of its players, small enough for CBC to prove
+    optimality at once
+
+    Input:
+    rng (np.random.Generator): random number generator of the pool and the sample
+    poolSize (int): the number of players in the pool
+
+    Returns:
+    playerPool (DomesticPlayerPool): the reduced player pool
+    """
+    # create full pool and keep a random sample of its players
+    playerPool = classes.DomesticPlayerPool(rng=rng)
+    sample = np.sort(rng.choice(len(playerPool.allPlayersData), size=poolSize, replace=False))
+    playerPool.allPlayersData = playerPool.allPlayersData.iloc[sample].reset_index(drop=True)
+    playerPool.availablePlayersData = playerPool.allPlayersData.copy()
+
+    # derive skill classes of the sample
+    playerPool.skillClasses = functions.get_skill_classes(playerPool.allPlayersData)
+    playerPool.fingerprint = solvers.get_fingerprint(playerPool.skillClasses['skill'], playerPool.skillClasses['salary'], playerPool.skillClasses['count'])
+    playerPool.knapsackTables = {}
+
+    return playerPool
+
+
+@pytest.fixture(autouse=True)
+def empty_caches():
+    # solve every problem anew
+    solvers.resultCache.clear()
+    solvers.tableCache.clear()
+
+
+@pytest.mark.parametrize("seed", range(10))
+def test_exact_matches_cbc_on_domestic_pools(seed):
+    rng = np.random.default_rng(seed)
+    playerPool = get_small_pool(rng, int(rng.integers(5, 30)))
+    totalSalary = playerPool.allPlayersData['salary'].sum()
+
+    # compare both solvers for budgets from none to all players affordable and selection sizes beyond the pool size
+    for selectionSize in [1, 3, 8, len(playerPool.allPlayersData) + 5]:
+        for teamBudget in [0, *np.round(rng.uniform(0, totalSalary, size=4)), totalSalary]:
+            exact = functions.skill_maximization(playerPool, teamBudget, selectionSize, "exact")
+            cbc = functions.skill_maximization(playerPool, teamBudget, selectionSize, "cbc")
+
+            assert exact.attrs['solverStatus'] == cbc.attrs['solverStatus'] == solvers.optimalStatus
+            assert exact['skill'].sum() == pytest.approx(cbc['skill'].sum(), abs=1e-6)
+            assert len(exact) <= selectionSize and exact['salary'].sum() <= teamBudget
+
+
+@pytest.mark.parametrize("allowedImports", [1, 2])
+def test_exact_matches_cbc_on_foreign_pools(allowedImports):
+    playerPool = classes.ForeignPlayerPool(allowedImports=allowedImports)
+    totalSalary = playerPool.allPlayersData['salary'].sum()
+
+    # compare both solvers for selection sizes up to beyond the number of players of a skill class
+    for selectionSize in [1, allowedImports, allowedImports + 2]:
+        for teamBudget in np.linspace(0, totalSalary, 6).round():
+            exact = functions.skill_maximization(playerPool, teamBudget, selectionSize, "exact")
+            cbc = functions.skill_maximization(playerPool, teamBudget, selectionSize, "cbc")
+
+            assert exact.attrs['solverStatus'] == cbc.attrs['solverStatus'] == solvers.optimalStatus
+            assert exact['skill'].sum() == pytest.approx(cbc['skill'].sum(), abs=1e-6)
+
+
+@pytest.mark.parametrize("solver", ["exact", "cbc"])
+def test_negative_budget_is_not_solved(solver):
+    playerPool = get_small_pool(np.random.default_rng(0), 10)
+
+    # not even the empty selection is affordable
+    selectedCounts, status, objective = solvers.get_backend(solver).solve(playerPool, -1, 5)
+
+    assert status == solvers.notSolvedStatus
+    assert selectedCounts.sum() == 0
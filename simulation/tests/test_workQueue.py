@@ -0,0 +1,63 @@
+import logging
+import multiprocessing
+import os
+import re
+import time
+import pandas as pd
+import monitoring
+import simulationModules
+import workQueue
+
+
+def run_logged_worker(spoolDirectory, logFile):
+    # report claimed, completed and reclaimed tasks of the worker to its own file
+    monitoring.configure_logging("info")
+    monitoring.logger.addHandler(logging.FileHandler(logFile))
+    workQueue.run_worker(spoolDirectory, heartbeatInterval=0.2, heartbeatTimeout=5, pollInterval=0.2)
+
+
+def read_results(directory, simulationNumber):
+    # read result files of the scenario saved in the directory
+    teamFileName, playerFileName = simulationModules.get_result_file_names(4, True, 1, simulationNumber)
+    return pd.read_csv(os.path.join(directory, teamFileName)), pd.read_csv(os.path.join(directory, playerFileName))
+
+
+def test_workers_sharing_spool_directory_complete_every_task_once(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    monitoring.configure_logging("quiet")
+    spoolDirectory = str(tmp_path / "spool")
+    workQueue.create_tasks(spoolDirectory, [(4, True)], 1, 5, "exact", taskSize=1, seed=5)
+
+    # leave a claim of a dead worker without heartbeat
+    staleFile = workQueue.claim_task(spoolDirectory, "deadWorker")
+    os.utime(staleFile, (time.time() - 60, time.time() - 60))
+
+    # run several workers on the spool directory
+    context = multiprocessing.get_context("fork")
+    logFiles = [str(tmp_path / "worker{}.log".format(worker)) for worker in range(3)]
+    workers = [context.Process(target=run_logged_worker, args=(spoolDirectory, logFile)) for logFile in logFiles]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join(timeout=300)
+        assert worker.exitcode == 0
+
+    # every task is completed exactly once and the stale claim is reclaimed once
+    log = "".join(open(logFile).read() for logFile in logFiles)
+    completedTasks = re.findall(r"completed task (\S+)", log)
+    assert sorted(completedTasks) == sorted(set(completedTasks)) and len(completedTasks) == 5
+    assert re.findall(r"reclaimed task (\S+)", log) == [workQueue.get_task_name(staleFile)]
+    assert not os.listdir(os.path.join(spoolDirectory, workQueue.pendingDirectory))
+    assert not os.listdir(os.path.join(spoolDirectory, workQueue.runningDirectory))
+
+    # merged results equal results of a serial run
+    workQueue.merge_tasks(spoolDirectory)
+    mergedResults = read_results(tmp_path, 5)
+    serialDirectory = tmp_path / "serial"
+    serialDirectory.mkdir()
+    monkeypatch.chdir(serialDirectory)
+    simulationModules.save_results(*simulationModules.simulate_iterations(list(range(1, 6)), 4, True, 1, 5, "exact", 1, 5), 4, True, 1, 5)
+    serialResults = read_results(serialDirectory, 5)
+
+    pd.testing.assert_frame_equal(mergedResults[0], serialResults[0])
+    pd.testing.assert_frame_equal(mergedResults[1], serialResults[1])
@@ -0,0 +1,404 @@
+import numpy as np
+import glob
+import os
+import pickle
+import socket
+import threading
+import time
+import checkpoints
+import monitoring
+import simulationModules
+
+
+# define subdirectories of the spool directory
+pendingDirectory = "pending"  # tasks waiting to be claimed
+runningDirectory = "running"  # tasks claimed by a worker, named by task and worker, the modification time of a task file is the heartbeat of its worker
+doneDirectory = "done"  # results of completed tasks, one checkpoint directory per scenario
+manifestFileName = "manifest.pkl"  # parameters of the run and scenarios of all tasks
+ownerSeparator = "@"  # separates the task name from the id of the owning worker in the file name of a running task
+
+
+def create_tasks(spoolDirectory, scenarios, seasons, simulationNumber, solver="exact", batchSize=1, taskSize=50, seed=None):
+    """
+    Description:
+    Function to split the simulations of all scenarios into tasks of consecutive simulation iterations and to write
+    them to the spool directory, from which workers on any machine sharing the file system claim them
+
+    Input:
+    spoolDirectory (str): path of the spool directory
+    scenarios (list): list of scenarios, each a tuple of the number of allowed imports and the salary cap indicator
+    seasons (int): the number of consecutive seasons to simulate
+    simulationNumber (int): the number of times the simulation shall be repeated per scenario
+    solver (str): the solver used by teams for skill maximization, 'cbc' or 'exact', default is 'exact' as in
+    simulation.py and sweep.py
+    batchSize (int): the number of simulations whose seasons are played together on arrays, default is 1
+    taskSize (int): the number of simulation iterations per task, default is 50
+    seed (int): the master seed shared by all scenarios, default is None in which case fresh entropy is drawn and
+    printed so that the run can be reproduced
+    """
+    # a spool directory holds one run only
+    if os.path.exists(os.path.join(spoolDirectory, manifestFileName)):
+        raise ValueError("Spool directory {} already contains a run, merge and remove it first".format(spoolDirectory))
+
+    # create master seed shared by all scenarios
+    masterSeed = np.random.SeedSequence(seed).entropy
+    monitoring.progressLogger.info("Master seed: %s", masterSeed)
+
+    # create subdirectories
+    for directory in [pendingDirectory, runningDirectory, doneDirectory]:
+        os.makedirs(os.path.join(spoolDirectory, directory), exist_ok=True)
+
+    # for each scenario and range of simulation iterations
+    for allowedImports, salaryCap in scenarios:
+        for firstIteration in range(1, simulationNumber + 1, taskSize):
+            simulationIterations = list(range(firstIteration, min(firstIteration + taskSize, simulationNumber + 1)))
+
+            # write task
+            taskName = "imports={}_cap={}_seasons={}_simNumb={}_simulations_{:06d}-{:06d}.pkl".format(allowedImports, salaryCap, seasons, simulationNumber,
+                                                                                                    simulationIterations[0], simulationIterations[-1])
+            checkpoints.write_atomically(os.path.join(spoolDirectory, pendingDirectory, taskName),
+                                         {'allowedImports': allowedImports, 'salaryCap': salaryCap, 'seasons': seasons, 'simulationNumber': simulationNumber,
+                                          'simulationIterations': simulationIterations, 'solver': solver, 'batchSize': batchSize, 'masterSeed': masterSeed,
+                                          'reclaims': []})
+
+    # write manifest last, workers only start once the run is complete
+    checkpoints.write_atomically(os.path.join(spoolDirectory, manifestFileName),
+                                 {'scenarios': list(scenarios), 'seasons': seasons, 'simulationNumber': simulationNumber, 'masterSeed': masterSeed})
+
+
+def reclaim_tasks(spoolDirectory, heartbeatTimeout=300, workerId=None):
+    """
+    Description:
+    Function to return tasks of workers without heartbeat to the pending tasks, e.g. of workers which died or whose
+    machine went down. Every reclaim is logged in the task file. Tasks whose results were saved in the meantime are
+    removed instead of being simulated again. A stale task is first taken over by renaming it to a running task of
+    the reclaiming worker, so that only one of several processes reclaiming the same task succeeds. The worker which
+    lost the task does not own it anymore, so it neither saves its results nor removes the task
+
+    Input:
+    spoolDirectory (str): path of the spool directory
+    heartbeatTimeout (float): seconds without heartbeat after which a worker is considered dead, default is 300
+    workerId (str): id of the reclaiming worker, default is None in which case the id of this process is used
+
+    Returns:
+    reclaimedTasks (list): names of the reclaimed tasks
+    """
+    reclaimedTasks = []
+
+    # for each running task
+    for taskFile in glob.glob(os.path.join(spoolDirectory, runningDirectory, "*.pkl")):
+        try:
+            # skip tasks whose worker is alive
+            heartbeat = os.path.getmtime(taskFile)
+            if time.time() - heartbeat <= heartbeatTimeout:
+                continue
+
+            # take over task in one atomic rename, fails if another process took it over first
+            taskName, owner = get_task_name(taskFile), get_task_owner(taskFile)
+            ownFile = get_running_file(spoolDirectory, taskName, workerId)
+            os.rename(taskFile, ownFile)
+            os.utime(ownFile)
+
+            # load task
+            with open(ownFile, 'rb') as file:
+                task = pickle.load(file)
+
+            # if results of task were saved in the meantime, remove task instead of simulating it again
+            if is_task_done(spoolDirectory, task):
+                os.remove(ownFile)
+                continue
+
+            # log reclaim in task file and return task to pending tasks
+            task['reclaims'] = task.get('reclaims', []) + [{'time': time.time(), 'lastHeartbeat': heartbeat, 'owner': owner, 'worker': workerId or get_worker_id()}]
+            checkpoints.write_atomically(ownFile, task)
+            os.rename(ownFile, os.path.join(spoolDirectory, pendingDirectory, taskName))
+            reclaimedTasks.append(taskName)
+
+        # task was completed or taken over by another process in the meantime
+        except FileNotFoundError:
+            pass
+
+    return reclaimedTasks
+
+
+def get_worker_id():
+    """
+    Description:
+    Function to get the id of the worker running in this process
+
+    Returns:
+    workerId (str): host name and process id of the worker
+    """
+    return "{}-{}".format(socket.gethostname(), os.getpid())
+
+
+def get_task_name(taskFile):
+    """
+    Description:
+    Function to get the name of a task as pending task from the path of a pending or running task
+
+    Input:
+    taskFile (str): path of the task
+
+    Returns:
+    taskName (str): file name of the task without its owner
+    """
+    return os.path.splitext(os.path.basename(taskFile))[0].split(ownerSeparator)[0] + ".pkl"
+
+
+def get_task_owner(taskFile):
+    """
+    Description:
+    Function to get the worker owning a running task from its path
+
+    Input:
+    taskFile (str): path of the running task
+
+    Returns:
+    owner (str): id of the owning worker, None if the task is not owned
+    """
+    taskName, separator, owner = os.path.splitext(os.path.basename(taskFile))[0].partition(ownerSeparator)
+    return owner if separator else None
+
+
+def get_running_file(spoolDirectory, taskName, workerId=None):
+    """
+    Description:
+    Function to get the path of a task while it is owned by a worker
+
+    Input:
+    spoolDirectory (str): path of the spool directory
+    taskName (str): file name of the task without its owner
+    workerId (str): id of the owning worker, default is None in which case the id of this process is used
+
+    Returns:
+    taskFile (str): path of the running task
+    """
+    return os.path.join(spoolDirectory, runningDirectory, "{}{}{}.pkl".format(os.path.splitext(taskName)[0], ownerSeparator, workerId or get_worker_id()))
+
+
+def claim_task(spoolDirectory, workerId=None):
+    """
+    Description:
+    Function to claim the first pending task by moving it to the running tasks in one atomic rename, the running task
+    is named by the task and the claiming worker, so that a worker only touches a task as long as it owns it
+
+    Input:
+    spoolDirectory (str): path of the spool directory
+    workerId (str): id of the claiming worker, default is None in which case the id of this process is used
+
+    Returns:
+    taskFile (str): path of the claimed task in the running tasks, None if no task could be claimed
+    """
+    # for each pending task in order
+    for pendingFile in sorted(glob.glob(os.path.join(spoolDirectory, pendingDirectory, "*.pkl"))):
+        taskFile = get_running_file(spoolDirectory, get_task_name(pendingFile), workerId)
+        try:
+            # start heartbeat before claim, so that the claimed task is not taken for a task of a dead worker
+            os.utime(pendingFile)
+
+            # claim task, fails if another worker claimed it first
+            os.rename(pendingFile, taskFile)
+            return taskFile
+        except FileNotFoundError:
+            pass
+
+    return None
+
+
+def send_heartbeats(taskFile, heartbeatInterval, stopEvent):
+    """
+    Description:
+    Function to update the modification time of a running task regularly until the task is completed
+
+    Input:
+    taskFile (str): path of the running task
+    heartbeatInterval (float): seconds between two heartbeats
+    stopEvent (threading.Event): event which is set once the task is completed
+    """
+    while not stopEvent.wait(heartbeatInterval):
+        try:
+            os.utime(taskFile)
+
+        # task was reclaimed, the worker does not own it anymore
+        except FileNotFoundError:
+            return
+
+
+def run_task(spoolDirectory, taskFile, heartbeatInterval=30):
+    """
+    Description:
+    Function to simulate a claimed task while sending heartbeats and to save its results as checkpoint of its
+    scenario. Results are only saved if the worker still owns the task, a task reclaimed in the meantime is completed
+    by the worker which claimed it again
+
+    Input:
+    spoolDirectory (str): path of the spool directory
+    taskFile (str): path of the claimed task in the running tasks
+    heartbeatInterval (float): seconds between two heartbeats, default is 30
+
+    Returns:
+    completed (bool): True if the task was simulated and its results were saved, False otherwise
+    """
+    # load task
+    with open(taskFile, 'rb') as file:
+        task = pickle.load(file)
+
+    # if results of task were saved by a worker whose task was reclaimed, do not simulate task again
+    if is_task_done(spoolDirectory, task):
+        monitoring.logger.info("Task %s is already completed", get_task_name(taskFile))
+        remove_task(taskFile)
+        return False
+
+    # start heartbeats
+    stopEvent = threading.Event()
+    heartbeat = threading.Thread(target=send_heartbeats, args=(taskFile, heartbeatInterval, stopEvent), daemon=True)
+    heartbeat.start()
+
+    # simulate task
+    try:
+        teamResults, playerResults = simulationModules.simulate_iterations(task['simulationIterations'], task['allowedImports'], task['salaryCap'], task['seasons'],
+                                                                           task['simulationNumber'], task['solver'], task['batchSize'], task['masterSeed'])
+    finally:
+        stopEvent.set()
+        heartbeat.join()
+
+    # discard results if the task was reclaimed in the meantime, it is owned by another worker or pending again
+    if not os.path.exists(taskFile):
+        monitoring.logger.warning("Task %s was reclaimed while simulating, its results are discarded", get_task_name(taskFile))
+        return False
+
+    # save results
+    checkpointDirectory = get_done_directory(spoolDirectory, task['allowedImports'], task['salaryCap'], task['seasons'], task['simulationNumber'])
+    os.makedirs(checkpointDirectory, exist_ok=True)
+    checkpoints.save_checkpoint(checkpointDirectory, task['simulationIterations'], teamResults, playerResults)
+
+    # remove task from running tasks
+    remove_task(taskFile)
+    return True
+
+
+def remove_task(taskFile):
+    """
+    Description:
+    Function to remove a completed task from the running tasks, the path of a running task contains its owner so
+    that a worker never removes a task claimed again by another worker
+
+    Input:
+    taskFile (str): path of the running task owned by this worker
+    """
+    try:
+        os.remove(taskFile)
+
+    # task was reclaimed in the meantime, it is removed by its new owner
+    except FileNotFoundError:
+        pass
+
+
+def get_done_directory(spoolDirectory, allowedImports, salaryCap, seasons, simulationNumber):
+    """
+    Description:
+    Function to get the directory in which the results of the completed tasks of a scenario are stored
+
+    Input:
+    spoolDirectory (str): path of the spool directory
+    allowedImports (int): the number of allowed import players per team
+    salaryCap (bool): boolean parameter indicating presence of salary cap
+    seasons (int): the number of consecutive seasons to simulate
+    simulationNumber (int): the number of times the simulation shall be repeated
+
+    Returns:
+    doneDirectory (str): path of the directory of the completed tasks of the scenario
+    """
+    return os.path.join(spoolDirectory, doneDirectory, "imports={}_cap={}_seasons={}_simNumb={}".format(allowedImports, salaryCap, seasons, simulationNumber))
+
+
+def is_task_done(spoolDirectory, task):
+    """
+    Description:
+    Function to check if the results of a task are already saved as checkpoint, e.g. by a worker whose task was
+    reclaimed since its heartbeats were late
+
+    Input:
+    spoolDirectory (str): path of the spool directory
+    task (dict): the task as written by create_tasks
+
+    Returns:
+    done (bool): True if the results of the task are saved, False otherwise
+    """
+    checkpointDirectory = get_done_directory(spoolDirectory, task['allowedImports'], task['salaryCap'], task['seasons'], task['simulationNumber'])
+    return os.path.exists(os.path.join(checkpointDirectory, checkpoints.chunkFilePattern.format(task['simulationIterations'][0], task['simulationIterations'][-1])))
+
+
+def run_worker(spoolDirectory, heartbeatInterval=30, heartbeatTimeout=300, pollInterval=10):
+    """
+    Description:
+    Function to run a worker which claims and simulates tasks until no task is pending or running. While tasks of
+    other workers are running, the worker waits and reclaims them if their worker stops sending heartbeats
+
+    Input:
+    spoolDirectory (str): path of the spool directory
+    heartbeatInterval (float): seconds between two heartbeats, default is 30
+    heartbeatTimeout (float): seconds without heartbeat after which a worker is considered dead, default is 300
+    pollInterval (float): seconds to wait before looking for tasks again while other workers are running, default is 10
+    """
+    # wait until coordinator created all tasks
+    while not os.path.exists(os.path.join(spoolDirectory, manifestFileName)):
+        time.sleep(pollInterval)
+
+    workerId = get_worker_id()
+    completedTasks = 0
+
+    # start progress reports, the number of simulations of the worker is unknown
+    monitoring.progress.start(worker=workerId)
+
+    while True:
+        # return tasks of dead workers to pending tasks
+        for taskName in reclaim_tasks(spoolDirectory, heartbeatTimeout, workerId):
+            monitoring.logger.warning("Worker %s reclaimed task %s", workerId, taskName)
+
+        # claim and simulate task
+        taskFile = claim_task(spoolDirectory, workerId)
+        if taskFile is not None:
+            monitoring.logger.info("Worker %s claimed task %s", workerId, get_task_name(taskFile))
+            if run_task(spoolDirectory, taskFile, heartbeatInterval):
+                monitoring.logger.info("Worker %s completed task %s", workerId, get_task_name(taskFile))
+                completedTasks += 1
+            continue
+
+        # stop if no task is running anymore
+        if not glob.glob(os.path.join(spoolDirectory, runningDirectory, "*.pkl")):
+            monitoring.logger.info("Worker %s completed %s tasks, no tasks left", workerId, completedTasks)
+            monitoring.progress.finish()
+            return
+
+        # wait for running tasks of other workers
+        time.sleep(pollInterval)
+
+
+def merge_tasks(spoolDirectory, resultFormat="csv"):
+    """
+    Description:
+    Function to merge the results of all completed tasks into the standard result files of every scenario
+
+    Input:
+    spoolDirectory (str): path of the spool directory
+    resultFormat (str): the format of the results, 'csv', 'parquet' or 'feather', default is 'csv'
+    """
+    # load manifest of run
+    with open(os.path.join(spoolDirectory, manifestFileName), 'rb') as file:
+        manifest = pickle.load(file)
+    seasons, simulationNumber = manifest['seasons'], manifest['simulationNumber']
+
+    # for each scenario
+    for allowedImports, salaryCap in manifest['scenarios']:
+        # all simulation iterations must be completed
+        checkpointDirectory = get_done_directory(spoolDirectory, allowedImports, salaryCap, seasons, simulationNumber)
+        missingIterations = checkpoints.get_missing_iterations(checkpointDirectory, simulationNumber)
+        if missingIterations:
+            raise ValueError("Scenario imports={} cap={} misses {} simulations, run workers until all tasks are done".format(allowedImports, salaryCap, len(missingIterations)))
+
+        # save merged results
+        combinedSimulationTeamResults, combinedSimulationPlayerResults = checkpoints.merge_checkpoints(checkpointDirectory)
+        simulationModules.save_results(combinedSimulationTeamResults, combinedSimulationPlayerResults, allowedImports, salaryCap, seasons, simulationNumber, resultFormat)
+        monitoring.logger.info("Results of scenario imports=%s cap=%s are saved", allowedImports, salaryCap)